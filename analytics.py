@@ -0,0 +1,254 @@
+"""
+Module for analysing aspect usage in the scraped dataset.
+
+Records of all verbs are loaded into one pandas DataFrame; grammar and syntax
+descriptions are expanded into indicator columns so that every statistic is a
+vectorized group-by or cross-tabulation instead of a loop over records.
+The loaded frame and computed tables are cached on disk and invalidated when
+any data file changes, or when the cache was written by another pandas version
+or cache format.
+"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from records import ASPECTS, iter_records
+
+CACHE_NAME = '.analytics_cache.pkl'
+CACHE_FORMAT = 2
+
+# Grammar categories and their values as written in the 'грамматика' field.
+FEATURES: Dict[str, Tuple[str, ...]] = {
+    'tense': ('прошедшее', 'настоящее', 'будущее', 'непрошедшее'),
+    'mood': ('изъявительное', 'повелительное', 'сослагательное'),
+    'person': ('1-е лицо', '2-е лицо', '3-е лицо'),
+    'form': ('инфинитив', 'причастие', 'деепричастие'),
+    'number': ('единственное', 'множественное'),
+    'voice': ('действительный', 'страдательный', 'медиальный'),
+    'transitivity': ('переходный', 'непереходный'),
+}
+NO_VALUE = '—'
+
+Signature = List[Tuple[str, int, int]]
+
+
+def data_signature(output_dir: str) -> Signature:
+    """
+    Describes the state of the data files for cache invalidation.
+
+    Args:
+        output_dir (str): The output directory.
+
+    Returns:
+        Signature: Name, modification time and size of every JSON file.
+    """
+    signature = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                stat = entry.stat()
+                signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return sorted(signature)
+
+
+def load_frame(output_dir: str) -> pd.DataFrame:
+    """
+    Loads all records into a DataFrame with one row per record.
+
+    Args:
+        output_dir (str): The output directory.
+
+    Returns:
+        pd.DataFrame: Columns 'verb', 'aspect', 'wordform', 'lemma', 'grammar'
+        and 'syntax', plus one boolean column per grammar tag ('g:<tag>') and
+        per syntax feature ('s:<feature>').
+    """
+    columns: Dict[str, List[Any]] = {name: [] for name in
+                                     ('verb', 'aspect', 'wordform', 'lemma', 'grammar', 'syntax')}
+    for word, aspect, record in iter_records(output_dir):
+        columns['verb'].append(word)
+        columns['aspect'].append(aspect)
+        columns['wordform'].append(record.get('словоформа'))
+        columns['lemma'].append(record.get('лемма'))
+        columns['grammar'].append(record.get('грамматика') or '')
+        columns['syntax'].append(record.get('синтаксические признаки') or '')
+
+    frame = pd.DataFrame(columns)
+    frame['verb'] = frame['verb'].astype('category')
+    frame['aspect'] = pd.Categorical(frame['aspect'], categories=list(ASPECTS))
+
+    grammar = frame['grammar'].str.get_dummies(sep=', ').astype(bool).add_prefix('g:')
+    syntax = (frame['syntax'].str.replace(r'\s*,\s*', ',', regex=True).str.strip()
+              .str.get_dummies(sep=',').astype(bool).add_prefix('s:'))
+    return pd.concat([frame, grammar, syntax], axis=1)
+
+
+class AspectAnalytics:
+    """
+    Aspect usage statistics over the output directory of start.main().
+    """
+
+    def __init__(self, output_dir: Path, cache_path: Optional[Path] = None):
+        """
+        Initializes the AspectAnalytics; data is loaded on first use.
+
+        Args:
+            output_dir (Path): The directory with the scraped JSON files.
+            cache_path (Optional[Path]): Cache file, '<output_dir>/.analytics_cache.pkl'
+                by default.
+        """
+        self.output_dir = Path(output_dir)
+        self.cache_path = cache_path or self.output_dir / CACHE_NAME
+        self._signature: Optional[Signature] = None
+        self._frame: Optional[pd.DataFrame] = None
+        self._results: Dict[str, pd.DataFrame] = {}
+        self._autosave = True
+        self._unsaved = False
+
+    def _load(self):
+        signature = data_signature(str(self.output_dir))
+        if self._frame is not None and signature == self._signature:
+            return
+        self._signature, self._frame, self._results = signature, None, {}
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'rb') as file:
+                    cached = pickle.load(file)
+                if cached['version'] == self._version() and cached['signature'] == signature:
+                    self._frame, self._results = cached['frame'], cached['results']
+            # pickles of other pandas versions fail with arbitrary errors; recompute then
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"Ignoring analytics cache: {e}")
+        if self._frame is None:
+            self._frame = load_frame(str(self.output_dir))
+            self._changed()
+
+    @staticmethod
+    def _version() -> Tuple[int, str]:
+        return CACHE_FORMAT, pd.__version__
+
+    def _save(self):
+        with open(self.cache_path, 'wb') as file:
+            pickle.dump({'version': self._version(), 'signature': self._signature,
+                         'frame': self._frame,
+                         'results': self._results}, file)
+        self._unsaved = False
+
+    def _changed(self):
+        self._unsaved = True
+        if self._autosave:
+            self._save()
+
+    def _cached(self, key: str, compute) -> pd.DataFrame:
+        self._load()
+        if key not in self._results:
+            self._results[key] = compute(self._frame)
+            self._changed()
+        return self._results[key]
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The loaded records, see load_frame.
+        """
+        self._load()
+        assert self._frame is not None
+        return self._frame
+
+    def aspect_ratios(self) -> pd.DataFrame:
+        """
+        Counts perfective and imperfective records per verb.
+
+        Returns:
+            pd.DataFrame: Indexed by verb with columns 'perfective', 'imperfective',
+            'total' and 'perfective_share'.
+        """
+        def compute(frame: pd.DataFrame) -> pd.DataFrame:
+            counts = pd.crosstab(frame['verb'], frame['aspect'], dropna=False)
+            counts = counts.reindex(columns=list(ASPECTS), fill_value=0)
+            counts.columns = list(ASPECTS)
+            counts['total'] = counts['perfective'] + counts['imperfective']
+            counts['perfective_share'] = np.divide(
+                counts['perfective'], counts['total'],
+                out=np.full(len(counts), np.nan), where=counts['total'].to_numpy() > 0)
+            return counts
+        return self._cached('aspect_ratios', compute)
+
+    def feature_values(self, feature: str) -> pd.Series:
+        """
+        Determines the value of a grammar category for every record.
+
+        Args:
+            feature (str): A key of FEATURES, e.g. 'tense'.
+
+        Returns:
+            pd.Series: The category value per record, NO_VALUE where it is absent.
+        """
+        frame = self.frame
+        columns = [f'g:{value}' for value in FEATURES[feature]]
+        present = frame.reindex(columns=columns, fill_value=False).to_numpy(dtype=bool)
+        values = np.array(FEATURES[feature] + (NO_VALUE,), dtype=object)
+        index = np.where(present.any(axis=1), present.argmax(axis=1), len(columns))
+        return pd.Series(values[index], index=frame.index, name=feature)
+
+    def feature_distribution(self, feature: str, by_verb: bool = False) -> pd.DataFrame:
+        """
+        Computes the distribution of a grammar category within each aspect.
+
+        Args:
+            feature (str): A key of FEATURES, e.g. 'tense', 'mood' or 'person'.
+            by_verb (bool): Compute the distribution per verb and aspect.
+
+        Returns:
+            pd.DataFrame: Shares of the category values, rows summing to 1.
+        """
+        def compute(frame: pd.DataFrame) -> pd.DataFrame:
+            rows = [frame['verb'], frame['aspect']] if by_verb else frame['aspect']
+            return pd.crosstab(rows, self.feature_values(feature), normalize='index')
+        return self._cached(f'{feature}:{by_verb}', compute)
+
+    def syntax_crosstab(self, normalize: bool = True) -> pd.DataFrame:
+        """
+        Cross-tabulates aspect against syntax features.
+
+        Args:
+            normalize (bool): Divide counts by the number of records of each aspect.
+
+        Returns:
+            pd.DataFrame: Indexed by aspect with one column per syntax feature.
+        """
+        def compute(frame: pd.DataFrame) -> pd.DataFrame:
+            syntax = frame.filter(regex='^s:', axis=1)
+            counts = syntax.groupby(frame['aspect'], observed=False).sum()
+            counts.columns = [column[2:] for column in counts.columns]
+            if normalize:
+                sizes = frame['aspect'].value_counts().reindex(counts.index)
+                counts = counts.div(sizes.where(sizes > 0), axis=0)
+            return counts
+        return self._cached(f'syntax:{normalize}', compute)
+
+    def report(self) -> Dict[str, pd.DataFrame]:
+        """
+        Computes all statistics.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Tables by name: 'aspect_ratios', 'syntax',
+            and for every grammar category both the overall and the per verb distribution.
+        """
+        self._autosave = False  # write the cache once for all tables
+        try:
+            tables = {'aspect_ratios': self.aspect_ratios(), 'syntax': self.syntax_crosstab()}
+            for feature in FEATURES:
+                tables[feature] = self.feature_distribution(feature)
+                tables[f'{feature}_by_verb'] = self.feature_distribution(feature, by_verb=True)
+        finally:
+            self._autosave = True
+        if self._unsaved:
+            self._save()
+        return tables
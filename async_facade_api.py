@@ -0,0 +1,128 @@
+"""
+AsyncFacadeAPI module to provide a high-level interface for the Playwright backend.
+"""
+
+import asyncio
+from typing import Optional, Any, Tuple, List, Dict, AsyncIterator, Iterable
+from pathlib import Path
+
+from playwright.async_api import Browser, Playwright, Error as PlaywrightError
+
+from async_scrapper import AsyncScrapper
+from context_store import ContextStore
+from config.config_loader import load_config
+from config.compiled_config import compile_for_startup
+from playwright_init import init_browser
+
+CONFIG_PATH = Path(__file__).parent / 'config' / 'scrapper_config.json'
+
+
+class AsyncFacadeAPI:
+    """
+    AsyncFacadeAPI runs several AsyncScrapper instances, each in its own isolated
+    browser context, inside a single headless browser process.
+    """
+
+    def __init__(self, config: Dict[str, Any], playwright: Playwright, browser: Browser,
+                 scrappers: List[AsyncScrapper]):
+        """
+        Initialize the AsyncFacadeAPI; use AsyncFacadeAPI.create to launch the browser.
+
+        Args:
+            config (Dict[str, Any]): A dictionary containing configuration parameters.
+            playwright (Playwright): The running Playwright instance.
+            browser (Browser): The browser hosting the contexts.
+            scrappers (List[AsyncScrapper]): One scrapper per browser context.
+        """
+        self.config = config
+        self.playwright = playwright
+        self.browser = browser
+        self.scrappers = scrappers
+        self.idle: asyncio.Queue = asyncio.Queue()
+        for scrapper in scrappers:
+            self.idle.put_nowait(scrapper)
+
+    @classmethod
+    async def create(cls, config_path: Path = CONFIG_PATH,
+                     context_store: Optional[ContextStore] = None,
+                     contexts: Optional[int] = None) -> 'AsyncFacadeAPI':
+        """
+        Launches the browser and opens the browser contexts.
+
+        Args:
+            config_path (Path): Path to the configuration JSON file.
+            context_store (Optional[ContextStore]): Shared context table.
+            contexts (Optional[int]): Number of browser contexts; defaults to the
+                'browser_contexts' config value.
+
+        Returns:
+            AsyncFacadeAPI: The ready to use facade.
+
+        Raises:
+            ConfigError: If the configuration or its selectors are invalid;
+                raised before the browser is started.
+        """
+        config = load_config(config_path)
+        compiled = compile_for_startup(config, config_path)
+        playwright, browser = await init_browser(
+            compiled.headless, compiled.browser_executable, compiled.browser_args)
+        scrappers = []
+        try:
+            for _ in range(compiled.browser_contexts if contexts is None else contexts):
+                context = await browser.new_context()
+                scrappers.append(AsyncScrapper(await context.new_page(), compiled, context_store))
+        except BaseException:
+            await browser.close()
+            await playwright.stop()
+            raise
+        return cls(config, playwright, browser, scrappers)
+
+    async def process_word(self, word: str) -> (
+            Optional)[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Processes a given word in the first idle browser context.
+
+        Args:
+            word (str): The word to be processed and scraped.
+
+        Returns:
+            Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+            Scraped data associated with the word, or None if an error occurs.
+        """
+        scrapper = await self.idle.get()
+        try:
+            await scrapper.navigate_to_search()
+            await scrapper.input_word(word)
+            return await scrapper.collect_data(word)
+        except PlaywrightError as e:
+            print(f"Error processing word '{word}': {e}")
+            return None
+        finally:
+            self.idle.put_nowait(scrapper)
+
+    async def process_words(self, words: Iterable[str]) -> AsyncIterator[
+            Tuple[str, Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]]]:
+        """
+        Processes words concurrently, one per browser context at a time.
+
+        Args:
+            words (Iterable[str]): The words to be processed.
+
+        Yields:
+            Tuple[str, Optional[Tuple[...]]]: Each word with its scraped data,
+            in order of completion.
+        """
+        async def run(word: str):
+            return word, await self.process_word(word)
+
+        for task in asyncio.as_completed([run(word) for word in words]):
+            yield await task
+
+    async def close(self):
+        """
+        Closes all browser contexts, the browser and Playwright.
+        """
+        for scrapper in self.scrappers:
+            await scrapper.close_driver()
+        await self.browser.close()
+        await self.playwright.stop()
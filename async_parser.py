@@ -0,0 +1,115 @@
+"""
+Parser module for web elements using Playwright.
+"""
+
+from typing import Optional, Dict, Union
+
+from playwright.async_api import Page, Locator, Error as PlaywrightError
+
+from config.compiled_config import CompiledConfig, compile_config, playwright_selector
+
+
+class AsyncParser:
+    """
+    A class used to parse web elements on a page using Playwright.
+
+    Mirrors Parser, but every method is a coroutine operating on a Playwright page.
+    """
+
+    def __init__(self, page: Page, config: Union[Dict, CompiledConfig]):
+        """
+        Initializes the AsyncParser with a page and configuration.
+
+        Args:
+            page (Page): The Playwright page to use.
+            config (Union[Dict, CompiledConfig]): A dictionary containing configuration
+                parameters, or its compiled form.
+        """
+        self.compiled = config if isinstance(config, CompiledConfig) else compile_config(config)
+        self.page = page
+        self.timeout = self.compiled.timeout * 1000
+        self.lemma = playwright_selector(self.compiled.lemma)
+        self.grammar = playwright_selector(self.compiled.grammar)
+        self.syntax_features = [playwright_selector(locator)
+                                for locator in self.compiled.syntax_features]
+        self.element_context = playwright_selector(self.compiled.element_context)
+
+    async def _visible_text(self, selector: str) -> str:
+        locator = self.page.locator(selector).first
+        await locator.wait_for(state="visible", timeout=self.timeout)
+        return await locator.inner_text()
+
+    async def extract_context(self, position: int) -> Optional[str]:
+        """
+        Extracts the context text of a web element located by a specific position.
+
+        Args:
+            position (int): The position of the web element to extract context from.
+
+        Returns:
+            Optional[str]: The extracted context text or None if extraction fails.
+        """
+        try:
+            return await self._visible_text(
+                playwright_selector(self.compiled.context(position)))
+        except PlaywrightError as e:
+            print(f"Error extracting context: {e}")
+            return None
+
+    async def extract_element_context(self, element: Locator) -> Optional[str]:
+        """
+        Extracts the context text of a hit element without opening its modal.
+
+        Args:
+            element (Locator): The hit element whose sentence should be read.
+
+        Returns:
+            Optional[str]: The extracted context text or None if extraction fails.
+        """
+        try:
+            return await element.locator(self.element_context).inner_text(timeout=self.timeout)
+        except PlaywrightError as e:
+            print(f"Error extracting element context: {e}")
+            return None
+
+    async def extract_lemma(self) -> Optional[str]:
+        """
+        Extracts the lemma text from the current page.
+
+        Returns:
+            Optional[str]: The extracted lemma text or None if extraction fails.
+        """
+        try:
+            return await self._visible_text(self.lemma)
+        except PlaywrightError as e:
+            print(f"Error extracting lemma: {e}")
+            return None
+
+    async def extract_grammar(self) -> Optional[str]:
+        """
+        Extracts the grammar information from the current page.
+
+        Returns:
+            Optional[str]: The extracted grammar information or None if extraction fails.
+        """
+        try:
+            return await self._visible_text(self.grammar)
+        except PlaywrightError as e:
+            print(f"Error extracting grammar: {e}")
+            return None
+
+    async def extract_syntax_features(self) -> Optional[str]:
+        """
+        Iteratively tries to extract syntax features using different XPaths.
+
+        Returns:
+            Optional[str]: The extracted syntax features text or None if all attempts fail.
+        """
+        for selector in self.syntax_features:
+            try:
+                locator = self.page.locator(selector).first
+                await locator.wait_for(state="attached", timeout=self.timeout)
+                return await locator.inner_text()
+            except PlaywrightError:
+                continue
+        return None
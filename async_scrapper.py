@@ -0,0 +1,191 @@
+"""
+Module for web scraping using Playwright.
+"""
+
+import asyncio
+import itertools
+from collections import Counter
+from typing import Tuple, Optional, Dict, Any, Union
+
+from playwright.async_api import Page, Locator, Error as PlaywrightError
+
+from async_parser import AsyncParser
+from config.compiled_config import CompiledConfig, compile_config, playwright_selector
+from context_store import ContextStore, next_hit_key
+from records import Records, add_record
+
+SELECTORS = ('search_field', 'search_button', 'word_elements',
+             'modal_close_button', 'next_page_button')
+
+
+class AsyncScrapper:
+    """
+    A class to handle the web scraping process inside one Playwright browser context.
+
+    Offers the same methods as Scrapper as coroutines, so that many scrappers
+    can share a single browser process and wait for pages concurrently.
+    """
+
+    def __init__(self, page: Page, config: Union[Dict[str, Any], CompiledConfig],
+                 context_store: Optional[ContextStore] = None):
+        """
+        Initializes the AsyncScrapper with a page, configuration settings, and a parser.
+
+        Args:
+            page (Page): The Playwright page to use for automation.
+            config (Union[Dict[str, Any], CompiledConfig]): A dictionary containing
+                configuration parameters, or its compiled form.
+            context_store (Optional[ContextStore]): Shared context table, see Scrapper.
+        """
+        self.compiled = config if isinstance(config, CompiledConfig) else compile_config(config)
+        self.page = page
+        self.timeout = self.compiled.timeout * 1000
+        self.parser = AsyncParser(page, self.compiled)
+        self.selectors = {name: playwright_selector(getattr(self.compiled, name))
+                          for name in SELECTORS}
+        self.context_store = context_store
+
+    async def navigate_to_search(self):
+        """
+        Navigates to the initial search URL as defined in the configuration.
+
+        Raises:
+            PlaywrightError: If the page cannot be opened.
+        """
+        await self.page.goto(self.compiled.seed_url)
+        await asyncio.sleep(2)  # sleep to ensure the page has loaded
+
+    async def input_word(self, word: str):
+        """
+        Inputs a word into the search field and initiates the search.
+
+        Args:
+            word (str): The word to search for.
+
+        Raises:
+            PlaywrightError: If the search field or button cannot be used,
+                so that a failed search is not saved as one without results.
+        """
+        input_element = self.page.locator(self.selectors['search_field']).first
+        await input_element.wait_for(state="visible", timeout=self.timeout)
+        await input_element.fill(word)
+        await self.page.locator(self.selectors['search_button']).first.click()
+
+    async def collect_data(self, word: str) -> Tuple[Records, Records]:
+        """
+        Collects data from the search results pages for the given word.
+
+        Args:
+            word (str): The word for which to collect data.
+
+        Returns:
+            Tuple[Records, Records]: Collected perfective and imperfective forms data.
+        """
+        collected: Tuple[Records, Records] = ([], [])
+        occurrences: Counter = Counter()
+        for page_number in itertools.count(1):
+            print(f"Processing page: {page_number}")
+            try:
+                hit_word_elements = self.page.locator(self.selectors['word_elements'])
+                await hit_word_elements.first.wait_for(state="attached", timeout=self.timeout)
+                for i in range(await hit_word_elements.count()):
+                    word_data = await self.process_hit(
+                        hit_word_elements.nth(i), i + 1, occurrences, word)
+                    if word_data is not None:
+                        add_record(collected, word_data)
+                if not await self.go_to_next_page():
+                    break
+            except PlaywrightError as e:
+                print(f"Error on page {page_number} for '{word}': {e}")
+                break
+        return collected
+
+    async def process_hit(self, element: Locator, position: int, occurrences: Counter,
+                          search: str) -> Optional[Dict[str, Any]]:
+        """
+        Processes a hit, passing its record through the context store if one is set.
+
+        Args:
+            element (Locator): The web element to process.
+            position (int): The position of the element on the page.
+            occurrences (Counter): Number of times each (context, wordform) pair
+                has been seen during the current word.
+            search (str): The query whose results are being walked.
+
+        Returns:
+            Optional[Dict[str, Any]]: Extracted data from the element or None if an error occurs.
+        """
+        if self.context_store is None:
+            return await self.process_element(element, position)
+
+        context_text = await self.parser.extract_element_context(element)
+        if context_text is None:
+            word_data = await self.process_element(element, position)
+            return self.context_store.deduplicate(word_data) if word_data else None
+
+        key = next_hit_key(occurrences, context_text, await element.inner_text())
+        cached = self.context_store.get_hit(search, key)
+        if cached is None:
+            word_data = await self.process_element(element, position, context_text)
+            cached = self.context_store.add_hit(search, key, word_data) if word_data else None
+        return cached
+
+    async def process_element(self, element: Locator, position: int,
+                              context_text: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Processes a web element to extract data like context, lemma, grammar, and syntax features.
+
+        Args:
+            element (Locator): The web element to process.
+            position (int): The position of the element on the page.
+            context_text (Optional[str]): The context if it was already read from the page.
+
+        Returns:
+            Optional[Dict[str, Any]]: Extracted data from the element or None if an error occurs.
+        """
+        try:
+            await element.scroll_into_view_if_needed(timeout=self.timeout)
+            await element.evaluate("element => element.click()")
+            if context_text is None:
+                context_text = await self.parser.extract_context(position)
+            lemma = await self.parser.extract_lemma()
+            grammar = await self.parser.extract_grammar()
+            syntax_features = await self.parser.extract_syntax_features()
+
+            await self.page.locator(self.selectors['modal_close_button']).first.evaluate(
+                "element => element.click()")
+
+            return {
+                'словоформа': await element.inner_text(),
+                'контекст': context_text,
+                'лемма': lemma,
+                'грамматика': grammar,
+                'синтаксические признаки': syntax_features
+            }
+        except PlaywrightError as e:
+            print(f"Error processing element: {e}")
+            return None
+
+    async def go_to_next_page(self) -> bool:
+        """
+        Attempts to navigate to the next page of search results.
+
+        Returns:
+            bool: True if successfully navigated to the next page, False if there
+            is no enabled next page button, i.e. this is the last page.
+
+        Raises:
+            PlaywrightError: If the button is there but cannot be clicked.
+        """
+        next_page_button = self.page.locator(self.selectors['next_page_button'])
+        if not await next_page_button.count() or not await next_page_button.first.is_enabled():
+            return False
+        await next_page_button.first.evaluate("element => element.click()")
+        await asyncio.sleep(2)
+        return True
+
+    async def close_driver(self):
+        """
+        Closes the browser context of this scrapper.
+        """
+        await self.page.context.close()
@@ -0,0 +1,162 @@
+"""
+Module for scraping several words with one corpus search.
+
+The lexgramm search accepts lemmas OR'ed with '|', so rare verbs can share
+one search, first page load and pagination walk. BatchPlanner packs words
+into such queries so that the expected number of hits per query stays under
+a budget, and route_records splits the combined results by their 'лемма'.
+Like records.py, this module has no browser dependencies.
+"""
+
+import statistics
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from records import Records, load_word_data, scraped_words
+
+QUERY_SEPARATOR = '|'
+DEFAULT_MAX_HITS = 50
+DEFAULT_MAX_WORDS = 10
+DEFAULT_ESTIMATE = 20
+
+
+def normalize_lemma(lemma: Optional[str]) -> str:
+    """
+    Args:
+        lemma (Optional[str]): A searched word or the 'лемма' field of a record.
+
+    Returns:
+        str: The lemma lowercased, with 'ё' spelled as 'е'.
+    """
+    return (lemma or '').strip().lower().replace('ё', 'е')
+
+
+def batch_query(words: List[str]) -> str:
+    """
+    Args:
+        words (List[str]): The words of a batch.
+
+    Returns:
+        str: The search query matching any of them.
+    """
+    return QUERY_SEPARATOR.join(words)
+
+
+def route_records(words: List[str], perfective: Records, imperfective: Records) -> (
+        Tuple)[Dict[str, Tuple[Records, Records]], int]:
+    """
+    Splits the records of a batch query between its words by their lemma.
+
+    Args:
+        words (List[str]): The words of the batch.
+        perfective (Records): Collected perfective records of the whole batch.
+        imperfective (Records): Collected imperfective records of the whole batch.
+
+    Returns:
+        Tuple[Dict[str, Tuple[Records, Records]], int]: Perfective and imperfective
+        records of every word, including words without hits, and the number of
+        records whose lemma matched none of the words.
+    """
+    by_lemma = {normalize_lemma(word): word for word in words}
+    routed: Dict[str, Tuple[Records, Records]] = {word: ([], []) for word in words}
+    unrouted = 0
+    for aspect, records in enumerate((perfective, imperfective)):
+        for record in records:
+            word = by_lemma.get(normalize_lemma(record.get('лемма')))
+            if word is None:
+                unrouted += 1
+            else:
+                routed[word][aspect].append(record)
+    return routed, unrouted
+
+
+def estimates_from_output(output_dir: str) -> Dict[str, int]:
+    """
+    Uses the record counts of an earlier run as hit estimates.
+
+    Args:
+        output_dir (str): The directory with scraped data.
+
+    Returns:
+        Dict[str, int]: Number of stored records per scraped word.
+    """
+    estimates = {}
+    for word in scraped_words(output_dir):
+        perfective, imperfective = load_word_data(output_dir, word)
+        estimates[word] = len(perfective) + len(imperfective)
+    return estimates
+
+
+class BatchPlanner:
+    """
+    Packs words into batch queries sized by their estimated hit counts.
+
+    Words without a known estimate are assumed to have the median number of hits
+    observed so far in this run, so batches grow while the run is in the long
+    tail of rare verbs and shrink when frequent verbs come up.
+    """
+
+    def __init__(self, max_hits: int = DEFAULT_MAX_HITS, max_words: int = DEFAULT_MAX_WORDS,
+                 estimates: Optional[Dict[str, int]] = None,
+                 default_estimate: int = DEFAULT_ESTIMATE):
+        """
+        Initializes the BatchPlanner.
+
+        Args:
+            max_hits (int): Expected hits a batch query may return; a word
+                estimated above it is searched alone.
+            max_words (int): Maximum number of words in one query.
+            estimates (Optional[Dict[str, int]]): Known hit counts per word.
+            default_estimate (int): Estimate for unknown words before any observation.
+        """
+        self.max_hits = max_hits
+        self.max_words = max_words
+        self.estimates = dict(estimates or {})
+        self.default_estimate = default_estimate
+        self.observed: List[int] = []
+
+    def estimate(self, word: str) -> float:
+        """
+        Args:
+            word (str): A word to scrape.
+
+        Returns:
+            float: The expected number of its hits.
+        """
+        if word in self.estimates:
+            return self.estimates[word]
+        return statistics.median(self.observed) if self.observed else self.default_estimate
+
+    def observe(self, word: str, hits: int):
+        """
+        Records the actual number of hits of a scraped word.
+
+        Args:
+            word (str): The scraped word.
+            hits (int): Its number of records.
+        """
+        self.estimates[word] = hits
+        self.observed.append(hits)
+
+    def batches(self, words: Iterable[str]) -> Iterator[List[str]]:
+        """
+        Yields batches lazily, so observations made between batches
+        change the size of the following ones.
+
+        Args:
+            words (Iterable[str]): The words to scrape, in order.
+
+        Yields:
+            List[str]: The words of the next query.
+        """
+        batch: List[str] = []
+        expected = 0.0
+        for word in words:
+            estimate = self.estimate(word)
+            if batch and (expected + estimate > self.max_hits or len(batch) >= self.max_words):
+                yield batch
+                batch, expected = [], 0.0
+                estimate = self.estimate(word)
+            batch.append(word)
+            expected += estimate
+        if batch:
+            yield batch
@@ -0,0 +1,177 @@
+"""
+Benchmark comparing the Selenium and Playwright backends on the local mock site.
+
+Reports throughput in hits per second per GB of peak browser memory. Both
+backends scrape the same words from the same mock site with the same number
+of workers. They wait the same way: after scrolling to a hit, until it is
+visible, and a fixed 2 s after every page switch. Peak memory is the largest
+sampled RSS of all child processes, so the browsers and their drivers count.
+Example:
+
+    python -m benchmarks.bench_backends --backend both --words 8 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.mock_site import MockSite
+from process_metrics import children_rss_bytes
+
+GB = 1024 ** 3
+
+
+class MemorySampler:
+    """
+    Samples the memory of all child processes in a background thread and keeps the peak.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        """
+        Initializes the MemorySampler.
+
+        Args:
+            interval (float): Seconds between samples.
+        """
+        self.interval = interval
+        self.peak = 0
+        self.running = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while self.running.is_set():
+            self.peak = max(self.peak, children_rss_bytes())
+            time.sleep(self.interval)
+
+    def __enter__(self) -> 'MemorySampler':
+        self.running.set()
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.running.clear()
+        self.thread.join()
+
+
+def count_hits(results: List[Any]) -> int:
+    """
+    Counts the records in a list of (perfective, imperfective) results.
+
+    Args:
+        results (List[Any]): Results returned by process_word, None for failures.
+
+    Returns:
+        int: The number of collected records.
+    """
+    return sum(len(result[0]) + len(result[1]) for result in results if result)
+
+
+def run_selenium(config_path: Path, words: List[str], workers: int) -> int:
+    """
+    Scrapes the words with one Chrome per worker thread.
+
+    Returns:
+        int: The number of collected records.
+    """
+    # pylint: disable=import-outside-toplevel
+    from facade_api import FacadeAPI
+
+    chunks = [words[i::workers] for i in range(workers)]
+
+    def scrape(chunk: List[str]) -> int:
+        api = FacadeAPI(config_path)
+        try:
+            return count_hits([api.process_word(word) for word in chunk])
+        finally:
+            api.close()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(scrape, chunks))
+
+
+def run_playwright(config_path: Path, words: List[str], workers: int) -> int:
+    """
+    Scrapes the words with one browser and a browser context per worker.
+
+    Returns:
+        int: The number of collected records.
+    """
+    # pylint: disable=import-outside-toplevel
+    from async_facade_api import AsyncFacadeAPI
+
+    async def scrape() -> int:
+        api = await AsyncFacadeAPI.create(config_path, contexts=workers)
+        try:
+            return count_hits([data async for _, data in api.process_words(words)])
+        finally:
+            await api.close()
+
+    return asyncio.run(scrape())
+
+
+RUNNERS = {'selenium': run_selenium, 'playwright': run_playwright}
+
+
+def benchmark(backend: str, config_path: Path, words: List[str],
+              workers: int) -> Dict[str, Any]:
+    """
+    Runs one backend and measures its throughput and memory.
+
+    Args:
+        backend (str): 'selenium' or 'playwright'.
+        config_path (Path): Configuration pointing at the mock site.
+        words (List[str]): The words to scrape.
+        workers (int): Number of Chrome processes or browser contexts.
+
+    Returns:
+        Dict[str, Any]: The measurements.
+    """
+    with MemorySampler() as sampler:
+        start = time.perf_counter()
+        hits = RUNNERS[backend](config_path, words, workers)
+        elapsed = time.perf_counter() - start
+    peak_gb = sampler.peak / GB
+    hits_per_sec = hits / elapsed if elapsed else 0.0
+    return {
+        'backend': backend,
+        'workers': workers,
+        'hits': hits,
+        'seconds': round(elapsed, 2),
+        'peak_rss_gb': round(peak_gb, 3),
+        'hits_per_sec': round(hits_per_sec, 3),
+        'hits_per_sec_per_gb': round(hits_per_sec / peak_gb, 3) if peak_gb else None,
+    }
+
+
+def main():
+    """
+    Parses the command line, starts the mock site and runs the selected backends.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', 2)[1])
+    parser.add_argument('--backend', choices=['selenium', 'playwright', 'both'], default='both')
+    parser.add_argument('--words', type=int, default=8, help='number of words to scrape')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Chrome processes (selenium) or browser contexts (playwright)')
+    parser.add_argument('--hits', type=int, default=10, help='hits per word on the mock site')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='artificial latency of the mock site in seconds')
+    args = parser.parse_args()
+
+    backends = ['selenium', 'playwright'] if args.backend == 'both' else [args.backend]
+    words = [f'слово{i}' for i in range(args.words)]
+
+    with MockSite(hits_per_word=args.hits, latency=args.latency) as site, \
+            tempfile.TemporaryDirectory() as tmp:
+        config_path = site.write_config(Path(tmp))
+        for backend in backends:
+            print(json.dumps(benchmark(backend, config_path, words, args.workers)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+"""
+Local mock of the corpus search site used by benchmarks and offline tests.
+
+The pages reproduce the parts of the real DOM the scrappers rely on: the
+lexgramm search panel, '.hit.word' spans inside 'seq-with-actions' sentences,
+the info modal as the sixth div of the body and the ant pagination button,
+so the selectors from config/scrapper_config.json work unchanged.
+"""
+
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from config.config_loader import load_config
+from local_server import QuietHandler
+
+CONFIG_PATH = Path(__file__).parent.parent / 'config' / 'scrapper_config.json'
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>search</title></head>
+<body>
+<div id="lexgramm-search-panel">
+  <div></div>
+  <div></div>
+  <div><input class="the-input__input" type="text"></div>
+  <div><div><div><button type="button">Найти</button></div></div></div>
+</div>
+<script>
+document.querySelector('#lexgramm-search-panel button').addEventListener('click', () => {
+  const value = document.querySelector('.the-input__input').value;
+  window.location.href = '/results?req=' + encodeURIComponent(value);
+});
+</script>
+</body></html>
+"""
+
+RESULTS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>results</title></head>
+<body>
+<div class="header"></div>
+<div class="results"></div>
+<div class="pagination"><ul><li class="ant-pagination-next"><button>&gt;</button></li></ul></div>
+<div class="footer"></div>
+<div class="overlay"></div>
+<script>
+const SENTENCES = __SENTENCES__;
+const PER_PAGE = __PER_PAGE__;
+const LATENCY_MS = __LATENCY_MS__;
+let page = 0;
+
+function element(tag, parent, cls) {
+  const el = document.createElement(tag);
+  if (cls) { el.className = cls; }
+  if (parent) { parent.appendChild(el); }
+  return el;
+}
+
+function row(table, label, value, wrap) {
+  const tr = element('tr', table);
+  element('td', tr).textContent = label;
+  const span = element('span', element('td', tr));
+  if (wrap) { element('i', span).textContent = value; } else { span.textContent = value; }
+}
+
+function openModal(hit) {
+  closeModal();
+  const modal = element('div', document.body, 'info-modal');
+  const content = element('div', element('div', element('div', element('div', modal))));
+  const close = element('button', element('div', content), 'info-modal__close');
+  close.addEventListener('click', closeModal);
+  const body = element('div', content);
+  const morph = element('table', element('div', body));
+  row(morph, 'Словоформа', hit.wordform, true);
+  row(morph, 'Лемма', hit.lemma, true);
+  row(morph, 'Грамматика', hit.grammar, true);
+  element('div', body);
+  element('div', body);
+  row(element('table', element('div', body)), 'Синтаксис', hit.syntax, false);
+}
+
+function closeModal() {
+  document.querySelectorAll('.info-modal').forEach((modal) => modal.remove());
+}
+
+function render() {
+  const results = document.querySelector('.results');
+  results.innerHTML = '';
+  SENTENCES.slice(page * PER_PAGE, (page + 1) * PER_PAGE).forEach((sentence) => {
+    const p = element('p', results, 'seq-with-actions');
+    sentence.parts.forEach((part) => {
+      if (typeof part === 'string') {
+        p.appendChild(document.createTextNode(part));
+      } else {
+        const span = element('span', p, 'hit word');
+        span.textContent = part.wordform;
+        span.addEventListener('click', () => openModal(part));
+      }
+    });
+  });
+  if (!SENTENCES.length) { element('div', results, 'results-empty').textContent = 'Ничего не найдено'; }
+  const next = document.querySelector('.ant-pagination-next');
+  next.classList.toggle('ant-pagination-disabled', (page + 1) * PER_PAGE >= SENTENCES.length);
+}
+
+document.querySelector('.ant-pagination-next').addEventListener('click', (event) => {
+  if (event.currentTarget.classList.contains('ant-pagination-disabled')) { return; }
+  page += 1;
+  document.querySelector('.results').innerHTML = '';
+  setTimeout(render, LATENCY_MS);
+});
+
+render();
+</script>
+</body></html>
+"""
+
+GRAMMAR = {
+    'perfective': ('глагол, совершенный, прошедшее, изъявительное, '
+                   'единственное, мужской, переходный'),
+    'imperfective': ('глагол, несовершенный, настоящее, изъявительное, '
+                     '3-е лицо, единственное, переходный'),
+}
+SYNTAX = 'сказуемое, главная клауза, глагольная клауза, есть зависимые'
+
+
+def build_sentences(lemma: str, hits: int) -> List[Dict[str, Any]]:
+    """
+    Generates deterministic sentences for a lemma.
+
+    Every third sentence contains two hits, the rest contain one; hits alternate
+    between perfective and imperfective grammar.
+
+    Args:
+        lemma (str): The lemma searched for.
+        hits (int): The number of hits to generate.
+
+    Returns:
+        List[Dict[str, Any]]: Sentences, each a list of text parts and hit objects.
+    """
+    sentences: List[Dict[str, Any]] = []
+    number = 0
+    while number < hits:
+        parts: List[Any] = [f'Предложение {len(sentences) + 1}: ']
+        for _ in range(2 if len(sentences) % 3 == 2 and number + 1 < hits else 1):
+            aspect = 'perfective' if number % 2 == 0 else 'imperfective'
+            parts.append({'wordform': lemma, 'lemma': lemma,
+                          'grammar': GRAMMAR[aspect], 'syntax': SYNTAX})
+            parts.append(' и ')
+            number += 1
+        parts[-1] = '.'
+        sentences.append({'parts': parts})
+    return sentences
+
+
+class MockSite:
+    """
+    A threaded HTTP server serving the mock search and results pages.
+    """
+
+    def __init__(self, hits_per_word: int = 20, per_page: int = 10,
+                 latency: float = 0.0, port: int = 0):
+        """
+        Initializes the MockSite.
+
+        Args:
+            hits_per_word (int): Number of hits returned for every lemma in a query.
+            per_page (int): Number of sentences per results page.
+            latency (float): Artificial delay in seconds for requests and page switches.
+            port (int): Port to listen on, 0 picks a free one.
+        """
+        self.hits_per_word = hits_per_word
+        self.per_page = per_page
+        self.latency = latency
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), self._handler())
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Returns:
+            str: The address of the search page, usable as 'seed_url'.
+        """
+        return f"http://127.0.0.1:{self.server.server_address[1]}/search"
+
+    def results_page(self, query: str) -> str:
+        """
+        Renders the results page for a query; lemmas may be OR'ed with '|'.
+
+        Args:
+            query (str): The search query.
+
+        Returns:
+            str: The HTML of the results page.
+        """
+        sentences = []
+        for lemma in filter(None, (part.strip() for part in query.split('|'))):
+            sentences.extend(build_sentences(lemma, self.hits_per_word))
+        return (RESULTS_PAGE
+                .replace('__SENTENCES__', json.dumps(sentences, ensure_ascii=False))
+                .replace('__PER_PAGE__', str(self.per_page))
+                .replace('__LATENCY_MS__', str(int(self.latency * 1000))))
+
+    def write_config(self, directory: Path, **overrides: Any) -> Path:
+        """
+        Writes a copy of the scrapper configuration pointing at this site.
+
+        Args:
+            directory (Path): Where to write the configuration.
+            **overrides (Any): Further configuration keys to replace.
+
+        Returns:
+            Path: The written configuration file.
+        """
+        config = load_config(CONFIG_PATH)
+        config['seed_url'] = self.url
+        config['timeout'] = 5
+        config['selector_fixture'] = str(CONFIG_PATH.parent / config['selector_fixture'])
+        config.update(overrides)
+        config_path = Path(directory) / 'scrapper_config.json'
+        with open(config_path, 'w', encoding='utf-8') as file:
+            json.dump(config, file, ensure_ascii=False)
+        return config_path
+
+    def _handler(self):
+        site = self
+
+        class Handler(QuietHandler):
+            """
+            Serves the search page and the results pages.
+            """
+
+            def page(self) -> str:
+                """
+                Returns:
+                    str: The HTML of the requested page.
+                """
+                url = urlparse(self.path)
+                if url.path == '/results':
+                    return site.results_page(parse_qs(url.query).get('req', [''])[0])
+                return SEARCH_PAGE
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """
+                Handles a GET request.
+                """
+                time.sleep(site.latency)
+                self.send_content(200, {'Content-Type': 'text/html; charset=utf-8'},
+                                  self.page().encode('utf-8'))
+
+        return Handler
+
+    def start(self) -> 'MockSite':
+        """
+        Starts serving in a background thread.
+
+        Returns:
+            MockSite: The running site.
+        """
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> 'MockSite':
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,348 @@
+"""
+Command line interface of the scrapper.
+
+Only the 'scrape', 'resume' and 'record' subcommands need a browser; the browser
+modules are imported inside them so that offline subcommands start quickly.
+
+Usage examples:
+
+    python cli.py scrape
+    python cli.py resume --output biverbal_verbs
+    python cli.py scrape --batch
+    python cli.py stats --json
+    python cli.py export --format csv --dest dataset.csv
+    python cli.py validate-config --config config/scrapper_config.json
+    python cli.py reparse --dry-run
+    python cli.py report --dest report
+    python cli.py search '"в ячейку"' --aspect perfective
+    python cli.py record абонировать --archive recordings/run.zip
+    python cli.py record абонировать --archive run.zip --fixture config/selector_fixture.html
+    python cli.py replay --archive recordings/run.zip --speed 1
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+from config.config_loader import load_config
+from context_store import STORE_NAME, ContextStore
+from batching import DEFAULT_MAX_HITS
+from records import (ASPECTS, classify_aspect, iter_records, load_word_data,
+                     read_words, save_word_data, scraped_words)
+
+WORDS_PATH = Path('biverbal_verbs.txt')
+OUTPUT_DIR = Path('biverbal_verbs')
+CONFIG_PATH = Path('config/scrapper_config.json')
+EXPORT_FIELDS = ['глагол', 'вид', 'словоформа', 'контекст', 'лемма',
+                 'грамматика', 'синтаксические признаки']
+
+
+def context_store_for(output_dir: Path) -> ContextStore:
+    """
+    Opens the context table stored next to the scraped data.
+
+    Args:
+        output_dir (Path): The output directory.
+
+    Returns:
+        ContextStore: The store, empty if no table was saved yet.
+    """
+    return ContextStore(output_dir / STORE_NAME)
+
+
+def scrape(args: argparse.Namespace) -> int:
+    """
+    Scrapes all words, or only the missing ones for 'resume'; fails if the words
+    or the configuration cannot be read.
+    """
+    from start import main as start_main  # pylint: disable=import-outside-toplevel
+
+    return start_main(args.words, args.output, args.config,
+                      resume=args.command == 'resume', batch_hits=args.batch)
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], output_format: str, dest: TextIO):
+    """
+    Writes exported records to an open file.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): The records with their verb and aspect.
+        output_format (str): 'json', 'jsonl' or 'csv'.
+        dest (TextIO): The file to write to.
+    """
+    if output_format == 'csv':
+        writer = csv.DictWriter(dest, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    elif output_format == 'jsonl':
+        for row in rows:
+            dest.write(json.dumps(row, ensure_ascii=False) + '\n')
+    else:
+        json.dump(list(rows), dest, ensure_ascii=False, indent=4)
+
+
+def export(args: argparse.Namespace) -> int:
+    """
+    Writes all records, with contexts inlined, as JSON, JSON lines or CSV.
+    """
+    store = context_store_for(args.output)
+    rows = ({'глагол': word, 'вид': aspect, **store.resolve(record)}
+            for word, aspect, record in iter_records(str(args.output)))
+    if args.dest:
+        with open(args.dest, 'w', encoding='utf-8', newline='') as dest:
+            write_rows(rows, args.format, dest)
+    else:
+        write_rows(rows, args.format, sys.stdout)
+    return 0
+
+
+def stats(args: argparse.Namespace) -> int:
+    """
+    Prints the number of perfective and imperfective records per verb.
+    """
+    counts: Dict[str, Dict[str, int]] = {}
+    for word in sorted(scraped_words(str(args.output))):
+        perfective, imperfective = load_word_data(str(args.output), word)
+        counts[word] = {'perfective': len(perfective), 'imperfective': len(imperfective)}
+    totals = {aspect: sum(count[aspect] for count in counts.values()) for aspect in ASPECTS}
+
+    if args.json:
+        print(json.dumps({'verbs': counts, 'total': totals}, ensure_ascii=False, indent=4))
+        return 0
+    width = max((len(word) for word in counts), default=5)
+    print(f"{'verb':<{width}}  perfective  imperfective")
+    for word, count in counts.items():
+        print(f"{word:<{width}}  {count['perfective']:>10}  {count['imperfective']:>12}")
+    print(f"{'total':<{width}}  {totals['perfective']:>10}  {totals['imperfective']:>12}")
+    print(f"{len(counts)} verbs")
+    return 0
+
+
+def validate(args: argparse.Namespace) -> int:
+    """
+    Checks the configuration schema and selector syntax, and dry-runs the
+    selectors against a saved results page if one is given or configured.
+    """
+    # lxml and cssselect take longer to import than the other subcommands run
+    from config.compiled_config import (  # pylint: disable=import-outside-toplevel
+        ConfigError, compile_for_startup)
+
+    try:
+        raw = load_config(args.config)
+        if args.fixture is not None:
+            raw['selector_fixture'] = str(args.fixture.resolve())
+        compile_for_startup(raw, args.config)
+        errors = []
+    except (OSError, json.JSONDecodeError, ConfigError) as e:
+        errors = [str(e)]
+    for error in errors:
+        print(f"{args.config}: {error}", file=sys.stderr)
+    if not errors:
+        print(f"{args.config}: OK")
+    return 1 if errors else 0
+
+
+def reparse(args: argparse.Namespace) -> int:
+    """
+    Re-classifies stored records by their grammar, moving records filed under
+    the wrong aspect and dropping records that are not aspectual verb forms.
+    """
+    changed = 0
+    for word in sorted(scraped_words(str(args.output))):
+        stored = load_word_data(str(args.output), word)
+        sorted_records: Dict[str, List[Dict[str, Any]]] = {aspect: [] for aspect in ASPECTS}
+        for records in stored:
+            for record in records:
+                aspect = classify_aspect(record.get('грамматика'))
+                if aspect is not None:
+                    sorted_records[aspect].append(record)
+        result = (sorted_records['perfective'], sorted_records['imperfective'])
+        if result != stored:
+            changed += 1
+            print(f"{word}: {len(stored[0])}/{len(stored[1])} -> "
+                  f"{len(result[0])}/{len(result[1])}")
+            if not args.dry_run:
+                save_word_data(str(args.output), word, *result)
+    print(f"{changed} verbs {'would be ' if args.dry_run else ''}updated")
+    return 0
+
+
+def report(args: argparse.Namespace) -> int:
+    """
+    Computes aspect usage statistics and prints them or writes them as CSV files.
+    """
+    from analytics import AspectAnalytics  # pylint: disable=import-outside-toplevel
+
+    tables = AspectAnalytics(args.output).report()
+    if args.dest is None:
+        for name in ('aspect_ratios', 'tense', 'mood', 'person', 'form'):
+            print(f"{name}:\n{tables[name].to_string()}\n")
+        return 0
+    args.dest.mkdir(parents=True, exist_ok=True)
+    for name, table in tables.items():
+        table.to_csv(args.dest / f'{name}.csv')
+    print(f"{len(tables)} tables written to {args.dest}")
+    return 0
+
+
+def index(args: argparse.Namespace) -> int:
+    """
+    Builds or incrementally updates the full-text index.
+    """
+    from text_index import TextIndex  # pylint: disable=import-outside-toplevel
+
+    text_index = TextIndex(args.output)
+    print(f"{text_index.update()} files indexed")
+    text_index.close()
+    return 0
+
+
+def search(args: argparse.Namespace) -> int:
+    """
+    Updates the full-text index and prints the records matching a query.
+    """
+    from text_index import TextIndex  # pylint: disable=import-outside-toplevel
+
+    text_index = TextIndex(args.output)
+    text_index.update()
+    results = text_index.search(args.query, aspect=args.aspect, lemma=args.lemma,
+                                limit=args.limit)
+    text_index.close()
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=4))
+        return 0
+    for result in results:
+        print(f"{result['глагол']}\t{result['вид']}\t{result['словоформа']}\t"
+              f"{result['контекст']}")
+    return 0
+
+
+def record_command(args: argparse.Namespace) -> int:
+    """
+    Scrapes words from the live site and records pages and responses into an archive.
+    """
+    # pylint: disable=import-outside-toplevel
+    from recorder import record, save_fixture
+
+    words = args.word or read_words(args.words)
+    args.archive.parent.mkdir(parents=True, exist_ok=True)
+    counts = record(words, args.archive, args.config)
+    print(f"{args.archive}: {counts['responses']} responses, {counts['snapshots']} snapshots, "
+          f"{counts['records']} records")
+    if args.fixture is not None:
+        if not save_fixture(args.archive, args.fixture):
+            print(f"{args.archive}: no page with an open hit modal was recorded",
+                  file=sys.stderr)
+            return 1
+        print(f"selector fixture written to {args.fixture}")
+    return 0
+
+
+def replay(args: argparse.Namespace) -> int:
+    """
+    Serves a recorded archive locally until interrupted.
+    """
+    from replay_server import ReplayServer  # pylint: disable=import-outside-toplevel
+
+    with ReplayServer(args.archive, speed=args.speed, port=args.port,
+                      tls_port=args.tls_port) as server:
+        print(f"replaying {args.archive}; use seed_url {server.url}, or the recorded "
+              f"seed_url with \"browser_args\": {json.dumps(server.browser_args)}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        for miss in server.misses:
+            print(f"not recorded: {miss}", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser with all subcommands.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog='cli.py', description='Scrapes biverbal verbs from the Russian National Corpus.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add(name: str, handler, help_text: str, words: bool = False,
+            config: bool = False) -> argparse.ArgumentParser:
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        subparser.set_defaults(handler=handler)
+        subparser.add_argument('--output', type=Path, default=OUTPUT_DIR,
+                               help='directory with the scraped data')
+        if words:
+            subparser.add_argument('--words', type=Path, default=WORDS_PATH,
+                                   help='file with the words to scrape, one per line')
+        if config:
+            subparser.add_argument('--config', type=Path, default=CONFIG_PATH,
+                                   help='path to the configuration JSON file')
+        return subparser
+
+    for name, help_text in (('scrape', 'scrape all words'),
+                            ('resume', 'scrape the words that have no results yet')):
+        subparser = add(name, scrape, help_text, words=True, config=True)
+        subparser.add_argument('--batch', type=int, nargs='?', const=DEFAULT_MAX_HITS,
+                               metavar='HITS',
+                               help='search several rare words at once, with about HITS '
+                                    f'expected hits per search (default {DEFAULT_MAX_HITS})')
+    subparser = add('export', export, 'export all records with inline contexts')
+    subparser.add_argument('--format', choices=['json', 'jsonl', 'csv'], default='json')
+    subparser.add_argument('--dest', type=Path, help='output file, stdout by default')
+    subparser = add('stats', stats, 'print record counts per verb')
+    subparser.add_argument('--json', action='store_true', help='print JSON')
+    subparser = add('validate-config', validate, 'check the configuration file', config=True)
+    subparser.add_argument('--fixture', type=Path,
+                           help='saved results page with an open hit modal to test selectors on')
+    subparser = add('reparse', reparse, 're-classify stored records by their grammar')
+    subparser.add_argument('--dry-run', action='store_true', help='only report changes')
+    subparser = add('report', report, 'compute aspect usage statistics')
+    subparser.add_argument('--dest', type=Path, help='directory for CSV tables')
+    add('index', index, 'build or update the full-text index of contexts')
+    subparser = add('search', search, 'search contexts by terms and "quoted phrases"')
+    subparser.add_argument('query', help='terms and "phrases"; prefix словоформа: '
+                                         'to match the wordform')
+    subparser.add_argument('--aspect', choices=list(ASPECTS))
+    subparser.add_argument('--lemma')
+    subparser.add_argument('--limit', type=int, default=20)
+    subparser.add_argument('--json', action='store_true', help='print JSON')
+    subparser = add('record', record_command, 'record a live run into a replayable archive',
+                    words=True, config=True)
+    subparser.add_argument('word', nargs='*', help='words to record, --words file by default')
+    subparser.add_argument('--archive', type=Path, required=True, help='archive to write')
+    subparser.add_argument('--fixture', type=Path,
+                           help='also save the first page with an open hit modal here, '
+                                'e.g. config/selector_fixture.html')
+    subparser = add('replay', replay, 'serve a recorded archive locally')
+    subparser.add_argument('--archive', type=Path, required=True, help='archive to serve')
+    subparser.add_argument('--port', type=int, default=8765)
+    subparser.add_argument('--tls-port', type=int, default=8766)
+    subparser.add_argument('--speed', type=float, default=0.0,
+                           help='1 replays recorded timings, 2 twice as fast, 0 without delays')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line interface.
+
+    Args:
+        argv (Optional[List[str]]): Arguments, sys.argv[1:] by default.
+
+    Returns:
+        int: The exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
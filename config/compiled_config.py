@@ -0,0 +1,335 @@
+"""
+Module for compiling a loaded configuration into ready-to-use locators.
+
+Compilation validates the schema and the syntax of every XPath and CSS
+selector, so that a broken selector fails at startup instead of as a timeout
+on every hit. Locators are (strategy, selector) tuples using the string values
+of selenium's By constants, which keeps this module free of browser imports.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import cssselect
+from lxml import etree, html as lxml_html
+
+from config.config_loader import (DEFAULT_BROWSER_CONTEXTS, DRIVER_RECYCLING, load_config,
+                                  validate_config)
+
+XPATH = "xpath"
+CSS_SELECTOR = "css selector"
+CLASS_NAME = "class name"
+Locator = Tuple[str, str]
+
+CSS_KEYS = ('word_elements', 'modal_close', 'next_page_button', 'empty_results')
+CONTEXT_XPATH = ("(//span[@class='hit word'])[position()={position}]"
+                 "/ancestor::p[contains(@class, 'seq-with-actions')]")
+ELEMENT_CONTEXT: Locator = (XPATH, "./ancestor::p[contains(@class, 'seq-with-actions')]")
+SEARCH_FIELD: Locator = (CLASS_NAME, "the-input__input")
+
+
+class ConfigError(ValueError):
+    """
+    Raised when a configuration is invalid.
+    """
+
+
+def xpath_syntax_error(expression: str) -> Optional[str]:
+    """
+    Checks the syntax of an XPath expression with lxml.
+
+    Args:
+        expression (str): The XPath.
+
+    Returns:
+        Optional[str]: A description of the problem or None if the XPath is valid.
+    """
+    try:
+        etree.XPath(expression)
+        return None
+    except etree.XPathSyntaxError as e:
+        return str(e)
+
+
+def css_syntax_error(selector: str) -> Optional[str]:
+    """
+    Checks the syntax of a CSS selector with cssselect.
+
+    Args:
+        selector (str): The CSS selector.
+
+    Returns:
+        Optional[str]: A description of the problem or None if the selector is valid.
+    """
+    try:
+        cssselect.GenericTranslator().css_to_xpath(selector)
+        return None
+    except cssselect.SelectorError as e:
+        return str(e)
+
+
+@lru_cache(maxsize=None)
+def context_locator(position: int) -> Locator:
+    """
+    Builds the locator of the sentence containing the hit at a position.
+
+    Args:
+        position (int): The 1-based position of the hit on the page.
+
+    Returns:
+        Locator: The XPath locator.
+    """
+    return XPATH, CONTEXT_XPATH.format(position=position)
+
+
+def playwright_selector(locator: Locator) -> str:
+    """
+    Converts a locator into a Playwright selector.
+
+    Args:
+        locator (Locator): An XPath or CSS locator.
+
+    Returns:
+        str: The selector with an 'xpath=' or 'css=' engine prefix.
+    """
+    strategy, selector = locator
+    if strategy == XPATH:
+        return f"xpath={selector}"
+    if strategy == CLASS_NAME:
+        return f"css=.{selector}"
+    return f"css={selector}"
+
+
+class CompiledConfig:
+    """
+    A validated configuration with precompiled locators.
+    """
+
+    search_field: Locator = SEARCH_FIELD
+    element_context: Locator = ELEMENT_CONTEXT
+
+    def __init__(self, raw: Dict[str, Any]):
+        """
+        Validates a loaded configuration and compiles its locators.
+
+        Args:
+            raw (Dict[str, Any]): The configuration as returned by load_config.
+
+        Raises:
+            ConfigError: If the schema or any selector is invalid.
+        """
+        errors = validate_config(raw)
+        if not errors:
+            for key, selector in raw['x_paths'].items():
+                selectors = selector if isinstance(selector, list) else [selector]
+                check = css_syntax_error if key in CSS_KEYS else xpath_syntax_error
+                errors.extend(f"x_paths.{key}: {error} in {item!r}"
+                              for item in selectors if (error := check(item)))
+        if errors:
+            raise ConfigError("; ".join(errors))
+
+        x_paths = raw['x_paths']
+        self.raw = raw
+        self.search_button: Locator = (XPATH, x_paths['search_input'])
+        self.word_elements: Locator = (CSS_SELECTOR, x_paths['word_elements'])
+        self.lemma: Locator = (XPATH, x_paths['lemma'])
+        self.grammar: Locator = (XPATH, x_paths['grammar'])
+        self.syntax_features: Tuple[Locator, ...] = tuple(
+            (XPATH, xpath) for xpath in x_paths['syntax_features_option'])
+        self.next_page_button: Locator = (CSS_SELECTOR, x_paths['next_page_button'])
+
+    @property
+    def seed_url(self) -> str:
+        """
+        Returns:
+            str: The search page to start from.
+        """
+        return self.raw['seed_url']
+
+    @property
+    def timeout(self) -> int:
+        """
+        Returns:
+            int: Seconds to wait for page elements.
+        """
+        return self.raw['timeout']
+
+    @property
+    def backend(self) -> str:
+        """
+        Returns:
+            str: 'selenium' or 'playwright'.
+        """
+        return self.raw.get('backend', 'selenium')
+
+    @property
+    def headless(self) -> bool:
+        """
+        Returns:
+            bool: Whether to run the browser without a window.
+        """
+        return self.raw.get('headless', True)
+
+    @property
+    def browser_args(self) -> List[str]:
+        """
+        Returns:
+            List[str]: Additional browser flags, e.g. from ReplayServer.browser_args.
+        """
+        return self.raw.get('browser_args', [])
+
+    @property
+    def browser_contexts(self) -> int:
+        """
+        Returns:
+            int: Number of Playwright browser contexts scraping in parallel.
+        """
+        return self.raw.get('browser_contexts', DEFAULT_BROWSER_CONTEXTS)
+
+    @property
+    def browser_executable(self) -> Optional[str]:
+        """
+        Returns:
+            Optional[str]: Path to a locally installed Chromium for Playwright,
+            None for the bundled one.
+        """
+        return self.raw.get('browser_executable')
+
+    @property
+    def driver_recycling(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Driver recycling thresholds, defaults filled in.
+        """
+        return {**DRIVER_RECYCLING, **self.raw.get('driver_recycling', {})}
+
+    @property
+    def modal_close_button(self) -> Locator:
+        """
+        Returns:
+            Locator: The button closing a hit's modal.
+        """
+        return CSS_SELECTOR, self.raw['x_paths']['modal_close']
+
+    @property
+    def empty_results(self) -> Optional[Locator]:
+        """
+        Returns:
+            Optional[Locator]: The message shown when a search finds nothing,
+            None if it is not configured.
+        """
+        selector = self.raw['x_paths'].get('empty_results')
+        return None if selector is None else (CSS_SELECTOR, selector)
+
+    @staticmethod
+    def context(position: int) -> Locator:
+        """
+        Returns:
+            Locator: The locator of the sentence containing the hit at a position.
+        """
+        return context_locator(position)
+
+    def modal_locators(self) -> Dict[str, Locator]:
+        """
+        Returns:
+            Dict[str, Locator]: The locators that must match while a hit's modal is open.
+        """
+        return {'word_elements': self.word_elements, 'context': self.context(1),
+                'lemma': self.lemma, 'grammar': self.grammar,
+                'modal_close_button': self.modal_close_button}
+
+
+def compile_config(raw: Dict[str, Any]) -> CompiledConfig:
+    """
+    Validates and compiles a loaded configuration.
+
+    Args:
+        raw (Dict[str, Any]): The configuration as returned by load_config.
+
+    Returns:
+        CompiledConfig: The compiled configuration.
+
+    Raises:
+        ConfigError: If the schema or any selector is invalid.
+    """
+    return CompiledConfig(raw)
+
+
+def load_compiled_config(path: Path) -> CompiledConfig:
+    """
+    Loads and compiles a configuration file.
+
+    Args:
+        path (Path): The path to the JSON file to be loaded.
+
+    Returns:
+        CompiledConfig: The compiled configuration.
+    """
+    return compile_config(load_config(path))
+
+
+def check_fixture(config: CompiledConfig, page_source: str) -> List[str]:
+    """
+    Dry-runs the locators against a saved results page with an open hit modal.
+
+    Args:
+        config (CompiledConfig): The compiled configuration.
+        page_source (str): HTML of the saved page.
+
+    Returns:
+        List[str]: Names of the locators that match nothing on the page.
+    """
+    tree = lxml_html.fromstring(page_source)
+
+    def matches(locator: Locator) -> bool:
+        strategy, selector = locator
+        if strategy == XPATH:
+            return bool(tree.xpath(selector))
+        return bool(tree.cssselect(selector))
+
+    missing = [name for name, locator in config.modal_locators().items()
+               if not matches(locator)]
+    if not any(matches(locator) for locator in config.syntax_features):
+        missing.append('syntax_features_option')
+    return missing
+
+
+def check_fixture_file(config: CompiledConfig, path: Path):
+    """
+    Dry-runs the locators against a saved page and fails on the first breakage.
+
+    Args:
+        config (CompiledConfig): The compiled configuration.
+        path (Path): The saved HTML page.
+
+    Raises:
+        ConfigError: If any locator matches nothing on the page.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        missing = check_fixture(config, file.read())
+    if missing:
+        raise ConfigError(f"selectors match nothing in {path}: {', '.join(missing)}")
+
+
+def compile_for_startup(raw: Dict[str, Any], config_path: Path) -> CompiledConfig:
+    """
+    Compiles a configuration and, if it names a 'selector_fixture' page,
+    dry-runs the locators against it, so that broken selectors stop the run
+    before a browser is started.
+
+    Args:
+        raw (Dict[str, Any]): The configuration as returned by load_config.
+        config_path (Path): Path of the configuration; the fixture path is relative to it.
+
+    Returns:
+        CompiledConfig: The compiled configuration.
+
+    Raises:
+        ConfigError: If the configuration or any selector is invalid.
+    """
+    config = compile_config(raw)
+    fixture = raw.get('selector_fixture')
+    if fixture:
+        check_fixture_file(config, Path(config_path).parent / fixture)
+    return config
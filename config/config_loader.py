@@ -3,7 +3,7 @@ Module for loading configuration from a JSON file.
 """
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
 from pathlib import Path
 
 
@@ -19,3 +19,112 @@ def load_config(path: Path) -> Dict[str, Any]:
     """
     with open(path, 'r', encoding='utf-8') as file:
         return json.load(file)
+
+
+REQUIRED_KEYS = {'seed_url': str, 'x_paths': dict, 'timeout': int}
+REQUIRED_X_PATHS = ('search_input', 'word_elements', 'lemma', 'grammar',
+                    'syntax_features_option', 'modal_close', 'next_page_button')
+OPTIONAL_X_PATHS = ('empty_results',)
+BACKENDS = ('selenium', 'playwright')
+DEFAULT_BROWSER_CONTEXTS = 4
+DRIVER_RECYCLING = {'max_rss_mb': 2048, 'max_hits': 3000, 'max_latency_drift': 3.0,
+                    'prewarm_ratio': 0.8, 'max_restore_pages': 3, 'metrics_path': None}
+
+
+def validate_driver_recycling(recycling: Any) -> List[str]:
+    """
+    Checks the 'driver_recycling' section of a configuration.
+
+    Args:
+        recycling (Any): The section.
+
+    Returns:
+        List[str]: Human readable problems, empty if the section is valid.
+    """
+    if not isinstance(recycling, dict):
+        return ["'driver_recycling' must be an object"]
+    errors = []
+    for key, value in recycling.items():
+        if key not in DRIVER_RECYCLING:
+            errors.append(f"unknown driver_recycling key '{key}'")
+        elif key == 'metrics_path':
+            if value is not None and not isinstance(value, str):
+                errors.append("'driver_recycling.metrics_path' must be a string or null")
+        elif isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            errors.append(f"'driver_recycling.{key}' must be a positive number")
+    return errors
+
+
+def validate_browser(config: Dict[str, Any]) -> List[str]:
+    """
+    Checks the optional browser settings of a configuration.
+
+    Args:
+        config (Dict[str, Any]): The loaded configuration.
+
+    Returns:
+        List[str]: Human readable problems, empty if the settings are valid.
+    """
+    errors = []
+    browser_args = config.get('browser_args', [])
+    if not isinstance(browser_args, list) or not all(isinstance(arg, str) for arg in browser_args):
+        errors.append("'browser_args' must be a list of strings")
+    contexts = config.get('browser_contexts', DEFAULT_BROWSER_CONTEXTS)
+    if isinstance(contexts, bool) or not isinstance(contexts, int) or contexts <= 0:
+        errors.append("'browser_contexts' must be a positive integer")
+    executable = config.get('browser_executable')
+    if executable is not None and not isinstance(executable, str):
+        errors.append("'browser_executable' must be a string or null")
+    return errors
+
+
+def validate_x_paths(x_paths: Dict[str, Any]) -> List[str]:
+    """
+    Checks the 'x_paths' section of a configuration.
+
+    Args:
+        x_paths (Dict[str, Any]): The section.
+
+    Returns:
+        List[str]: Human readable problems, empty if the section is valid.
+    """
+    errors = []
+    for key in REQUIRED_X_PATHS:
+        if key not in x_paths:
+            errors.append(f"missing x_paths key '{key}'")
+        elif key == 'syntax_features_option':
+            if not isinstance(x_paths[key], list) or not x_paths[key]:
+                errors.append("'x_paths.syntax_features_option' must be a non-empty list")
+        elif not isinstance(x_paths[key], str) or not x_paths[key]:
+            errors.append(f"'x_paths.{key}' must be a non-empty string")
+    for key in OPTIONAL_X_PATHS:
+        if key in x_paths and (not isinstance(x_paths[key], str) or not x_paths[key]):
+            errors.append(f"'x_paths.{key}' must be a non-empty string")
+    return errors
+
+
+def validate_config(config: Dict[str, Any]) -> List[str]:
+    """
+    Checks that a configuration contains everything the scrappers need.
+
+    Args:
+        config (Dict[str, Any]): The loaded configuration.
+
+    Returns:
+        List[str]: Human readable problems, empty if the configuration is valid.
+    """
+    errors = []
+    for key, expected_type in REQUIRED_KEYS.items():
+        if key not in config:
+            errors.append(f"missing key '{key}'")
+        elif not isinstance(config[key], expected_type):
+            errors.append(f"'{key}' must be of type {expected_type.__name__}")
+    if isinstance(config.get('timeout'), int) and not 0 < config['timeout'] < 60:
+        errors.append("'timeout' must be between 0 and 60 seconds")
+    if config.get('backend', 'selenium') not in BACKENDS:
+        errors.append(f"'backend' must be one of {', '.join(BACKENDS)}")
+    errors.extend(validate_driver_recycling(config.get('driver_recycling', {})))
+    errors.extend(validate_browser(config))
+    if isinstance(config.get('x_paths'), dict):
+        errors.extend(validate_x_paths(config['x_paths']))
+    return errors
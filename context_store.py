@@ -0,0 +1,318 @@
+"""
+Module for content-addressed storage of scraped contexts.
+
+The same sentence is sometimes returned for several hits (several target
+wordforms in one sentence, or reflexive and non-reflexive verbs sharing a
+sentence). The first record of a sentence keeps its context inline; records
+repeating it keep only a hash, and the text is stored once in a shared table.
+"""
+
+import hashlib
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from records import Records, load_word_data, scraped_words
+
+STORE_NAME = 'contexts.jsonl'
+CONTEXT_FIELD = 'контекст'
+CONTEXT_ID_FIELD = 'контекст_id'
+
+
+def context_hash(text: str) -> str:
+    """
+    Computes the content address of a context.
+
+    Args:
+        text (str): The context text.
+
+    Returns:
+        str: A short hexadecimal digest identifying the text.
+    """
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def hit_key(context_id: str, wordform: str, occurrence: int) -> str:
+    """
+    Builds the key identifying a single hit independently of the search it came from.
+
+    Args:
+        context_id (str): The hash of the sentence containing the hit.
+        wordform (str): The highlighted wordform.
+        occurrence (int): Ordinal of this wordform within the sentence, starting at 1.
+
+    Returns:
+        str: The hit key.
+    """
+    return f"{context_id}:{wordform}:{occurrence}"
+
+
+def next_hit_key(occurrences: Counter, context_text: str, wordform: str) -> str:
+    """
+    Counts a hit of a word's search and builds its key.
+
+    Args:
+        occurrences (Counter): Number of times each (context, wordform) pair
+            has been seen during the current word; updated in place.
+        context_text (str): The sentence containing the hit.
+        wordform (str): The highlighted wordform.
+
+    Returns:
+        str: The hit key, see hit_key.
+    """
+    context_id = context_hash(context_text)
+    occurrences[(context_id, wordform)] += 1
+    return hit_key(context_id, wordform, occurrences[(context_id, wordform)])
+
+
+def record_context_id(record: Dict[str, Any]) -> Optional[str]:
+    """
+    Args:
+        record (Dict[str, Any]): A record with either 'контекст' or 'контекст_id'.
+
+    Returns:
+        Optional[str]: The hash of its context, None if it has none.
+    """
+    if record.get(CONTEXT_ID_FIELD):
+        return record[CONTEXT_ID_FIELD]
+    text = record.get(CONTEXT_FIELD)
+    return context_hash(text) if text is not None else None
+
+
+class ContextStore:
+    """
+    A shared table of repeated contexts addressed by hash, plus an index of already
+    processed hits so that duplicates can be skipped before their modal is opened.
+
+    Hits are not copied into the store. A hit key consists of the context hash and
+    the wordform, which the saved record already holds, and the occurrence of the
+    wordform within the sentence, so the store only keeps the occurrence of every
+    saved record and rebuilds the keys from the output files when first needed.
+    The backing file is append-only JSON lines, so saving after every word only
+    writes what is new.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initializes the ContextStore, loading previously saved tables if present.
+
+        Args:
+            path (Optional[Path]): Path of the JSON lines file backing the store;
+                hits refer to the output files in the same directory.
+        """
+        self.path = path
+        # None marks a context kept inline by the first record containing it
+        self.contexts: Dict[str, Optional[str]] = {}
+        self.occurrences: Dict[str, List[List[int]]] = {}
+        self.hits: Optional[Dict[str, Tuple[str, int, int]]] = None
+        # records of hits found by every search in progress, by hit key, until saved
+        self.pending: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.unsaved: List[Any] = []
+        self.word_data: Dict[str, Tuple[Records, Records]] = {}
+        if path is not None and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if line.strip():
+                        self._load_line(json.loads(line))
+
+    def _load_line(self, line: Any):
+        if isinstance(line, list):
+            key, text = line
+            self.contexts[key] = text
+        else:
+            self.occurrences[line['verb']] = line['occurrences']
+
+    def add_context(self, text: str) -> str:
+        """
+        Stores a context if it is not known yet.
+
+        Args:
+            text (str): The context text.
+
+        Returns:
+            str: The hash under which the context is stored.
+        """
+        key = context_hash(text)
+        if self.contexts.get(key) is None:
+            self.contexts[key] = text
+            self.unsaved.append([key, text])
+        return key
+
+    def deduplicate(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replaces the inline context of a record with a reference to the context table
+        if the same context was already saved with another record.
+
+        Args:
+            record (Dict[str, Any]): A record as produced by Scrapper.process_element.
+
+        Returns:
+            Dict[str, Any]: The record itself for a new context, otherwise the record
+            with 'контекст' replaced by 'контекст_id'.
+        """
+        text = record.get(CONTEXT_FIELD)
+        if text is None:
+            return record
+        key = context_hash(text)
+        self._hit_index()
+        if key not in self.contexts:
+            self.contexts[key] = None
+            return record
+        deduplicated = dict(record)
+        del deduplicated[CONTEXT_FIELD]
+        deduplicated[CONTEXT_ID_FIELD] = self.add_context(text)
+        return deduplicated
+
+    def resolve(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Inlines the context text of a record that references the context table.
+
+        Args:
+            record (Dict[str, Any]): A record with either 'контекст' or 'контекст_id'.
+
+        Returns:
+            Dict[str, Any]: The record with an inline 'контекст' field.
+        """
+        if CONTEXT_ID_FIELD not in record:
+            return record
+        resolved = dict(record)
+        key = resolved.pop(CONTEXT_ID_FIELD)
+        resolved[CONTEXT_FIELD] = self.contexts.get(key) if key is not None else None
+        return resolved
+
+    def _load_word_data(self, verb: str) -> Tuple[Records, Records]:
+        assert self.path is not None
+        if verb not in self.word_data:
+            self.word_data[verb] = load_word_data(str(Path(self.path).parent), verb)
+        return self.word_data[verb]
+
+    def _index_word(self, verb: str, data: Tuple[Records, Records]):
+        assert self.hits is not None
+        occurrences = self.occurrences.get(verb, [[], []])
+        for aspect, (records, numbers) in enumerate(zip(data, occurrences)):
+            if len(records) != len(numbers):
+                continue  # the output file was rewritten since, e.g. by 'cli.py reparse'
+            for index, (record, occurrence) in enumerate(zip(records, numbers)):
+                context_id = record_context_id(record)
+                if occurrence and context_id:
+                    key = hit_key(context_id, record.get('словоформа', ''), occurrence)
+                    self.hits[key] = (verb, aspect, index)
+
+    def _hit_index(self) -> Dict[str, Tuple[str, int, int]]:
+        """
+        Scans the output files once, indexing stored hits and inline contexts.
+        """
+        if self.hits is None:
+            self.hits = {}
+            if self.path is not None:
+                output_dir = str(Path(self.path).parent)
+                for verb in scraped_words(output_dir):
+                    data = load_word_data(output_dir, verb)
+                    for record in data[0] + data[1]:
+                        if record.get(CONTEXT_FIELD) is not None:
+                            self.contexts.setdefault(context_hash(record[CONTEXT_FIELD]), None)
+                    if verb in self.occurrences:
+                        self._index_word(verb, data)
+        return self.hits
+
+    def _stored_record(self, key: str) -> Optional[Dict[str, Any]]:
+        pointer = self._hit_index().get(key)
+        if pointer is None:
+            return None
+        verb, aspect, index = pointer
+        records = self._load_word_data(verb)[aspect]
+        record = records[index] if index < len(records) else None
+        context_id, rest = key.split(':', 1)
+        if record is None or record_context_id(record) != context_id or \
+                record.get('словоформа') != rest.rsplit(':', 1)[0]:
+            return None
+        return dict(record)
+
+    def get_hit(self, search: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a hit processed earlier in this run or stored in an output file.
+
+        The record is deduplicated again, so a hit reused for another word references
+        its context instead of repeating the inline text of the record it was found in.
+
+        Args:
+            search (str): The query whose results contain the hit.
+            key (str): The hit key, see hit_key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The record to save or None if the hit is new.
+        """
+        record = next((hits[key] for hits in self.pending.values() if key in hits), None)
+        if record is None:
+            record = self._stored_record(key)
+        if record is None:
+            return None
+        record = self.deduplicate(record)
+        self.pending.setdefault(search, {})[key] = record
+        return record
+
+    def add_hit(self, search: str, key: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Deduplicates the record of a processed hit and remembers it until it is saved,
+        see commit, or its search is released, see release.
+
+        Args:
+            search (str): The query whose results contain the hit.
+            key (str): The hit key, see hit_key.
+            record (Dict[str, Any]): The record of the hit.
+
+        Returns:
+            Dict[str, Any]: The deduplicated record, which is the one to save.
+        """
+        record = self.deduplicate(record)
+        self.pending.setdefault(search, {})[key] = record
+        return record
+
+    def commit(self, word: str, perfective: Records, imperfective: Records):
+        """
+        Records the occurrence of every hit among a word's records, as they are saved.
+
+        Args:
+            word (str): The word whose records are being saved.
+            perfective (Records): Its perfective records.
+            imperfective (Records): Its imperfective records.
+        """
+        keys = {id(record): (search, key) for search, hits in self.pending.items()
+                for key, record in hits.items()}
+        occurrences = []
+        for records in (perfective, imperfective):
+            numbers = []
+            for record in records:
+                search, key = keys.get(id(record), ('', ''))
+                numbers.append(int(key.rsplit(':', 1)[1]) if key else 0)
+                if key:
+                    del self.pending[search][key]
+            occurrences.append(numbers)
+        self.occurrences[word] = occurrences
+        self.unsaved.append({'verb': word, 'occurrences': occurrences})
+        self.word_data.pop(word, None)
+        if self.hits is not None:
+            self._index_word(word, (perfective, imperfective))
+
+    def release(self, search: str):
+        """
+        Forgets the hits of a search that were not saved, once its words are saved
+        or dropped.
+
+        Args:
+            search (str): The query, as passed to add_hit and get_hit.
+        """
+        self.pending.pop(search, None)
+
+    def save(self):
+        """
+        Appends the contexts and hit occurrences added since the last save to the backing file.
+        """
+        if self.path is None or not self.unsaved:
+            return
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.writelines(json.dumps(line, ensure_ascii=False, separators=(',', ':')) + '\n'
+                            for line in self.unsaved)
+        self.unsaved = []
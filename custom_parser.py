@@ -2,12 +2,15 @@
 Parser module for web elements using Selenium.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException, TimeoutException, WebDriverException)
+
+from config.compiled_config import CompiledConfig, compile_config
 
 
 class Parser:
@@ -15,17 +18,19 @@ class Parser:
     A class used to parse web elements on a page using Selenium.
     """
 
-    def __init__(self, driver: WebDriver, config: Dict):
+    def __init__(self, driver: WebDriver, config: Union[Dict, CompiledConfig]):
         """
         Initializes the Parser with a WebDriver and configuration.
 
         Args:
             driver (WebDriver): The WebDriver instance to use.
-            config (Dict): A dictionary containing configuration parameters.
+            config (Union[Dict, CompiledConfig]): A dictionary containing configuration
+                parameters, or its compiled form.
         """
+        self.compiled = config if isinstance(config, CompiledConfig) else compile_config(config)
         self.driver = driver
-        self.config = config
-        self.wait = WebDriverWait(driver, config["timeout"])
+        self.config = self.compiled.raw
+        self.wait = WebDriverWait(driver, self.compiled.timeout)
 
     def extract_context(self, position: int) -> Optional[str]:
         """
@@ -37,17 +42,29 @@ class Parser:
         Returns:
             Optional[str]: The extracted context text or None if extraction fails.
         """
-        context_xpath = (
-            f"(//span[@class='hit word'])[position()={position}]"
-            "/ancestor::p[contains(@class, 'seq-with-actions')]"
-        )
         try:
             return self.wait.until(EC.visibility_of_element_located(
-                (By.XPATH, context_xpath))).text
+                self.compiled.context(position))).text
         except (NoSuchElementException, TimeoutException) as e:
             print(f"Error extracting context: {e}")
             return None
 
+    def extract_element_context(self, element: WebElement) -> Optional[str]:
+        """
+        Extracts the context text of a hit element without opening its modal.
+
+        Args:
+            element (WebElement): The hit element whose sentence should be read.
+
+        Returns:
+            Optional[str]: The extracted context text or None if extraction fails.
+        """
+        try:
+            return element.find_element(*self.compiled.element_context).text
+        except (NoSuchElementException, WebDriverException) as e:
+            print(f"Error extracting element context: {e}")
+            return None
+
     def extract_lemma(self) -> Optional[str]:
         """
         Extracts the lemma text from the current page.
@@ -56,8 +73,7 @@ class Parser:
             Optional[str]: The extracted lemma text or None if extraction fails.
         """
         try:
-            return self.wait.until(EC.visibility_of_element_located(
-                (By.XPATH, self.config["x_paths"]["lemma"]))).text
+            return self.wait.until(EC.visibility_of_element_located(self.compiled.lemma)).text
         except (NoSuchElementException, TimeoutException) as e:
             print(f"Error extracting lemma: {e}")
             return None
@@ -70,8 +86,7 @@ class Parser:
             Optional[str]: The extracted grammar information or None if extraction fails.
         """
         try:
-            return self.wait.until(EC.visibility_of_element_located(
-                (By.XPATH, self.config["x_paths"]["grammar"]))).text
+            return self.wait.until(EC.visibility_of_element_located(self.compiled.grammar)).text
         except (NoSuchElementException, TimeoutException) as e:
             print(f"Error extracting grammar: {e}")
             return None
@@ -83,9 +98,9 @@ class Parser:
         Returns:
             Optional[str]: The extracted syntax features text or None if all attempts fail.
         """
-        for xpath in self.config["x_paths"]["syntax_features_option"]:
+        for locator in self.compiled.syntax_features:
             try:
-                element_present = EC.presence_of_element_located((By.XPATH, xpath))
+                element_present = EC.presence_of_element_located(locator)
                 return self.wait.until(element_present).text
             except (NoSuchElementException, TimeoutException):
                 continue
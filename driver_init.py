@@ -2,16 +2,23 @@
 Module for initializing a Selenium WebDriver instance.
 """
 
+from typing import List, Optional
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
 
-def init_driver(headless: bool = True) -> webdriver.Chrome:
+def init_driver(headless: bool = True, performance_log: bool = False,
+                browser_args: Optional[List[str]] = None) -> webdriver.Chrome:
     """
     Initializes and returns a Selenium WebDriver instance for Chrome.
 
     Args:
         headless (bool): Determines whether to run the browser in headless mode.
+        performance_log (bool): Enables Chrome's performance log, which carries
+            the DevTools network events the recorder reads.
+        browser_args (Optional[List[str]]): Additional Chrome flags, such as
+            the ones sending all requests to the replay server.
 
     Returns:
         webdriver.Chrome: An instance of Chrome WebDriver with the specified options.
@@ -23,5 +30,10 @@ def init_driver(headless: bool = True) -> webdriver.Chrome:
 
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-gpu")
+    for argument in browser_args or []:
+        options.add_argument(argument)
+
+    if performance_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
     return webdriver.Chrome(options=options)
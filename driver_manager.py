@@ -0,0 +1,294 @@
+"""
+Module for monitoring WebDriver health and recycling long-running browsers.
+
+Long Selenium sessions leak memory and get slower. DriverManager tracks the
+RSS of the browser process tree, the round-trip latency of a trivial command
+and the number of processed hits, and replaces the browser once a configured
+threshold is crossed. A replacement is started in the background as soon as
+a metric gets close to its threshold, so the swap itself costs no idle time.
+Every check appends a metrics sample to the configured metrics file.
+"""
+
+import json
+import statistics
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from selenium.common import WebDriverException
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from process_metrics import tree_rss_bytes
+
+MB = 1024 ** 2
+BASELINE_PROBES = 5
+RECENT_PROBES = 5
+
+
+class DriverSession:
+    """
+    A running driver and its health measurements since it was started.
+    """
+
+    def __init__(self, driver: WebDriver):
+        """
+        Initializes the DriverSession.
+
+        Args:
+            driver (WebDriver): The driver, just started.
+        """
+        self.driver = driver
+        self.started = time.time()
+        self.hits = 0
+        self.latencies: List[float] = []
+
+    def probe_latency(self) -> float:
+        """
+        Measures the round trip of a trivial command.
+
+        Returns:
+            float: The latency in milliseconds.
+        """
+        start = time.perf_counter()
+        self.driver.execute_script("return 1;")
+        latency = (time.perf_counter() - start) * 1000
+        self.latencies.append(latency)
+        return latency
+
+    def latency_drift(self) -> float:
+        """
+        Returns:
+            float: Recent median latency divided by the median of the first probes,
+            1.0 until enough probes were made.
+        """
+        if len(self.latencies) < BASELINE_PROBES + RECENT_PROBES:
+            return 1.0
+        baseline = statistics.median(self.latencies[:BASELINE_PROBES])
+        recent = statistics.median(self.latencies[-RECENT_PROBES:])
+        return recent / baseline if baseline > 0 else 1.0
+
+
+class DriverManager:
+    """
+    Owns the active WebDriver, measures it and recycles it at thresholds.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], thresholds: Dict[str, Any],
+                 warm_url: Optional[str] = None):
+        """
+        Initializes the DriverManager and starts the first driver.
+
+        Args:
+            factory (Callable[[], WebDriver]): Creates a new driver.
+            thresholds (Dict[str, Any]): 'max_rss_mb', 'max_hits', 'max_latency_drift',
+                'prewarm_ratio', 'max_restore_pages' and 'metrics_path',
+                see the 'driver_recycling' config key.
+            warm_url (Optional[str]): Page a pre-warmed driver opens before it is used.
+        """
+        self.factory = factory
+        self.thresholds = thresholds
+        self.warm_url = warm_url
+        self.session = DriverSession(factory())
+        self.spare: Optional[Future] = None
+        self.events: List[Dict[str, Any]] = []
+        # starts pre-warmed drivers and quits recycled ones in the background
+        self.executor = ThreadPoolExecutor(max_workers=2)
+
+    @property
+    def driver(self) -> WebDriver:
+        """
+        Returns:
+            WebDriver: The active driver.
+        """
+        return self.session.driver
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns:
+            int: Hits processed by the active driver.
+        """
+        return self.session.hits
+
+    def rss_mb(self) -> float:
+        """
+        Returns:
+            float: Resident memory of the active browser process tree in MB.
+        """
+        try:
+            pid = self.driver.service.process.pid
+        except AttributeError:
+            return 0.0
+        return tree_rss_bytes(pid) / MB
+
+    def probe_latency(self) -> float:
+        """
+        Measures the round trip of a trivial command on the active driver.
+
+        Returns:
+            float: The latency in milliseconds.
+        """
+        return self.session.probe_latency()
+
+    def latency_drift(self) -> float:
+        """
+        Returns:
+            float: Latency drift of the active driver, see DriverSession.latency_drift.
+        """
+        return self.session.latency_drift()
+
+    def sample(self, rss_mb: float) -> Dict[str, Any]:
+        """
+        Args:
+            rss_mb (float): The measured memory of the active driver.
+
+        Returns:
+            Dict[str, Any]: A metrics sample of the active driver, as exported.
+        """
+        latencies = self.session.latencies
+        return {
+            'type': 'sample',
+            'time': time.time(),
+            'rss_mb': round(rss_mb, 1),
+            'hits': self.session.hits,
+            'latency_ms': round(latencies[-1], 2) if latencies else None,
+            'latency_drift': round(self.session.latency_drift(), 2),
+            'uptime_s': round(time.time() - self.session.started, 1),
+        }
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Current health metrics of the active driver and
+            the recycle events so far.
+        """
+        metrics = self.sample(self.rss_mb())
+        del metrics['type'], metrics['time']
+        metrics['drivers_started'] = len(self.events) + 1
+        metrics['recycles'] = self.events
+        return metrics
+
+    def _usage(self, rss_mb: float) -> Dict[str, float]:
+        """
+        Expresses every metric as a fraction of its threshold.
+        """
+        return {
+            'rss': rss_mb / self.thresholds['max_rss_mb'],
+            'hits': self.hits / self.thresholds['max_hits'],
+            'latency': self.latency_drift() / self.thresholds['max_latency_drift'],
+        }
+
+    def record_hits(self, hits: int):
+        """
+        Adds processed hits to the count of the active driver.
+
+        Args:
+            hits (int): The number of hits.
+        """
+        self.session.hits += hits
+
+    def checkpoint(self, defer: bool = False) -> bool:
+        """
+        Measures the active driver, exports a metrics sample and recycles
+        the driver if a threshold is exceeded.
+
+        Call between pages or words, where a browser swap loses no progress.
+
+        Args:
+            defer (bool): Only pre-warm a replacement when a threshold is exceeded
+                and leave the swap to the next checkpoint that is not deferred, for
+                callers that cannot cheaply restore their position. An unresponsive
+                driver is replaced regardless.
+
+        Returns:
+            bool: True if the driver was replaced; callers must switch to self.driver
+            and restore their position in the new browser.
+        """
+        try:
+            self.probe_latency()
+        except WebDriverException as e:
+            print(f"Driver did not respond, recycling: {e}")
+            self.recycle({'unresponsive': 1.0})
+            return True
+        rss_mb = self.rss_mb()
+        self.export(self.sample(rss_mb))
+        usage = self._usage(rss_mb)
+        if max(usage.values()) >= 1.0 and not defer:
+            self.recycle(usage)
+            return True
+        if max(usage.values()) >= self.thresholds['prewarm_ratio']:
+            self.prewarm()
+        return False
+
+    def _start_spare(self) -> Optional[WebDriver]:
+        try:
+            driver = self.factory()
+            if self.warm_url:
+                driver.get(self.warm_url)
+            return driver
+        except WebDriverException as e:
+            print(f"Error pre-warming driver: {e}")
+            return None
+
+    def prewarm(self):
+        """
+        Starts a replacement driver in the background if none is pending.
+        """
+        if self.spare is None:
+            self.spare = self.executor.submit(self._start_spare)
+
+    def recycle(self, usage: Dict[str, float]):
+        """
+        Replaces the active driver with the pre-warmed one, or a new one,
+        and quits the old driver in the background.
+
+        Args:
+            usage (Dict[str, float]): Metrics relative to their thresholds, for the log.
+        """
+        event = self.sample(self.rss_mb())
+        event['type'] = 'recycle'
+        event['reason'] = sorted(name for name, value in usage.items() if value >= 1.0)
+        new_driver = self.spare.result() if self.spare is not None else None
+        self.spare = None
+        event['prewarmed'] = new_driver is not None
+        if new_driver is None:
+            new_driver = self.factory()
+
+        self.executor.submit(self._quit, self.driver)
+        self.session = DriverSession(new_driver)
+        self.events.append(event)
+        self.export(event)
+        print(f"Recycled driver: {event}")
+
+    @staticmethod
+    def _quit(driver: WebDriver):
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            print(f"Error quitting recycled driver: {e}")
+
+    def export(self, entry: Dict[str, Any]):
+        """
+        Appends a metrics sample or recycle event to the metrics file, if one is configured.
+
+        Args:
+            entry (Dict[str, Any]): The sample or event; its 'type' tells them apart.
+        """
+        path = self.thresholds.get('metrics_path')
+        if not path:
+            return
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def close(self):
+        """
+        Quits the active driver and the pre-warmed one, if any, and waits
+        for recycled drivers to shut down.
+        """
+        if self.spare is not None:
+            spare = self.spare.result()
+            if spare is not None:
+                self._quit(spare)
+            self.spare = None
+        self.executor.shutdown(wait=True)
+        self.driver.quit()
@@ -6,10 +6,15 @@ from typing import Optional, Any, Tuple, List, Dict
 from pathlib import Path
 
 from selenium.common import WebDriverException
+from selenium.webdriver.chrome.webdriver import WebDriver
 
 from scrapper import Scrapper
+from batching import batch_query, route_records
+from context_store import ContextStore
 from config.config_loader import load_config
+from config.compiled_config import compile_for_startup
 from driver_init import init_driver
+from driver_manager import DriverManager
 
 CONFIG_PATH = Path(__file__).parent.parent / 'scrapper_config.json'
 
@@ -17,18 +22,40 @@ CONFIG_PATH = Path(__file__).parent.parent / 'scrapper_config.json'
 class FacadeAPI:
     """
     FacadeAPI serves as a high-level interface to interact with the Scrapper class.
+
+    The browser is owned by a DriverManager, which replaces it between words or
+    results pages once it grows too large or too slow.
     """
 
-    def __init__(self, config_path: Path = CONFIG_PATH):
+    def __init__(self, config_path: Path = CONFIG_PATH,
+                 context_store: Optional[ContextStore] = None):
         """
         Initialize the FacadeAPI with configurations and a Scrapper instance.
 
         Args:
             config_path (str): Path to the configuration JSON file.
+            context_store (Optional[ContextStore]): Shared context table used
+                to deduplicate contexts and already seen hits.
+
+        Raises:
+            ConfigError: If the configuration or its selectors are invalid;
+                raised before the browser is started.
         """
         self.config = load_config(config_path)
-        self.driver = init_driver(self.config.get("headless", True))
-        self.scrapper = Scrapper(self.driver, self.config)
+        compiled = compile_for_startup(self.config, config_path)
+        self.driver_manager = DriverManager(
+            lambda: init_driver(compiled.headless, browser_args=compiled.browser_args),
+            compiled.driver_recycling, compiled.seed_url)
+        self.scrapper = Scrapper(self.driver_manager.driver, compiled, context_store,
+                                 self.driver_manager)
+
+    @property
+    def driver(self) -> WebDriver:
+        """
+        Returns:
+            WebDriver: The currently active WebDriver.
+        """
+        return self.driver_manager.driver
 
     def process_word(self, word: str) -> (
             Optional)[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
@@ -42,16 +69,67 @@ class FacadeAPI:
             Optional[Dict[str, Any]]:
             Scraped data associated with the word, or None if an error occurs.
         """
+        walk = self.walk(word)
+        return None if walk is None else walk[:2]
+
+    def walk(self, query: str) -> (
+            Optional)[Tuple[List[Dict[str, Any]], List[Dict[str, Any]], bool]]:
+        """
+        Searches for a query and collects the data of all its results pages.
+
+        Args:
+            query (str): A word, or several OR'ed with '|'.
+
+        Returns:
+            Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]], bool]]:
+            Scraped data and whether the last results page was reached,
+            see Scrapper.walk, or None if an error occurs.
+        """
         try:
+            self.scrapper.checkpoint()
             self.scrapper.navigate_to_search()
-            self.scrapper.input_word(word)
-            return self.scrapper.collect_data(word)
+            self.scrapper.input_word(query)
+            return self.scrapper.walk(query)
         except WebDriverException as e:
-            print(f"Error processing word '{word}': {e}")
+            print(f"Error processing word '{query}': {e}")
             return None
 
+    def process_batch(self, words: List[str]) -> (
+            Optional)[Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]]:
+        """
+        Processes several words with one search for any of their lemmas and
+        splits the collected data between them by the 'лемма' field.
+
+        Args:
+            words (List[str]): The words to be processed and scraped together.
+
+        Returns:
+            Optional[Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]]:
+            Scraped data of every word, or None if an error occurs or the results
+            pages could not be walked to the end, as the data would be partial.
+        """
+        walk = self.walk(batch_query(words))
+        if walk is None:
+            return None
+        perfective, imperfective, complete = walk
+        if not complete:
+            print(f"Batch '{batch_query(words)}' stopped before its last results page")
+            return None
+        routed, unrouted = route_records(words, perfective, imperfective)
+        if unrouted:
+            print(f"{unrouted} records of batch '{batch_query(words)}' "
+                  f"matched none of its lemmas")
+        return routed
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Health metrics of the browser and its recycle events.
+        """
+        return self.driver_manager.metrics()
+
     def close(self):
         """
-        Closes the WebDriver instance to clean up resources.
+        Closes the WebDriver instance, and a pre-warmed one if any, to clean up resources.
         """
-        self.scrapper.close_driver()
+        self.driver_manager.close()
@@ -0,0 +1,37 @@
+"""
+Module with the request handler shared by the local test servers.
+
+The mock site used by the benchmarks and the replay server both answer the
+browser from a background thread and should not log every request.
+"""
+
+from http.server import BaseHTTPRequestHandler
+from typing import Dict
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    """
+    A request handler that does not log requests and sends whole bodies.
+    """
+
+    def send_content(self, status: int, headers: Dict[str, str], content: bytes):
+        """
+        Sends a complete response.
+
+        Args:
+            status (int): The response status.
+            headers (Dict[str, str]): Response headers besides Content-Length.
+            content (bytes): The body; omitted for HEAD requests.
+        """
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(content)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """
+        Silences request logging.
+        """
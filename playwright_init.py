@@ -0,0 +1,32 @@
+"""
+Module for launching a headless browser through Playwright.
+"""
+
+from typing import List, Optional, Tuple
+
+from playwright.async_api import async_playwright, Browser, Playwright
+
+
+async def init_browser(headless: bool = True, executable_path: Optional[str] = None,
+                       browser_args: Optional[List[str]] = None) -> Tuple[Playwright, Browser]:
+    """
+    Starts Playwright and launches a single Chromium process that can host
+    many isolated browser contexts.
+
+    Args:
+        headless (bool): Determines whether to run the browser in headless mode.
+        executable_path (Optional[str]): Path to a locally installed Chromium;
+            the browser bundled with Playwright is used when omitted.
+        browser_args (Optional[List[str]]): Additional Chromium flags, such as
+            the ones sending all requests to the replay server.
+
+    Returns:
+        Tuple[Playwright, Browser]: The Playwright instance, which has to be stopped
+        after the browser is closed, and the launched browser.
+    """
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(
+        headless=headless,
+        executable_path=executable_path,
+        args=["--no-sandbox", "--disable-gpu", *(browser_args or [])])
+    return playwright, browser
@@ -0,0 +1,94 @@
+"""
+Module for measuring memory usage of browser process trees.
+
+Uses the Linux /proc filesystem; on other platforms the functions report zero.
+"""
+
+import os
+from pathlib import Path
+from typing import List
+
+PROC = Path('/proc')
+
+
+def child_pids(pid: int) -> List[int]:
+    """
+    Lists the direct children of a process.
+
+    Args:
+        pid (int): The parent process id.
+
+    Returns:
+        List[int]: Ids of the child processes.
+    """
+    children: List[int] = []
+    for task in (PROC / str(pid) / 'task').glob('*'):
+        try:
+            children.extend(int(child) for child in (task / 'children').read_text().split())
+        except OSError:
+            continue
+    return children
+
+
+def descendant_pids(pid: int) -> List[int]:
+    """
+    Lists all descendants of a process.
+
+    Args:
+        pid (int): The root process id.
+
+    Returns:
+        List[int]: Ids of the descendant processes, the root excluded.
+    """
+    descendants: List[int] = []
+    pending = child_pids(pid)
+    while pending:
+        child = pending.pop()
+        descendants.append(child)
+        pending.extend(child_pids(child))
+    return descendants
+
+
+def rss_bytes(pid: int) -> int:
+    """
+    Reads the resident set size of a single process.
+
+    Args:
+        pid (int): The process id.
+
+    Returns:
+        int: The resident set size in bytes, 0 if it cannot be read.
+    """
+    try:
+        for line in (PROC / str(pid) / 'status').read_text().splitlines():
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def tree_rss_bytes(pid: int, include_root: bool = True) -> int:
+    """
+    Sums the resident set size of a process and all its descendants.
+
+    Args:
+        pid (int): The root process id.
+        include_root (bool): Whether the root process itself is counted.
+
+    Returns:
+        int: The total resident set size in bytes.
+    """
+    total = sum(rss_bytes(child) for child in descendant_pids(pid))
+    return total + rss_bytes(pid) if include_root else total
+
+
+def children_rss_bytes() -> int:
+    """
+    Sums the resident set size of all processes started by the current one,
+    e.g. chromedriver and Chrome, or the Playwright driver and its browser.
+
+    Returns:
+        int: The total resident set size in bytes.
+    """
+    return tree_rss_bytes(os.getpid(), include_root=False)
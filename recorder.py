@@ -0,0 +1,284 @@
+"""
+Module for recording real scraping runs into a replayable archive.
+
+The recorder drives the ordinary Scrapper against the live site with Chrome's
+performance log enabled. It captures every network response from the DevTools
+Network events, CORS preflight requests included, and the page source at each
+search, results page and open hit modal. The archive can then be served by
+replay_server.py, see replay_archive.py for the format.
+
+Example:
+
+    python cli.py record абонировать атаковать --archive recordings/run.zip
+
+With --fixture, the first recorded page with an open hit modal is also saved
+as the page compile_for_startup checks the selectors against.
+"""
+
+import base64
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from selenium.common import WebDriverException
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from config.compiled_config import CompiledConfig, compile_for_startup
+from config.config_loader import load_config
+from custom_parser import Parser
+from driver_init import init_driver
+from replay_archive import ArchiveWriter, ReplayArchive, request_url
+from scrapper import Scrapper
+
+
+class NetworkRecorder:
+    """
+    Turns DevTools Network events from the performance log into archive entries.
+    """
+
+    def __init__(self, driver: WebDriver, writer: ArchiveWriter):
+        """
+        Initializes the NetworkRecorder.
+
+        Args:
+            driver (WebDriver): A Chrome driver started with the performance log enabled.
+            writer (ArchiveWriter): The archive to write responses to.
+        """
+        self.driver = driver
+        self.writer = writer
+        self.pending: Dict[str, Dict[str, Any]] = {}
+
+    def drain(self):
+        """
+        Reads the performance log collected since the previous call and records
+        all finished responses. Bodies are only available while their page is
+        open, so call it before navigating away.
+        """
+        for entry in self.driver.get_log('performance'):
+            self.handle(json.loads(entry['message'])['message'])
+
+    def handle(self, message: Dict[str, Any]):
+        """
+        Processes one DevTools event.
+
+        Args:
+            message (Dict[str, Any]): The event with its 'method' and 'params'.
+        """
+        method, params = message.get('method'), message.get('params', {})
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            request = params['request']
+            if not request['url'].startswith(('http://', 'https://')):
+                return
+            redirect = params.get('redirectResponse')
+            previous = self.pending.pop(request_id, None)
+            # a redirect to an address that is replayed as the same one would loop
+            if redirect is not None and previous is not None and \
+                    request_url(previous['url']) != request_url(request['url']):
+                self.writer.add_response(previous, redirect, b'',
+                                         (params['timestamp'] - previous['started']) * 1000)
+            self.pending[request_id] = {
+                'method': request['method'], 'url': request['url'],
+                'post_data': self.post_data(request_id, request),
+                'started': params['timestamp'], 'response': None}
+        elif method == 'Network.responseReceived' and request_id in self.pending:
+            request = self.pending[request_id]
+            request['response'] = params['response']
+            # CORS preflights have no body and may not report loadingFinished
+            if request['method'].upper() == 'OPTIONS':
+                del self.pending[request_id]
+                self.writer.add_response(request, request['response'], b'',
+                                         (params['timestamp'] - request['started']) * 1000)
+        elif method == 'Network.loadingFinished' and request_id in self.pending:
+            request = self.pending.pop(request_id)
+            if request['response'] is not None:
+                self.writer.add_response(request, request['response'],
+                                         self.response_body(request_id),
+                                         (params['timestamp'] - request['started']) * 1000)
+        elif method == 'Network.loadingFailed':
+            self.pending.pop(request_id, None)
+
+    def post_data(self, request_id: str, request: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Returns:
+            Optional[bytes]: The body of a request, fetched from Chrome if the
+            event did not include it.
+        """
+        if 'postData' in request:
+            return request['postData'].encode('utf-8')
+        if not request.get('hasPostData'):
+            return None
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getRequestPostData',
+                                                 {'requestId': request_id})
+            return result['postData'].encode('utf-8')
+        except WebDriverException:
+            return None
+
+    def response_body(self, request_id: str) -> bytes:
+        """
+        Returns:
+            bytes: The decoded body of a finished response, empty if Chrome
+            no longer holds it.
+        """
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody',
+                                                 {'requestId': request_id})
+        except WebDriverException as e:
+            print(f"Error reading response body: {e}")
+            return b''
+        if result.get('base64Encoded'):
+            return base64.b64decode(result['body'])
+        return result['body'].encode('utf-8')
+
+
+class RecordingParser(Parser):
+    """
+    Parser that records the pages of its driver, including every open hit modal.
+    """
+
+    def __init__(self, driver: WebDriver, config: Union[Dict, CompiledConfig],
+                 writer: ArchiveWriter):
+        """
+        Initializes the RecordingParser.
+
+        Args:
+            driver (WebDriver): A Chrome driver started with the performance log enabled.
+            config (Union[Dict, CompiledConfig]): The configuration.
+            writer (ArchiveWriter): The archive to write to.
+        """
+        super().__init__(driver, config)
+        self.writer = writer
+        self.network = NetworkRecorder(driver, writer)
+        self.word: Optional[str] = None
+
+    def snapshot(self, kind: str):
+        """
+        Records the current page source and the network responses so far.
+
+        Args:
+            kind (str): 'search', 'results' or 'modal'.
+        """
+        try:
+            self.network.drain()
+            self.writer.add_snapshot(kind, self.driver.page_source,
+                                     self.driver.current_url, word=self.word)
+        except WebDriverException as e:
+            print(f"Error recording {kind} snapshot: {e}")
+
+    def extract_lemma(self) -> Optional[str]:
+        """
+        Extracts the lemma, which waits for the modal, then snapshots the modal state.
+
+        Returns:
+            Optional[str]: The extracted lemma text or None if extraction fails.
+        """
+        lemma = super().extract_lemma()
+        self.snapshot('modal')
+        return lemma
+
+
+class RecordingScrapper(Scrapper):
+    """
+    Scrapper that records the pages it visits.
+    """
+
+    parser: RecordingParser
+
+    def __init__(self, driver: WebDriver, config: Union[Dict, CompiledConfig],
+                 writer: ArchiveWriter):
+        """
+        Initializes the RecordingScrapper.
+
+        Args:
+            driver (WebDriver): A Chrome driver started with the performance log enabled.
+            config (Union[Dict, CompiledConfig]): The configuration.
+            writer (ArchiveWriter): The archive to write to.
+        """
+        self.writer = writer
+        super().__init__(driver, config)
+
+    def make_parser(self, driver: WebDriver) -> RecordingParser:
+        """
+        Returns:
+            RecordingParser: A Parser recording the pages of the driver.
+        """
+        return RecordingParser(driver, self.compiled, self.writer)
+
+    def navigate_to_search(self):
+        """
+        Opens the search page and snapshots it.
+        """
+        super().navigate_to_search()
+        self.parser.snapshot('search')
+
+    def collect_data(self, word: str):
+        """
+        Collects the data of a word, labelling its snapshots with the word.
+        """
+        self.parser.word = word
+        return super().collect_data(word)
+
+    def go_to_next_page(self) -> bool:
+        """
+        Snapshots the current results page before leaving it.
+        """
+        self.parser.snapshot('results')
+        return super().go_to_next_page()
+
+
+def record(words: List[str], archive_path: Path, config_path: Path) -> Dict[str, int]:
+    """
+    Scrapes words from the live site and records the run into an archive.
+
+    Args:
+        words (List[str]): The words to search for.
+        archive_path (Path): Where to write the archive.
+        config_path (Path): Path to the configuration JSON file.
+
+    Returns:
+        Dict[str, int]: Numbers of recorded responses, snapshots and scraped records.
+    """
+    compiled = compile_for_startup(load_config(config_path), config_path)
+    driver = init_driver(compiled.headless, performance_log=True)
+    records = 0
+    with ArchiveWriter(archive_path, compiled.seed_url) as writer:
+        scrapper = RecordingScrapper(driver, compiled, writer)
+        try:
+            for word in words:
+                try:
+                    scrapper.navigate_to_search()
+                    scrapper.input_word(word)
+                except WebDriverException as e:
+                    print(f"Error searching for '{word}': {e}")
+                    continue
+                perfective, imperfective = scrapper.collect_data(word)
+                records += len(perfective) + len(imperfective)
+            scrapper.parser.network.drain()
+        finally:
+            driver.quit()
+        return {'responses': len(writer.responses), 'snapshots': len(writer.snapshots),
+                'records': records}
+
+
+def save_fixture(archive_path: Path, fixture_path: Path) -> bool:
+    """
+    Saves the first recorded page with an open hit modal, e.g. as the
+    'selector_fixture' page of the configuration.
+
+    Args:
+        archive_path (Path): A recorded archive.
+        fixture_path (Path): Where to write the page.
+
+    Returns:
+        bool: False if the archive holds no such page.
+    """
+    archive = ReplayArchive(archive_path)
+    try:
+        for number, snapshot in enumerate(archive.snapshots):
+            if snapshot['kind'] == 'modal':
+                fixture_path.write_text(archive.snapshot(number), encoding='utf-8')
+                return True
+        return False
+    finally:
+        archive.close()
@@ -0,0 +1,150 @@
+"""
+Module for reading, writing and classifying scraped records.
+
+Deliberately free of browser dependencies so that offline tools can use it.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+ASPECTS = ('perfective', 'imperfective')
+Records = List[Dict[str, Any]]
+
+
+def classify_aspect(grammar: Optional[str]) -> Optional[str]:
+    """
+    Determines the aspect of a verb form from its grammar description.
+
+    Args:
+        grammar (Optional[str]): The 'грамматика' field of a record.
+
+    Returns:
+        Optional[str]: 'perfective', 'imperfective' or None for non-verbs
+        and forms without aspect.
+    """
+    if not grammar or "глагол" not in grammar:
+        return None
+    if "несовершенный" in grammar:
+        return 'imperfective'
+    if "совершенный" in grammar:
+        return 'perfective'
+    return None
+
+
+def add_record(records: Tuple[Records, Records], record: Dict[str, Any]):
+    """
+    Appends a record to the perfective or imperfective records by its grammar;
+    records of other parts of speech are dropped.
+
+    Args:
+        records (Tuple[Records, Records]): Perfective and imperfective records.
+        record (Dict[str, Any]): The record to add.
+    """
+    aspect = classify_aspect(record.get('грамматика'))
+    if aspect in ASPECTS:
+        records[ASPECTS.index(aspect)].append(record)
+
+
+def output_path(output_dir: str, aspect: str, word: str) -> str:
+    """
+    Builds the path of the file holding one aspect of a word.
+
+    Args:
+        output_dir (str): The output directory.
+        aspect (str): 'perfective' or 'imperfective'.
+        word (str): The scraped word.
+
+    Returns:
+        str: The file path.
+    """
+    return os.path.join(output_dir, f'{aspect}_{word}.json')
+
+
+def save_word_data(output_dir: str, word: str, perfective_data: Records,
+                   imperfective_data: Records):
+    """
+    Saves the scraped data of a word as two JSON files.
+
+    Args:
+        output_dir (str): Directory to write the files to.
+        word (str): The processed word.
+        perfective_data (Records): Collected perfective forms data.
+        imperfective_data (Records): Collected imperfective forms data.
+    """
+    for aspect, data in zip(ASPECTS, (perfective_data, imperfective_data)):
+        with open(output_path(output_dir, aspect, word), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def load_word_data(output_dir: str, word: str) -> Tuple[Records, Records]:
+    """
+    Loads the scraped data of a word.
+
+    Args:
+        output_dir (str): The output directory.
+        word (str): The scraped word.
+
+    Returns:
+        Tuple[Records, Records]: Perfective and imperfective records;
+        a missing file yields an empty list.
+    """
+    data: List[Records] = []
+    for aspect in ASPECTS:
+        path = output_path(output_dir, aspect, word)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data.append(json.load(f) or [])
+        else:
+            data.append([])
+    return data[0], data[1]
+
+
+def scraped_words(output_dir: str) -> Set[str]:
+    """
+    Lists the words for which both aspect files exist.
+
+    Args:
+        output_dir (str): The output directory.
+
+    Returns:
+        Set[str]: The scraped words.
+    """
+    if not os.path.isdir(output_dir):
+        return set()
+    found: Dict[str, Set[str]] = {aspect: set() for aspect in ASPECTS}
+    for name in os.listdir(output_dir):
+        aspect, _, rest = name.partition('_')
+        if aspect in found and rest.endswith('.json'):
+            found[aspect].add(rest[:-len('.json')])
+    return found['perfective'] & found['imperfective']
+
+
+def iter_records(output_dir: str) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Iterates over all records in the output directory.
+
+    Args:
+        output_dir (str): The output directory.
+
+    Yields:
+        Tuple[str, str, Dict[str, Any]]: The word, the aspect and the record.
+    """
+    for word in sorted(scraped_words(output_dir)):
+        for aspect, data in zip(ASPECTS, load_word_data(output_dir, word)):
+            for record in data:
+                yield word, aspect, record
+
+
+def read_words(path: str) -> List[str]:
+    """
+    Reads the list of words to scrape, one per line.
+
+    Args:
+        path (str): Path to the words file.
+
+    Returns:
+        List[str]: The non-empty words in file order.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return [word.strip() for word in file if word.strip()]
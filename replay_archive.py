@@ -0,0 +1,269 @@
+"""
+Module for the archive format shared by the recorder and the replay server.
+
+An archive is a ZIP file with a 'manifest.json' and content-addressed bodies:
+
+    manifest.json            {'version', 'seed_url', 'responses', 'snapshots'}
+    bodies/<sha1[:16]>       response bodies, stored once however often served
+    snapshots/<n>.html       page sources captured at search, results and modal steps
+
+Every response entry describes one network exchange, including CORS preflight
+OPTIONS requests: method, url, the hash of the request body, status, the
+content type, redirect and CORS headers, the hash of the response body
+and the time the browser waited for it. Entries are looked up by method,
+scheme, host, path, query and request body, so the same path recorded from
+the site and from a CDN replays the right response.
+"""
+
+import hashlib
+import json
+import threading
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+ARCHIVE_VERSION = 1
+MANIFEST = 'manifest.json'
+# Bodies are stored decoded, so content-encoding and content-length are not replayed.
+REPLAYED_HEADERS = ('content-type', 'location', 'access-control-allow-origin',
+                    'access-control-allow-credentials', 'access-control-allow-headers',
+                    'access-control-allow-methods', 'access-control-expose-headers',
+                    'access-control-max-age')
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def body_hash(data: Optional[bytes]) -> str:
+    """
+    Args:
+        data (Optional[bytes]): A request or response body.
+
+    Returns:
+        str: The first 16 hex digits of its SHA-1, empty for no body.
+    """
+    return hashlib.sha1(data).hexdigest()[:16] if data else ''
+
+
+def request_target(url: str) -> str:
+    """
+    Args:
+        url (str): An absolute or relative URL.
+
+    Returns:
+        str: Its path and query, the part a replayed request is matched by.
+    """
+    parts = urlsplit(url)
+    return (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+
+
+def request_url(url: str) -> str:
+    """
+    Args:
+        url (str): An absolute URL.
+
+    Returns:
+        str: Its scheme, host, path and query, the part a replayed request is
+        matched by; the host is lowercased and a default port dropped.
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    if parts.port is not None and parts.port != DEFAULT_PORTS.get(parts.scheme):
+        host += f':{parts.port}'
+    return f'{parts.scheme}://{host}{request_target(url)}'
+
+
+def request_key(method: str, url: str, request_body_hash: str = '') -> Tuple[str, str, str]:
+    """
+    Args:
+        method (str): The HTTP method.
+        url (str): The requested absolute URL.
+        request_body_hash (str): body_hash of the request body.
+
+    Returns:
+        Tuple[str, str, str]: The key responses are looked up by.
+    """
+    return method.upper(), request_url(url), request_body_hash
+
+
+class ArchiveWriter:
+    """
+    Writes network responses and page snapshots into an archive.
+    """
+
+    def __init__(self, path: Path, seed_url: str = ''):
+        """
+        Creates the archive file.
+
+        Args:
+            path (Path): Where to write the archive.
+            seed_url (str): The search page the recording started from.
+        """
+        self.archive = zipfile.ZipFile(  # pylint: disable=consider-using-with
+            path, 'w', compression=zipfile.ZIP_DEFLATED)
+        self.seed_url = seed_url
+        self.bodies: set = set()
+        self.responses: List[Dict[str, Any]] = []
+        self.snapshots: List[Dict[str, Any]] = []
+
+    def add_body(self, data: bytes) -> str:
+        """
+        Stores a body unless an identical one is stored already.
+
+        Args:
+            data (bytes): The body.
+
+        Returns:
+            str: The body hash to reference it by.
+        """
+        digest = body_hash(data)
+        if digest and digest not in self.bodies:
+            self.archive.writestr(f'bodies/{digest}', data)
+            self.bodies.add(digest)
+        return digest
+
+    def add_response(self, request: Dict[str, Any], response: Dict[str, Any],
+                     body: bytes, elapsed_ms: float = 0.0):
+        """
+        Records one network exchange.
+
+        Args:
+            request (Dict[str, Any]): The request's 'method', 'url' and 'post_data',
+                the request body as bytes or None.
+            response (Dict[str, Any]): The response's 'status' and 'headers';
+                only REPLAYED_HEADERS are kept.
+            body (bytes): The decoded response body.
+            elapsed_ms (float): Time from sending the request to receiving the whole response.
+        """
+        self.responses.append({
+            'method': request['method'].upper(),
+            'url': request['url'],
+            'request_body': body_hash(request.get('post_data')),
+            'status': response['status'],
+            'headers': {name.lower(): value for name, value in response.get('headers', {}).items()
+                        if name.lower() in REPLAYED_HEADERS},
+            'body': self.add_body(body),
+            'elapsed_ms': round(elapsed_ms, 1),
+        })
+
+    def add_snapshot(self, kind: str, html: str, url: str, **info: Any):
+        """
+        Records the source of the current page.
+
+        Args:
+            kind (str): 'search', 'results' or 'modal'.
+            html (str): The page source.
+            url (str): The address of the page.
+            **info (Any): Additional JSON serializable details, such as the word.
+        """
+        name = f'snapshots/{len(self.snapshots)}.html'
+        self.archive.writestr(name, html.encode('utf-8'))
+        self.snapshots.append({'kind': kind, 'url': url, 'file': name, **info})
+
+    def close(self):
+        """
+        Writes the manifest and closes the archive.
+        """
+        manifest = {'version': ARCHIVE_VERSION, 'seed_url': self.seed_url,
+                    'responses': self.responses, 'snapshots': self.snapshots}
+        self.archive.writestr(MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=1))
+        self.archive.close()
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ReplayArchive:
+    """
+    Reads an archive and looks up recorded responses for incoming requests.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Opens an archive and indexes its responses.
+
+        Args:
+            path (Path): The archive written by ArchiveWriter.
+
+        Raises:
+            ValueError: If the archive has an unsupported version.
+        """
+        self.archive = zipfile.ZipFile(path)  # pylint: disable=consider-using-with
+        manifest = json.loads(self.archive.read(MANIFEST))
+        if manifest.get('version') != ARCHIVE_VERSION:
+            raise ValueError(f"unsupported archive version {manifest.get('version')}")
+        self.seed_url: str = manifest['seed_url']
+        self.responses: List[Dict[str, Any]] = manifest['responses']
+        self.snapshots: List[Dict[str, Any]] = manifest['snapshots']
+        self.entries: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for entry in self.responses:
+            self.entries.setdefault(request_key(entry['method'], entry['url'])[:2],
+                                    []).append(entry)
+        self.served: Dict[Tuple[str, ...], int] = {}
+        self.lock = threading.Lock()
+
+    def match(self, method: str, url: str,
+              request_body: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
+        """
+        Finds the recorded response for a request.
+
+        Requests are matched by method, URL and request body; if no body matches,
+        by method and URL alone. Responses recorded several times for the same
+        request are returned in recorded order, the last one repeating.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The requested absolute URL.
+            request_body (Optional[bytes]): The request body.
+
+        Returns:
+            Optional[Dict[str, Any]]: The response entry, or None if nothing was recorded.
+        """
+        key = request_key(method, url, body_hash(request_body))
+        candidates = [entry for entry in self.entries.get(key[:2], [])
+                      if entry['request_body'] == key[2]]
+        served_key: Tuple[str, ...] = key
+        if not candidates:
+            served_key = key[:2]
+            candidates = self.entries.get(served_key, [])
+        if not candidates:
+            return None
+        with self.lock:
+            served = self.served.get(served_key, 0)
+            self.served[served_key] = served + 1
+        return candidates[min(served, len(candidates) - 1)]
+
+    def rewind(self):
+        """
+        Restarts the recorded order of repeated responses, for another replay run.
+        """
+        with self.lock:
+            self.served.clear()
+
+    def body(self, entry: Dict[str, Any]) -> bytes:
+        """
+        Args:
+            entry (Dict[str, Any]): A response entry.
+
+        Returns:
+            bytes: Its body.
+        """
+        return self.archive.read(f"bodies/{entry['body']}") if entry['body'] else b''
+
+    def snapshot(self, number: int) -> str:
+        """
+        Args:
+            number (int): The index of the snapshot.
+
+        Returns:
+            str: The recorded page source.
+        """
+        return self.archive.read(self.snapshots[number]['file']).decode('utf-8')
+
+    def close(self):
+        """
+        Closes the archive file.
+        """
+        self.archive.close()
@@ -0,0 +1,240 @@
+"""
+Local HTTP and HTTPS server replaying a recorded archive without network access.
+
+Requests are answered from the archive written by recorder.py with the recorded
+status, content type and body. Requests are matched by the host they were sent
+to, so the browser is pointed at the server with the Chrome flags of
+'browser_args': every host on port 80 resolves to the HTTP port and every host
+on port 443 to the HTTPS port of the server. The HTTPS port uses a throwaway
+self-signed certificate made with the openssl command, which the browser
+accepts because of '--ignore-certificate-errors'; without openssl only HTTP is
+replayed. Requests sent to the server's own address are treated as requests to
+the host of the recorded search page, so url and url_for work without the flags.
+
+Responses are delayed by their recorded duration divided by 'speed': 1.0
+reproduces production timings, 0 serves everything immediately. The recorded
+page snapshots are served under /__replay__/snapshots/<n>.
+"""
+
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from local_server import QuietHandler
+from replay_archive import ReplayArchive, request_target
+
+SNAPSHOT_PREFIX = '/__replay__/snapshots/'
+LOCAL_HOSTS = ('127.0.0.1', 'localhost')
+
+
+def self_signed_certificate(directory: Path) -> Optional[Tuple[Path, Path]]:
+    """
+    Creates a certificate for the HTTPS port with the openssl command.
+
+    Args:
+        directory (Path): Where to write the certificate and its key.
+
+    Returns:
+        Optional[Tuple[Path, Path]]: The certificate and key files, or None if
+        openssl is not available.
+    """
+    certificate, key = directory / 'replay.crt', directory / 'replay.key'
+    try:
+        subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+                        '-days', '1', '-subj', '/CN=replay', '-keyout', str(key),
+                        '-out', str(certificate)], check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error creating a certificate, HTTPS is not replayed: {e}")
+        return None
+    return certificate, key
+
+
+class ReplayServer:
+    """
+    Threaded HTTP and HTTPS servers answering requests from a ReplayArchive.
+    """
+
+    def __init__(self, archive_path: Path, speed: float = 0.0, port: int = 0,
+                 tls_port: Optional[int] = 0):
+        """
+        Initializes the ReplayServer.
+
+        Args:
+            archive_path (Path): The recorded archive.
+            speed (float): Timing scale; 1.0 replays recorded durations,
+                2.0 twice as fast, 0 without delays.
+            port (int): HTTP port to listen on, 0 picks a free one.
+            tls_port (Optional[int]): HTTPS port to listen on, 0 picks a free one
+                and None serves HTTP only.
+        """
+        self.archive = ReplayArchive(archive_path)
+        self.speed = speed
+        self.misses: List[str] = []
+        self.servers: Dict[str, ThreadingHTTPServer] = {
+            'http': ThreadingHTTPServer(('127.0.0.1', port), self._handler('http'))}
+        self.threads: List[threading.Thread] = []
+        self.certificates = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        files = self_signed_certificate(Path(self.certificates.name)) \
+            if tls_port is not None else None
+        if files is not None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(*files)
+            server = ThreadingHTTPServer(('127.0.0.1', tls_port or 0), self._handler('https'))
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+            self.servers['https'] = server
+
+    def port(self, scheme: str = 'http') -> Optional[int]:
+        """
+        Args:
+            scheme (str): 'http' or 'https'.
+
+        Returns:
+            Optional[int]: The port serving the scheme, None if it is not served.
+        """
+        server = self.servers.get(scheme)
+        return server.server_address[1] if server is not None else None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Returns:
+            str: The HTTP address of the server.
+        """
+        return f"http://127.0.0.1:{self.port()}"
+
+    @property
+    def url(self) -> str:
+        """
+        Returns:
+            str: The recorded search page on this server, usable as 'seed_url'
+            without 'browser_args'.
+        """
+        return self.url_for(self.archive.seed_url)
+
+    @property
+    def browser_args(self) -> List[str]:
+        """
+        Returns:
+            List[str]: Chrome flags sending the browser's requests for every
+            host to this server, usable as 'browser_args' with the recorded 'seed_url'.
+        """
+        rules = [f"MAP *:80 127.0.0.1:{self.port()}"]
+        if 'https' in self.servers:
+            rules.append(f"MAP *:443 127.0.0.1:{self.port('https')}")
+        args = [f"--host-resolver-rules={', '.join(rules + ['EXCLUDE localhost'])}"]
+        if 'https' in self.servers:
+            args.append("--ignore-certificate-errors")
+        return args
+
+    def url_for(self, recorded_url: str) -> str:
+        """
+        Args:
+            recorded_url (str): A URL requested from the recorded search page's host.
+
+        Returns:
+            str: The same path and query on this server.
+        """
+        return self.base_url + request_target(recorded_url)
+
+    def snapshot_url(self, number: int) -> str:
+        """
+        Args:
+            number (int): The index of a snapshot in the archive.
+
+        Returns:
+            str: The address the snapshot is served at.
+        """
+        return f"{self.base_url}{SNAPSHOT_PREFIX}{number}"
+
+    def _handler(self, scheme: str):
+        replay = self
+
+        class Handler(QuietHandler):
+            """
+            Answers every method from the archive.
+            """
+
+            def requested_url(self) -> Tuple[str, bool]:
+                """
+                Returns:
+                    Tuple[str, bool]: The absolute URL the browser requested and
+                    whether it was sent to the server's own address.
+                """
+                host = self.headers.get('Host', '')
+                if host.rsplit(':', 1)[0] in LOCAL_HOSTS or not host:
+                    return urljoin(replay.archive.seed_url, self.path), True
+                return f"{scheme}://{host}{self.path}", False
+
+            def handle_request(self):
+                """
+                Sends the recorded response, or 404 for requests that were not recorded.
+                """
+                if self.path.startswith(SNAPSHOT_PREFIX):
+                    self.send_snapshot(self.path[len(SNAPSHOT_PREFIX):])
+                    return
+                length = int(self.headers.get('Content-Length') or 0)
+                request_body = self.rfile.read(length) if length else None
+                url, local = self.requested_url()
+                entry = replay.archive.match(self.command, url, request_body)
+                if entry is None:
+                    replay.misses.append(f"{self.command} {url}")
+                    self.send_error(404, 'not recorded')
+                    return
+                if replay.speed > 0:
+                    time.sleep(entry['elapsed_ms'] / 1000 / replay.speed)
+                headers = dict(entry['headers'])
+                # without the resolver rules redirects have to stay on this server
+                if local and 'location' in headers:
+                    headers['location'] = request_target(headers['location'])
+                self.send_content(entry['status'], headers, replay.archive.body(entry))
+
+            def send_snapshot(self, number: str):
+                """
+                Sends a recorded page snapshot.
+                """
+                if not number.isdigit() or int(number) >= len(replay.archive.snapshots):
+                    self.send_error(404, 'no such snapshot')
+                    return
+                self.send_content(200, {'Content-Type': 'text/html; charset=utf-8'},
+                                  replay.archive.snapshot(int(number)).encode('utf-8'))
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = \
+                do_OPTIONS = handle_request  # pylint: disable=invalid-name
+
+        return Handler
+
+    def start(self) -> 'ReplayServer':
+        """
+        Starts serving in background threads.
+
+        Returns:
+            ReplayServer: The running server.
+        """
+        for server in self.servers.values():
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        return self
+
+    def stop(self):
+        """
+        Stops the servers, removes the certificate and closes the archive.
+        """
+        for server in self.servers.values():
+            if self.threads:
+                server.shutdown()
+            server.server_close()
+        self.certificates.cleanup()
+        self.archive.close()
+
+    def __enter__(self) -> 'ReplayServer':
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
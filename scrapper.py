@@ -3,14 +3,18 @@ Module for web scraping using Selenium WebDriver.
 """
 
 import time
-from typing import Tuple, List, Optional, Dict, Any
+from collections import Counter
+from typing import Tuple, List, Optional, Dict, Any, Union
 
 from selenium.common import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 from custom_parser import Parser
+from config.compiled_config import CompiledConfig, compile_config
+from context_store import ContextStore, next_hit_key
+from records import Records, add_record
+from driver_manager import DriverManager
 
 
 class Scrapper:
@@ -21,28 +25,80 @@ class Scrapper:
     collect data from the search results, and navigate through the search result pages.
     """
 
-    def __init__(self, driver: WebDriver, config: Dict[str, Any]):
+    def __init__(self, driver: WebDriver, config: Union[Dict[str, Any], CompiledConfig],
+                 context_store: Optional[ContextStore] = None,
+                 driver_manager: Optional[DriverManager] = None):
         """
         Initializes the Scrapper with a WebDriver, configuration settings, and a Parser.
 
         Args:
             driver (WebDriver): The WebDriver instance to use for automation.
-            config (Dict[str, Any]): A dictionary containing configuration parameters.
+            config (Union[Dict[str, Any], CompiledConfig]): A dictionary containing
+                configuration parameters, or its compiled form.
+            context_store (Optional[ContextStore]): Shared context table. When given,
+                records reference their context by hash and hits already seen
+                in an earlier pass are taken from the store instead of the browser.
+            driver_manager (Optional[DriverManager]): Health monitor of the driver. When given,
+                it is consulted after every results page and may replace the driver.
+        """
+        self.compiled = config if isinstance(config, CompiledConfig) else compile_config(config)
+        self.config = self.compiled.raw
+        self.context_store = context_store
+        self.driver_manager = driver_manager
+        self.set_driver(driver)
+
+    def set_driver(self, driver: WebDriver):
+        """
+        Switches the Scrapper and its Parser to another WebDriver.
+
+        Args:
+            driver (WebDriver): The WebDriver instance to use from now on.
         """
         self.driver = driver
-        self.config = config
-        self.wait = WebDriverWait(driver, config["timeout"])
-        self.parser = Parser(driver, config)
+        self.wait = WebDriverWait(driver, self.compiled.timeout)
+        self.parser = self.make_parser(driver)
+
+    def make_parser(self, driver: WebDriver) -> Parser:
+        """
+        Args:
+            driver (WebDriver): The WebDriver the Parser reads pages from.
+
+        Returns:
+            Parser: A new Parser for the driver.
+        """
+        return Parser(driver, self.compiled)
+
+    def checkpoint(self, page_number: int = 1) -> bool:
+        """
+        Lets the driver manager check the driver and switches to a new driver
+        if the manager recycled the old one.
+
+        Restoring a results page in a new driver pages forward from the first one,
+        so beyond 'max_restore_pages' the swap is deferred to the next word.
+
+        Args:
+            page_number (int): The results page that would have to be restored.
+
+        Returns:
+            bool: True if the driver was replaced and the search has to be restored.
+        """
+        if self.driver_manager is None:
+            return False
+        defer = page_number > self.driver_manager.thresholds['max_restore_pages']
+        if not self.driver_manager.checkpoint(defer):
+            return False
+        self.set_driver(self.driver_manager.driver)
+        return True
 
     def navigate_to_search(self):
         """
         Navigates to the initial search URL as defined in the configuration.
+
+        Raises:
+            WebDriverException: If the page cannot be opened.
         """
-        try:
-            self.driver.get(self.config["seed_url"])
-            time.sleep(2)  # sleep to ensure the page has loaded
-        except WebDriverException as e:
-            print(f"Error navigating to search page: {e}")
+        self.driver.get(self.compiled.seed_url)
+        time.sleep(2)  # sleep to ensure the page has loaded
 
     def input_word(self, word: str):
         """
@@ -50,17 +106,17 @@ class Scrapper:
 
         Args:
             word (str): The word to search for.
+
+        Raises:
+            WebDriverException: If the search field or button cannot be used,
+                so that a failed search is not mistaken for one without results.
         """
-        try:
-            input_element = self.wait.until(
-                EC.visibility_of_element_located((By.CLASS_NAME, "the-input__input")))
-            input_element.clear()
-            input_element.send_keys(word)
-            search_button = self.driver.find_element(
-                By.XPATH, self.config["x_paths"]["search_input"])
-            search_button.click()
-        except (NoSuchElementException, TimeoutException, WebDriverException) as e:
-            print(f"Error in input_word: {e}")
+        input_element = self.wait.until(
+            EC.visibility_of_element_located(self.compiled.search_field))
+        input_element.clear()
+        input_element.send_keys(word)
+        search_button = self.driver.find_element(*self.compiled.search_button)
+        search_button.click()
 
     def collect_data(self, word: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
@@ -73,49 +129,109 @@ class Scrapper:
             Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
             Collected perfective and imperfective forms data.
         """
-        perfective, imperfective = [], []
+        perfective, imperfective, _ = self.walk(word)
+        return perfective, imperfective
+
+    def walk(self, word: str) -> Tuple[Records, Records, bool]:
+        """
+        Walks the search results pages for the given word.
+
+        Args:
+            word (str): The word for which to collect data.
+
+        Returns:
+            Tuple[Records, Records, bool]: Collected perfective and imperfective
+            forms data, and False if the walk stopped before the last results page.
+            A first page without hits only counts as complete if it shows the
+            'empty_results' message, see shows_empty_results.
+        """
+        perfective: Records = []
+        imperfective: Records = []
+        occurrences: Counter = Counter()
         page_number = 1
         while True:
             print(f"Processing page: {page_number}")
             try:
                 hit_word_elements = self.wait.until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".hit.word")))
+                    EC.presence_of_all_elements_located(self.compiled.word_elements))
                 for i, element in enumerate(hit_word_elements, start=1):
-                    word_data = self.process_element(element, i)
-                    if word_data and "глагол" in word_data['грамматика']:
-                        if "несовершенный" in word_data['грамматика']:
-                            imperfective.append(word_data)
-                        elif "совершенный" in word_data['грамматика']:
-                            perfective.append(word_data)
+                    word_data = self.process_hit(element, i, occurrences, word)
+                    if word_data is not None:
+                        add_record((perfective, imperfective), word_data)
+                if self.driver_manager is not None:
+                    self.driver_manager.record_hits(len(hit_word_elements))
                 if not self.go_to_next_page():
-                    break
+                    return perfective, imperfective, True
                 page_number += 1
-            except (NoSuchElementException, TimeoutException, WebDriverException) as e:
+                if self.checkpoint(page_number) and not self.restore_page(word, page_number):
+                    print(f"Could not restore page {page_number} for '{word}'")
+                    return perfective, imperfective, False
+            except TimeoutException as e:
                 print(f"Error on page {page_number} for '{word}': {e}")
-                break
-        return perfective, imperfective
+                return perfective, imperfective, page_number == 1 and self.shows_empty_results()
+            except (NoSuchElementException, WebDriverException) as e:
+                print(f"Error on page {page_number} for '{word}': {e}")
+                return perfective, imperfective, False
+
+    def process_hit(self, element, position: int, occurrences: Counter,
+                    search: str) -> Optional[Dict[str, Any]]:
+        """
+        Processes a hit, passing its record through the context store if one is set.
+
+        Hits already stored in an earlier pass are returned from the store
+        without opening their modal.
+
+        Args:
+            element: The web element to process.
+            position (int): The position of the element on the page.
+            occurrences (Counter): Number of times each (context, wordform) pair
+                has been seen during the current word.
+            search (str): The query whose results are being walked.
+
+        Returns:
+            Optional[Dict[str, Any]]: Extracted data from the element or None if an error occurs.
+        """
+        if self.context_store is None:
+            return self.process_element(element, position)
+
+        context_text = self.parser.extract_element_context(element)
+        if context_text is None:
+            word_data = self.process_element(element, position)
+            return self.context_store.deduplicate(word_data) if word_data else None
+
+        key = next_hit_key(occurrences, context_text, element.text)
+        cached = self.context_store.get_hit(search, key)
+        if cached is not None:
+            return cached
 
-    def process_element(self, element, position: int) -> Optional[Dict[str, Any]]:
+        word_data = self.process_element(element, position, context_text)
+        return self.context_store.add_hit(search, key, word_data) if word_data else None
+
+    def process_element(self, element, position: int,
+                        context_text: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Processes a web element to extract data like context, lemma, grammar, and syntax features.
 
         Args:
             element: The web element to process.
             position (int): The position of the element on the page.
+            context_text (Optional[str]): The context if it was already read from the page.
 
         Returns:
             Optional[Dict[str, Any]]: Extracted data from the element or None if an error occurs.
         """
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(2)
-        self.driver.execute_script("arguments[0].click();", element)
         try:
-            context_text = self.parser.extract_context(position)
+            # wait like Playwright's scroll_into_view_if_needed, not for a fixed time
+            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            self.wait.until(EC.visibility_of(element))
+            self.driver.execute_script("arguments[0].click();", element)
+            if context_text is None:
+                context_text = self.parser.extract_context(position)
             lemma = self.parser.extract_lemma()
             grammar = self.parser.extract_grammar()
             syntax_features = self.parser.extract_syntax_features()
 
-            close_button = self.driver.find_element(By.CSS_SELECTOR, "button.info-modal__close")
+            close_button = self.driver.find_element(*self.compiled.modal_close_button)
             self.driver.execute_script("arguments[0].click();", close_button)
 
             return {
@@ -129,24 +245,63 @@ class Scrapper:
             print(f"Error processing element: {e}")
             return None
 
+    def shows_empty_results(self) -> bool:
+        """
+        Checks whether the current page says that the search found nothing.
+
+        Returns:
+            bool: True if the configured 'empty_results' message is shown,
+            False if it is not or none is configured.
+        """
+        if self.compiled.empty_results is None:
+            return False
+        try:
+            return bool(self.driver.find_elements(*self.compiled.empty_results))
+        except WebDriverException as e:
+            print(f"Error checking for empty results: {e}")
+            return False
+
     def go_to_next_page(self) -> bool:
         """
         Attempts to navigate to the next page of search results.
 
         Returns:
-            bool: True if successfully navigated to the next page, False otherwise.
+            bool: True if successfully navigated to the next page, False if there
+            is no enabled next page button, i.e. this is the last page.
+
+        Raises:
+            WebDriverException: If the button is there but cannot be clicked.
         """
         try:
-            next_page_button = self.driver.find_element(
-                By.CSS_SELECTOR, ".ant-pagination-next:not(.ant-pagination-disabled)")
-            if next_page_button.is_enabled():
-                self.driver.execute_script("arguments[0].click();", next_page_button)
-                time.sleep(2)
-                return True
+            next_page_button = self.driver.find_element(*self.compiled.next_page_button)
+        except NoSuchElementException:
             return False
-        except (NoSuchElementException, TimeoutException, WebDriverException) as e:
-            print(f"Error going to next page: {e}")
+        if not next_page_button.is_enabled():
             return False
+        self.driver.execute_script("arguments[0].click();", next_page_button)
+        time.sleep(2)
+        return True
+
+    def restore_page(self, word: str, page_number: int) -> bool:
+        """
+        Repeats the search for a word in a fresh driver and pages forward to a results page.
+
+        Args:
+            word (str): The word being collected.
+            page_number (int): The results page to open.
+
+        Returns:
+            bool: True if the page exists and is open, False if there are fewer pages.
+
+        Raises:
+            WebDriverException: If the search or paging fails.
+        """
+        self.navigate_to_search()
+        self.input_word(word)
+        for _ in range(page_number - 1):
+            if not self.go_to_next_page():
+                return False
+        return True
 
     def close_driver(self):
         """
@@ -2,53 +2,163 @@
 Main script to start the web scraping process.
 """
 
+import asyncio
 import json
 import os
+import sys
 from pathlib import Path
+from typing import List, Optional, Tuple
 
-from facade_api import FacadeAPI
+from context_store import STORE_NAME, ContextStore
+from config.config_loader import load_config
+from records import Records, read_words, save_word_data, scraped_words
+from batching import BatchPlanner, batch_query, estimates_from_output
 
+WORDS_PATH = Path('biverbal_verbs.txt')
+OUTPUT_DIR = Path('biverbal_verbs')
+CONFIG_PATH = Path('config/scrapper_config.json')
 
-def main():
+
+def save_word(output_dir: str, word: str, data: Tuple[Records, Records],
+              context_store: ContextStore):
+    """
+    Saves the records of a word and appends its new contexts and hits to the store.
+
+    The store is written first, so a saved output file never references
+    a context that is missing from the store.
+
+    Args:
+        output_dir (str): Directory to write the results to.
+        word (str): The processed word.
+        data (Tuple[Records, Records]): Its perfective and imperfective records.
+        context_store (ContextStore): Shared context table.
+    """
+    context_store.commit(word, *data)
+    context_store.save()
+    save_word_data(output_dir, word, *data)
+
+
+async def scrape_with_playwright(words: List[str], config_path: Path, output_dir: str,
+                                 context_store: ContextStore):
+    """
+    Scrapes the words with the Playwright backend, several browser contexts at a time.
+
+    Args:
+        words (List[str]): The words to process.
+        config_path (Path): Path to the configuration JSON file.
+        output_dir (str): Directory to write the results to.
+        context_store (ContextStore): Shared context table.
+    """
+    # Browser backends are imported only when scraping actually starts.
+    from async_facade_api import AsyncFacadeAPI  # pylint: disable=import-outside-toplevel
+
+    scraper = await AsyncFacadeAPI.create(config_path, context_store)
+    try:
+        async for word, data in scraper.process_words(words):
+            print(f"Processed word: {word}")
+            if data is not None:
+                save_word(output_dir, word, data, context_store)
+            context_store.release(word)
+    finally:
+        await scraper.close()
+
+
+def scrape_in_batches(scraper, words: List[str], output_dir: str,
+                      context_store: ContextStore, max_hits: int):
+    """
+    Scrapes the words with the Selenium backend, several rare words per search.
+
+    The words of a batch that failed or stopped before its last results page
+    are not saved, so a resumed run searches for them again.
+
+    Args:
+        scraper (FacadeAPI): The started facade.
+        words (List[str]): The words to process.
+        output_dir (str): Directory to write the results to.
+        context_store (ContextStore): Shared context table.
+        max_hits (int): Expected hits a batch query may return.
+    """
+    planner = BatchPlanner(max_hits=max_hits, estimates=estimates_from_output(output_dir))
+    for batch in planner.batches(words):
+        print(f"Processing batch: {', '.join(batch)}")
+        routed = scraper.process_batch(batch)
+        if routed is None:
+            print(f"Batch not saved, resume to retry: {', '.join(batch)}")
+        for word, data in (routed or {}).items():
+            planner.observe(word, len(data[0]) + len(data[1]))
+            save_word(output_dir, word, data, context_store)
+        context_store.release(batch_query(batch))
+
+
+def main(words_path: Path = WORDS_PATH, output_dir: Path = OUTPUT_DIR,
+         config_path: Path = CONFIG_PATH, resume: bool = False,
+         batch_hits: Optional[int] = None) -> int:
     """
     Main function to initiate the web scraping process for words listed
     in 'biverbal_verbs.txt'.
     Scraped data for each word will be saved in separate JSON files
-    in the 'biverbal_verbs' directory.
+    in the 'biverbal_verbs' directory, with contexts shared between them
+    in 'biverbal_verbs/contexts.jsonl'.
+    The browser backend is chosen by the 'backend' configuration key.
+
+    Args:
+        words_path (Path): File with the words to scrape, one per line.
+        output_dir (Path): Directory to write the results to.
+        config_path (Path): Path to the configuration JSON file.
+        resume (bool): Skip words whose results are already in output_dir.
+        batch_hits (Optional[int]): Search several words at once, with about this many
+            expected hits per search; only supported by the Selenium backend.
+
+    Returns:
+        int: 0 on success, 1 if the words or the configuration could not be read.
     """
     scraper = None
-    output_dir = 'biverbal_verbs'
 
     try:
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        config_path = Path('config/scrapper_config.json')
-        scraper = FacadeAPI(config_path=config_path)
+        context_store = ContextStore(Path(output_dir) / STORE_NAME)
 
-        with open('biverbal_verbs.txt', 'r', encoding='utf-8') as file:
-            words = [word.strip() for word in file.readlines()]
+        words = read_words(str(words_path))
+        if resume:
+            done = scraped_words(str(output_dir))
+            words = [word for word in words if word not in done]
 
-        for word in words:
-            print(f"Processing word: {word}")
-            perfective_data, imperfective_data = scraper.process_word(word)
+        if load_config(config_path).get("backend", "selenium") == "playwright":
+            if batch_hits:
+                print("Batch mode is not supported by the playwright backend, "
+                      "scraping word by word")
+            asyncio.run(scrape_with_playwright(
+                words, config_path, str(output_dir), context_store))
+            return 0
+
+        from facade_api import FacadeAPI  # pylint: disable=import-outside-toplevel
 
-            with open(os.path.join(
-                    output_dir, f'perfective_{word}.json'), 'w', encoding='utf-8') as f:
-                json.dump(perfective_data, f, ensure_ascii=False, indent=4)
+        scraper = FacadeAPI(config_path=config_path, context_store=context_store)
 
-            with open(os.path.join(
-                    output_dir, f'imperfective_{word}.json'), 'w', encoding='utf-8') as f:
-                json.dump(imperfective_data, f, ensure_ascii=False, indent=4)
+        if batch_hits:
+            scrape_in_batches(scraper, words, str(output_dir), context_store, batch_hits)
+            return 0
+
+        for word in words:
+            print(f"Processing word: {word}")
+            data = scraper.process_word(word)
+            if data is not None:
+                save_word(str(output_dir), word, data, context_store)
+            context_store.release(word)
+        return 0
 
     except FileNotFoundError as fnf_error:
-        print(f"File not found error: {fnf_error}")
+        print(f"File not found error: {fnf_error}", file=sys.stderr)
+        return 1
     except json.JSONDecodeError as json_error:
-        print(f"JSON decode error: {json_error}")
+        print(f"JSON decode error: {json_error}", file=sys.stderr)
+        return 1
     finally:
         if scraper:
             scraper.close()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Tests for aspect usage analytics
+"""
+import pickle
+import tempfile
+from pathlib import Path
+
+from analytics import AspectAnalytics, data_signature
+from records import save_word_data
+
+
+def record(grammar, syntax='сказуемое, главная клауза'):
+    """
+    Builds a minimal record with the given grammar
+    Returns:
+        the record
+    """
+    return {'словоформа': 'форма', 'контекст': 'Контекст.', 'лемма': 'атаковать',
+            'грамматика': grammar, 'синтаксические признаки': syntax}
+
+
+PERFECTIVE = [record('глагол, совершенный, прошедшее, изъявительное'),
+              record('глагол, совершенный, будущее, изъявительное, 3-е лицо')]
+IMPERFECTIVE = [record('глагол, несовершенный, настоящее, изъявительное, 1-е лицо',
+                       'сказуемое , подчиненная клауза')]
+
+
+def test_aspect_ratios():
+    """
+    Tests weather per verb aspect counts and shares are computed
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'атаковать', PERFECTIVE, IMPERFECTIVE)
+        save_word_data(tmp, 'казнить', [], IMPERFECTIVE)
+        ratios = AspectAnalytics(Path(tmp)).aspect_ratios()
+        assert ratios.loc['атаковать', 'total'] == 3
+        assert abs(ratios.loc['атаковать', 'perfective_share'] - 2 / 3) < 1e-9
+        assert ratios.loc['казнить', 'perfective_share'] == 0
+
+
+def test_feature_distribution_and_syntax():
+    """
+    Tests weather grammar distributions and syntax cross-tabs are normalized per aspect
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'атаковать', PERFECTIVE, IMPERFECTIVE)
+        analytics = AspectAnalytics(Path(tmp))
+        tense = analytics.feature_distribution('tense')
+        assert tense.loc['perfective', 'прошедшее'] == 0.5
+        assert tense.loc['imperfective', 'настоящее'] == 1.0
+        syntax = analytics.syntax_crosstab()
+        assert syntax.loc['imperfective', 'подчиненная клауза'] == 1.0
+        assert syntax.loc['perfective', 'главная клауза'] == 1.0
+
+
+def test_cache_invalidated_by_changes():
+    """
+    Tests weather cached results are refreshed when data files change
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'атаковать', PERFECTIVE, IMPERFECTIVE)
+        assert AspectAnalytics(Path(tmp)).aspect_ratios().loc['атаковать', 'total'] == 3
+        assert (Path(tmp) / '.analytics_cache.pkl').exists()
+        save_word_data(tmp, 'атаковать', PERFECTIVE, [])
+        assert AspectAnalytics(Path(tmp)).aspect_ratios().loc['атаковать', 'total'] == 2
+
+
+def test_incompatible_cache_recomputed():
+    """
+    Tests weather a cache written by another pandas version or a broken cache is recomputed
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'атаковать', PERFECTIVE, IMPERFECTIVE)
+        cache = Path(tmp) / '.analytics_cache.pkl'
+        with open(cache, 'wb') as file:
+            pickle.dump({'version': (0, '0.0'), 'signature': data_signature(tmp),
+                         'frame': None, 'results': {}}, file)
+        assert AspectAnalytics(Path(tmp)).aspect_ratios().loc['атаковать', 'total'] == 3
+        cache.write_bytes(pickle.dumps(TypeError) + b'garbage')
+        assert AspectAnalytics(Path(tmp)).aspect_ratios().loc['атаковать', 'total'] == 3
+
+
+def test_report_writes_cache_once(monkeypatch):
+    """
+    Tests weather report writes the cache once for all its tables
+    Returns:
+
+    """
+    saves = []
+    dump = pickle.dump
+    monkeypatch.setattr(pickle, 'dump', lambda *args: saves.append(dump(*args)))
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'атаковать', PERFECTIVE, IMPERFECTIVE)
+        tables = AspectAnalytics(Path(tmp)).report()
+        assert len(saves) == 1
+        assert len(AspectAnalytics(Path(tmp)).report()) == len(tables)
+        assert len(saves) == 1
@@ -0,0 +1,84 @@
+"""
+Tests for the Playwright backend against the local mock site
+"""
+import asyncio
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+import async_facade_api
+from async_facade_api import AsyncFacadeAPI
+from benchmarks.mock_site import MockSite
+
+
+def run_words(words, hits_per_word, contexts):
+    """
+    Scrapes words from a fresh mock site with the Playwright backend
+    Returns:
+        dict mapping words to their scraped data
+    """
+    async def scrape(config_path):
+        api = await AsyncFacadeAPI.create(config_path, contexts=contexts)
+        try:
+            return {word: data async for word, data in api.process_words(words)}
+        finally:
+            await api.close()
+
+    with MockSite(hits_per_word=hits_per_word, per_page=4) as site, \
+            tempfile.TemporaryDirectory() as tmp:
+        return asyncio.run(scrape(site.write_config(Path(tmp))))
+
+
+def test_collect_data_splits_aspects():
+    """
+    Tests weather all hits are collected across pages
+    and split by aspect
+    Returns:
+
+    """
+    perfective, imperfective = run_words(['абонировать'], 7, 1)['абонировать']
+    assert len(perfective) == 4
+    assert len(imperfective) == 3
+    assert all(record['лемма'] == 'абонировать' for record in perfective + imperfective)
+    assert all('несовершенный' in record['грамматика'] for record in imperfective)
+
+
+def test_process_words_in_parallel_contexts():
+    """
+    Tests weather several words are processed in parallel browser contexts
+    Returns:
+
+    """
+    words = ['азотировать', 'аннулировать', 'атаковать']
+    result = run_words(words, 3, 2)
+    assert set(result) == set(words)
+    for word in words:
+        assert len(result[word][0]) + len(result[word][1]) == 3
+
+
+def test_create_closes_browser_on_error(monkeypatch):
+    """
+    Tests weather the launched browser is closed when a browser context cannot be opened
+    Returns:
+
+    """
+    closed = []
+
+    async def close(name):
+        closed.append(name)
+
+    async def new_context():
+        raise PlaywrightError('no context')
+
+    async def fake_init_browser(*_):
+        return (SimpleNamespace(stop=lambda: close('playwright')),
+                SimpleNamespace(new_context=new_context, close=lambda: close('browser')))
+
+    monkeypatch.setattr(async_facade_api, 'init_browser', fake_init_browser)
+    with MockSite() as site, tempfile.TemporaryDirectory() as tmp:
+        with pytest.raises(PlaywrightError):
+            asyncio.run(AsyncFacadeAPI.create(site.write_config(Path(tmp))))
+    assert closed == ['browser', 'playwright']
@@ -0,0 +1,68 @@
+"""
+Tests for batched queries
+"""
+import tempfile
+
+from batching import (BatchPlanner, batch_query, estimates_from_output,
+                      normalize_lemma, route_records)
+from records import save_word_data
+
+
+def test_batch_query_and_routing():
+    """
+    Tests weather records of a batch query are routed to their words by lemma
+    and words without hits get empty lists
+    Returns:
+
+    """
+    words = ['абонировать', 'атаковать', 'аннулировать']
+    assert batch_query(words) == 'абонировать|атаковать|аннулировать'
+    perfective = [{'лемма': 'Атаковать'}, {'лемма': 'абонировать'}, {'лемма': None}]
+    imperfective = [{'лемма': 'абонировать'}, {'лемма': 'бежать'}]
+    routed, unrouted = route_records(words, perfective, imperfective)
+    assert routed['абонировать'] == ([{'лемма': 'абонировать'}], [{'лемма': 'абонировать'}])
+    assert routed['атаковать'] == ([{'лемма': 'Атаковать'}], [])
+    assert routed['аннулировать'] == ([], [])
+    assert unrouted == 2
+    assert normalize_lemma(' Ёрничать ') == 'ерничать'
+
+
+def test_planner_packs_by_estimates():
+    """
+    Tests weather words are packed up to the hit budget and word limit
+    and frequent words are searched alone
+    Returns:
+
+    """
+    planner = BatchPlanner(max_hits=50, max_words=3,
+                           estimates={'a': 10, 'b': 10, 'c': 100, 'd': 5, 'e': 5,
+                                      'f': 5, 'g': 5})
+    assert list(planner.batches('abcdefg')) == [['a', 'b'], ['c'], ['d', 'e', 'f'], ['g']]
+
+
+def test_planner_adapts_to_observed_hits():
+    """
+    Tests weather unknown words are estimated by the median of hits observed so far
+    Returns:
+
+    """
+    planner = BatchPlanner(max_hits=40, max_words=10, default_estimate=20)
+    batches = planner.batches([f'w{i}' for i in range(12)])
+    first = next(batches)
+    assert len(first) == 2
+    for word in first:
+        planner.observe(word, 4)
+    assert len(next(batches)) == 10
+    planner.observe('w2', 400)
+    assert planner.estimate('unknown') == 4
+
+
+def test_estimates_from_output():
+    """
+    Tests weather earlier results are used as estimates
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'абонировать', [{}, {}], [{}])
+        assert estimates_from_output(tmp) == {'абонировать': 3}
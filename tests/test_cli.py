@@ -0,0 +1,93 @@
+"""
+Tests for the command line interface
+"""
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from cli import main
+from context_store import STORE_NAME, ContextStore
+from records import load_word_data, save_word_data
+
+ROOT = Path(__file__).parent.parent
+PERFECTIVE = {'словоформа': 'атаковал', 'контекст': 'Он атаковал.', 'лемма': 'атаковать',
+              'грамматика': 'глагол, совершенный, прошедшее',
+              'синтаксические признаки': 'сказуемое'}
+IMPERFECTIVE = {**PERFECTIVE, 'грамматика': 'глагол, несовершенный, прошедшее'}
+
+
+def test_offline_commands_do_not_import_selenium():
+    """
+    Tests weather offline subcommands run without importing browser modules
+    Returns:
+
+    """
+    code = ('import sys, cli; cli.main(["validate-config"]); '
+            'assert "selenium" not in sys.modules and "scrapper" not in sys.modules')
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True)
+    code = ('import sys, cli; cli.main(["stats", "--output", "missing"]); '
+            'assert "lxml" not in sys.modules')
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True)
+
+
+def test_validate_config(capsys):
+    """
+    Tests weather validate-config accepts the shipped config and rejects a broken one
+    Returns:
+
+    """
+    assert main(['validate-config', '--config', str(ROOT / 'config' / 'scrapper_config.json')]) == 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'config.json'
+        path.write_text(json.dumps({'seed_url': 'url', 'timeout': 100}), encoding='utf-8')
+        assert main(['validate-config', '--config', str(path)]) == 1
+    assert "missing key 'x_paths'" in capsys.readouterr().err
+
+
+def test_scrape_fails_without_words(capsys):
+    """
+    Tests weather scrape exits non-zero when the word list cannot be read
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        assert main(['scrape', '--words', str(Path(tmp) / 'missing.txt'),
+                     '--output', tmp]) == 1
+    assert "File not found error" in capsys.readouterr().err
+
+
+def test_stats_and_export(capsys):
+    """
+    Tests weather stats counts records and export resolves deduplicated contexts
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ContextStore(Path(tmp) / STORE_NAME)
+        save_word_data(tmp, 'атаковать', [store.deduplicate(PERFECTIVE)], [IMPERFECTIVE])
+        store.save()
+
+        assert main(['stats', '--json', '--output', tmp]) == 0
+        counts = json.loads(capsys.readouterr().out)
+        assert counts['total'] == {'perfective': 1, 'imperfective': 1}
+
+        assert main(['export', '--format', 'jsonl', '--output', tmp]) == 0
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [row['контекст'] for row in rows] == ['Он атаковал.', 'Он атаковал.']
+        assert [row['вид'] for row in rows] == ['perfective', 'imperfective']
+
+
+def test_reparse_moves_misfiled_records():
+    """
+    Tests weather reparse moves records to the aspect given by their grammar
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'атаковать', [PERFECTIVE, IMPERFECTIVE], [])
+        assert main(['reparse', '--dry-run', '--output', tmp]) == 0
+        assert load_word_data(tmp, 'атаковать') == ([PERFECTIVE, IMPERFECTIVE], [])
+        assert main(['reparse', '--output', tmp]) == 0
+        assert load_word_data(tmp, 'атаковать') == ([PERFECTIVE], [IMPERFECTIVE])
@@ -0,0 +1,96 @@
+"""
+Tests for config compilation and selector validation
+"""
+import copy
+from pathlib import Path
+
+import pytest
+
+from config.config_loader import load_config
+from config.compiled_config import (ConfigError, XPATH, CSS_SELECTOR, check_fixture,
+                                    compile_config, css_syntax_error, xpath_syntax_error)
+
+CONFIG_PATH = Path(__file__).parent.parent / 'config' / 'scrapper_config.json'
+CONFIG = load_config(CONFIG_PATH)
+FIXTURE_PATH = CONFIG_PATH.parent / CONFIG['selector_fixture']
+
+
+def test_compile_config_locators():
+    """
+    Tests weather the shipped config compiles into locators of the right kind
+    Returns:
+
+    """
+    compiled = compile_config(CONFIG)
+    assert compiled.lemma == (XPATH, CONFIG['x_paths']['lemma'])
+    assert compiled.word_elements == (CSS_SELECTOR, CONFIG['x_paths']['word_elements'])
+    assert compiled.modal_close_button == (CSS_SELECTOR, CONFIG['x_paths']['modal_close'])
+    assert compiled.empty_results is None
+    assert len(compiled.syntax_features) == len(CONFIG['x_paths']['syntax_features_option'])
+    assert compiled.context(3) is compiled.context(3)
+    assert 'position()=3' in compiled.context(3)[1]
+
+
+def test_compile_config_rejects_invalid_schema():
+    """
+    Tests weather a config with a missing section is rejected
+    Returns:
+
+    """
+    config = copy.deepcopy(CONFIG)
+    del config['x_paths']
+    with pytest.raises(ConfigError, match="x_paths"):
+        compile_config(config)
+    with pytest.raises(ConfigError, match="browser_args"):
+        compile_config({**CONFIG, 'browser_args': '--ignore-certificate-errors'})
+    with pytest.raises(ConfigError, match="browser_contexts"):
+        compile_config({**CONFIG, 'browser_contexts': '4'})
+    with pytest.raises(ConfigError, match="browser_executable"):
+        compile_config({**CONFIG, 'browser_executable': 1})
+
+
+def test_compile_config_rejects_invalid_selectors():
+    """
+    Tests weather malformed XPaths and CSS selectors are rejected at load time
+    Returns:
+
+    """
+    config = copy.deepcopy(CONFIG)
+    config['x_paths']['grammar'] = "/html/body/div[6]/div[1"
+    config['x_paths']['next_page_button'] = "//li[@class='next']"
+    config['x_paths']['empty_results'] = ".results-empty["
+    with pytest.raises(ConfigError) as error:
+        compile_config(config)
+    assert 'x_paths.grammar' in str(error.value)
+    assert 'x_paths.next_page_button' in str(error.value)
+    assert 'x_paths.empty_results' in str(error.value)
+    config = copy.deepcopy(CONFIG)
+    config['x_paths']['empty_results'] = ".results-empty"
+    assert compile_config(config).empty_results == (CSS_SELECTOR, '.results-empty')
+
+
+def test_syntax_checks():
+    """
+    Tests weather syntax checks accept valid and reject broken selectors
+    Returns:
+
+    """
+    assert xpath_syntax_error("(//span[@class='hit word'])[position()=1]") is None
+    assert xpath_syntax_error("//span[@class='hit word']]") is not None
+    assert css_syntax_error(".ant-pagination-next:not(.ant-pagination-disabled)") is None
+    assert css_syntax_error(".ant-pagination-next:not(") is not None
+
+
+def test_check_fixture():
+    """
+    Tests weather the shipped selectors match the fixture page
+    and a broken one is reported
+    Returns:
+
+    """
+    page_source = FIXTURE_PATH.read_text(encoding='utf-8')
+    assert not check_fixture(compile_config(CONFIG), page_source)
+    config = copy.deepcopy(CONFIG)
+    config['x_paths']['lemma'] = '/html/body/div[7]/div'
+    config['x_paths']['modal_close'] = 'button.modal-close'
+    assert check_fixture(compile_config(config), page_source) == ['lemma', 'modal_close_button']
@@ -15,7 +15,8 @@ def test_config_completeness():
     """
     with open(CONFIG_PATH, encoding='utf-8') as f:
         content = json.load(f)
-    assert set(content.keys()) == {'timeout', 'x_paths', 'seed_url'}
+    assert set(content.keys()) == {'timeout', 'x_paths', 'seed_url', 'backend',
+                                   'selector_fixture', 'driver_recycling'}
 
 
 def test_config_datatypes():
@@ -26,7 +27,8 @@ def test_config_datatypes():
     """
     with open(CONFIG_PATH, encoding='utf-8') as f:
         content = json.load(f)
-    types_mapping = {'seed_url': str, 'x_paths': dict, 'timeout': int}
+    types_mapping = {'seed_url': str, 'x_paths': dict, 'timeout': int, 'backend': str,
+                     'selector_fixture': str, 'driver_recycling': dict}
     for k in content:
         assert isinstance(content[k], types_mapping[k])
 
@@ -74,3 +76,32 @@ def test_time_out():
         content = json.load(f)
     assert content['timeout'] < 60
     assert content['timeout'] > 0
+
+
+def test_backend():
+    """
+    Tests weather backend is one of the supported ones
+    Returns:
+
+    """
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        content = json.load(f)
+    assert content['backend'] in {'selenium', 'playwright'}
+
+
+def test_driver_recycling():
+    """
+    Tests weather driver recycling thresholds are positive numbers
+    Returns:
+
+    """
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        content = json.load(f)
+    recycling = content['driver_recycling']
+    assert set(recycling) == {'max_rss_mb', 'max_hits', 'max_latency_drift',
+                              'prewarm_ratio', 'max_restore_pages', 'metrics_path'}
+    for key in ('max_rss_mb', 'max_hits', 'max_latency_drift', 'prewarm_ratio',
+                'max_restore_pages'):
+        assert recycling[key] > 0
+    assert 0 < recycling['prewarm_ratio'] < 1
+    assert recycling['metrics_path'] is None
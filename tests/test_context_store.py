@@ -0,0 +1,159 @@
+"""
+Tests for ContextStore abstraction
+"""
+import tempfile
+from pathlib import Path
+
+from context_store import STORE_NAME, ContextStore, context_hash, hit_key
+from records import save_word_data
+
+RECORD = {'словоформа': 'абонированных',
+          'контекст': 'Первые ряды абонированных кресел.',
+          'лемма': 'абонировать',
+          'грамматика': 'глагол, совершенный',
+          'синтаксические признаки': 'атрибутивный модификатор'}
+
+
+def test_deduplicate_replaces_repeated_context():
+    """
+    Tests weather deduplicate keeps a new context inline
+    and replaces a repeated one with its hash
+    Returns:
+
+    """
+    store = ContextStore()
+    assert store.deduplicate(RECORD) == RECORD
+    assert not any(store.contexts.values())
+    record = store.deduplicate(RECORD)
+    assert 'контекст' not in record
+    assert record['контекст_id'] == context_hash(RECORD['контекст'])
+    assert store.contexts == {record['контекст_id']: RECORD['контекст']}
+
+
+def test_deduplicate_shares_contexts():
+    """
+    Tests weather equal contexts are stored once
+    Returns:
+
+    """
+    store = ContextStore()
+    first = store.deduplicate(RECORD)
+    second = store.deduplicate({**RECORD, 'словоформа': 'абонировано'})
+    third = store.deduplicate({**RECORD, 'словоформа': 'абонированы'})
+    assert first['контекст'] == RECORD['контекст']
+    assert second['контекст_id'] == third['контекст_id'] == context_hash(RECORD['контекст'])
+    assert len(store.contexts) == 1
+
+
+def test_resolve_round_trip():
+    """
+    Tests weather resolve restores the deduplicated record
+    and leaves inline records untouched
+    Returns:
+
+    """
+    store = ContextStore()
+    store.deduplicate(RECORD)
+    assert store.resolve(store.deduplicate(RECORD)) == RECORD
+    assert store.resolve(RECORD) == RECORD
+
+
+def test_hits_and_persistence():
+    """
+    Tests weather contexts survive save and load and stored hits point
+    at the saved records instead of copying them
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ContextStore(Path(tmp) / STORE_NAME)
+        store.deduplicate(RECORD)
+        record = store.deduplicate(RECORD)
+        key = hit_key(record['контекст_id'], RECORD['словоформа'], 1)
+        assert store.get_hit('абонировать', key) is None
+        store.add_hit('абонировать', key, record)
+        assert store.get_hit('абонировать', key) == record
+        store.commit('абонировать', [record], [])
+        store.save()
+        save_word_data(tmp, 'абонировать', [record], [])
+
+        content = (Path(tmp) / STORE_NAME).read_text(encoding='utf-8')
+        assert len(content.splitlines()) == 2
+        assert RECORD['грамматика'] not in content
+
+        loaded = ContextStore(Path(tmp) / STORE_NAME)
+        assert loaded.get_hit('абонировать', key) == record
+        assert loaded.resolve(loaded.get_hit('абонировать', key)) == RECORD
+
+
+def test_save_appends_only_new_lines():
+    """
+    Tests weather saving twice does not rewrite what is already stored
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ContextStore(Path(tmp) / STORE_NAME)
+        store.deduplicate(RECORD)
+        store.deduplicate(RECORD)
+        store.save()
+        store.save()
+        store.deduplicate(RECORD)
+        store.deduplicate({**RECORD, 'контекст': 'Другое предложение.'})
+        store.deduplicate({**RECORD, 'контекст': 'Другое предложение.'})
+        store.save()
+        assert len((Path(tmp) / STORE_NAME).read_text(encoding='utf-8').splitlines()) == 2
+        assert len(ContextStore(Path(tmp) / STORE_NAME).contexts) == 2
+
+
+def test_stale_hit_pointer_is_ignored():
+    """
+    Tests weather a hit pointing at a record that was rewritten since is treated as new
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ContextStore(Path(tmp) / STORE_NAME)
+        record = store.deduplicate(RECORD)
+        key = hit_key(context_hash(RECORD['контекст']), RECORD['словоформа'], 1)
+        store.add_hit('абонировать', key, record)
+        store.commit('абонировать', [record], [])
+        store.save()
+        save_word_data(tmp, 'абонировать', [], [record])
+        assert ContextStore(Path(tmp) / STORE_NAME).get_hit('абонировать', key) is None
+
+
+def test_inline_contexts_of_saved_words_are_known():
+    """
+    Tests weather a context saved inline by an earlier run is not inlined again
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'абонировать', [RECORD], [])
+        store = ContextStore(Path(tmp) / STORE_NAME)
+        assert store.deduplicate(RECORD)['контекст_id'] == context_hash(RECORD['контекст'])
+
+
+def test_reused_hit_references_its_context():
+    """
+    Tests weather a stored hit reused for another word references its context
+    instead of repeating it inline, and unsaved hits are forgotten with their search
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ContextStore(Path(tmp) / STORE_NAME)
+        key = hit_key(context_hash(RECORD['контекст']), RECORD['словоформа'], 1)
+        record = store.add_hit('абонировать', key, RECORD)
+        assert record == RECORD
+        store.commit('абонировать', [record], [])
+        store.save()
+        save_word_data(tmp, 'абонировать', [record], [])
+
+        loaded = ContextStore(Path(tmp) / STORE_NAME)
+        reused = loaded.get_hit('абонироваться', key)
+        assert 'контекст' not in reused
+        assert loaded.resolve(reused) == RECORD
+        loaded.release('абонироваться')
+        assert not loaded.pending
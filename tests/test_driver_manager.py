@@ -0,0 +1,172 @@
+"""
+Tests for DriverManager with fake drivers
+"""
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from config.config_loader import DRIVER_RECYCLING
+from driver_manager import DriverManager
+
+
+class FakeDriver:
+    """
+    Driver whose command latency can be set
+    """
+
+    def __init__(self):
+        # the chromedriver service, pointing at the test process
+        self.service = SimpleNamespace(process=SimpleNamespace(pid=os.getpid()))
+        self.latency = 0.001
+        self.opened = []
+        self.closed = False
+
+    def execute_script(self, script):
+        """
+        Sleeps for the configured latency
+        Returns:
+            1
+        """
+        assert script == "return 1;"
+        time.sleep(self.latency)
+        return 1
+
+    def get(self, url):
+        """
+        Records the opened url
+        """
+        self.opened.append(url)
+
+    def quit(self):
+        """
+        Marks the driver closed
+        """
+        self.closed = True
+
+
+def make_manager(**thresholds):
+    """
+    Creates a DriverManager over fake drivers
+    Returns:
+        the manager and the list of created drivers
+    """
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    return DriverManager(factory, {**DRIVER_RECYCLING, **thresholds}, 'http://seed'), drivers
+
+
+def test_recycle_on_hits():
+    """
+    Tests weather the driver is replaced once the hit threshold is reached
+    and the old driver is closed
+    Returns:
+
+    """
+    manager, drivers = make_manager(max_hits=10)
+    first = manager.driver
+    manager.record_hits(5)
+    assert manager.checkpoint() is False
+    manager.record_hits(5)
+    assert manager.checkpoint() is True
+    assert manager.driver is not first
+    assert manager.hits == 0
+    manager.close()
+    assert all(driver.closed for driver in drivers)
+    assert manager.metrics()['recycles'][0]['reason'] == ['hits']
+
+
+def test_prewarm_before_threshold():
+    """
+    Tests weather a replacement is started and opens the seed url
+    once a metric gets close to its threshold, and is used on recycle
+    Returns:
+
+    """
+    manager, drivers = make_manager(max_hits=10, prewarm_ratio=0.5)
+    manager.record_hits(6)
+    manager.checkpoint()
+    spare = manager.spare.result()
+    assert spare.opened == ['http://seed']
+    manager.record_hits(4)
+    assert manager.checkpoint() is True
+    assert manager.driver is spare
+    assert manager.events[0]['prewarmed'] is True
+    assert len(drivers) == 2
+    manager.close()
+
+
+def test_recycle_on_latency_drift():
+    """
+    Tests weather growing command latency triggers recycling
+    Returns:
+
+    """
+    manager, _ = make_manager(max_latency_drift=3.0)
+    for _ in range(5):
+        assert manager.checkpoint() is False
+    manager.driver.latency = 0.02
+    recycled = [manager.checkpoint() for _ in range(5)]
+    assert recycled[-1] is True
+    assert manager.events[0]['reason'] == ['latency']
+    manager.close()
+
+
+def test_recycle_on_rss():
+    """
+    Tests weather memory above the threshold triggers recycling
+    Returns:
+
+    """
+    manager, _ = make_manager(max_rss_mb=1)
+    assert manager.rss_mb() > 1
+    assert manager.checkpoint() is True
+    assert manager.events[0]['reason'] == ['rss']
+    manager.close()
+
+
+def test_metrics_export():
+    """
+    Tests weather a metrics sample is appended to the metrics file at every checkpoint
+    and recycle events follow their sample
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'metrics.jsonl'
+        manager, _ = make_manager(max_hits=1, metrics_path=str(path))
+        assert manager.checkpoint() is False
+        for _ in range(2):
+            manager.record_hits(1)
+            manager.checkpoint()
+        manager.close()
+        entries = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [entry['type'] for entry in entries] == ['sample', 'sample', 'recycle',
+                                                    'sample', 'recycle']
+    assert {'rss_mb', 'hits', 'latency_ms', 'latency_drift', 'uptime_s'} <= set(entries[0])
+    events = [entry for entry in entries if entry['type'] == 'recycle']
+    assert {'reason', 'rss_mb', 'hits', 'latency_drift', 'prewarmed'} <= set(events[0])
+    assert manager.metrics()['drivers_started'] == 3
+
+
+def test_deferred_checkpoint():
+    """
+    Tests weather a deferred checkpoint only pre-warms a replacement
+    and the next checkpoint swaps to it
+    Returns:
+
+    """
+    manager, drivers = make_manager(max_hits=10)
+    manager.record_hits(10)
+    assert manager.checkpoint(defer=True) is False
+    spare = manager.spare.result()
+    assert manager.driver is drivers[0]
+    assert manager.checkpoint() is True
+    assert manager.driver is spare
+    manager.close()
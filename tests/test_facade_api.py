@@ -18,7 +18,7 @@ def test_init_completeness():
     Returns:
 
     """
-    assert set(API.__dict__.keys()) == {'config', 'driver', 'scrapper'}
+    assert set(API.__dict__.keys()) == {'config', 'driver_manager', 'scrapper'}
 
 
 def test_init_types():
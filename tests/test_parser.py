@@ -2,6 +2,7 @@
 Tests for parser abstraction
 """
 
+import copy
 import time
 import unittest
 from pathlib import Path
@@ -97,34 +98,31 @@ class TestParser(unittest.TestCase):
         Test the extraction of lemma with an incorrect XPath
         to ensure it handles errors properly.
         """
-        original_xpath = self.parser.config["x_paths"]["lemma"]
-        self.parser.config["x_paths"]["lemma"] = \
+        config = copy.deepcopy(self.config)
+        config["x_paths"]["lemma"] = \
             '/html/body/div[106]/div/div/div/div[1]/div[2]/div[1]/table/tr[2]/td[2]/span[1]/i'
-        lemma = self.parser.extract_lemma()
+        lemma = Parser(self.driver, config).extract_lemma()
         self.assertIsNone(lemma)
-        self.parser.config["x_paths"]["lemma"] = original_xpath
 
     def test_extract_grammar_wrong_xpath(self):
         """
         Verify how the parser behaves when extracting grammar with an incorrect XPath.
         """
-        original_xpath = self.parser.config["x_paths"]["grammar"]
-        self.parser.config["x_paths"]["grammar"] = \
+        config = copy.deepcopy(self.config)
+        config["x_paths"]["grammar"] = \
             '/html/body/div[106]/div/div/div/div[1]/div[2]/div[1]/table/tr[2]/td[2]/span[1]/i'
-        grammar = self.parser.extract_grammar()
+        grammar = Parser(self.driver, config).extract_grammar()
         self.assertIsNone(grammar)
-        self.parser.config["x_paths"]["grammar"] = original_xpath
 
     def test_extract_syntax_features_wrong_xpath(self):
         """
         Test the extraction of syntax features with an incorrect XPath to check error handling.
         """
-        original_xpath = self.parser.config["x_paths"]["syntax_features_option"]
-        self.parser.config["x_paths"]["syntax_features_option"] = \
+        config = copy.deepcopy(self.config)
+        config["x_paths"]["syntax_features_option"] = \
             ['/html/body/div[106]/div/div/div/div[1]/div[2]/div[1]/table/tr[2]/td[2]/span[1]/i']
-        syntax_features = self.parser.extract_syntax_features()
+        syntax_features = Parser(self.driver, config).extract_syntax_features()
         self.assertIsNone(syntax_features)
-        self.parser.config["x_paths"]["syntax_features_option"] = original_xpath
 
     def set_down(self):
         """
@@ -0,0 +1,122 @@
+"""
+Tests for recording network events into an archive
+"""
+import base64
+import json
+import tempfile
+from pathlib import Path
+
+from recorder import NetworkRecorder, save_fixture
+from replay_archive import ArchiveWriter, ReplayArchive
+
+
+class FakeDriver:
+    """
+    Driver returning prepared performance log entries and response bodies
+    """
+
+    def __init__(self, events, bodies):
+        self.log = [{'message': json.dumps({'message': event})} for event in events]
+        self.bodies = bodies
+
+    def get_log(self, name):
+        """
+        Returns:
+            the log entries collected since the previous call
+        """
+        assert name == 'performance'
+        log, self.log = self.log, []
+        return log
+
+    def execute_cdp_cmd(self, command, params):
+        """
+        Returns:
+            the body of a response
+        """
+        assert command == 'Network.getResponseBody'
+        return self.bodies[params['requestId']]
+
+
+def event(method, **params):
+    """
+    Returns:
+        a DevTools event
+    """
+    return {'method': method, 'params': params}
+
+
+def test_network_recorder():
+    """
+    Tests weather finished responses, redirects, preflights and request bodies are recorded
+    and failed or non-http requests and redirects to the same URL are skipped
+    Returns:
+
+    """
+    events = [
+        event('Network.requestWillBeSent', requestId='1', timestamp=0.9,
+              request={'url': 'http://site/', 'method': 'GET'}),
+        event('Network.requestWillBeSent', requestId='1', timestamp=1.0,
+              request={'url': 'https://site/', 'method': 'GET'},
+              redirectResponse={'status': 301, 'headers': {'Location': 'https://site/'}}),
+        event('Network.requestWillBeSent', requestId='1', timestamp=1.05,
+              request={'url': 'https://site/', 'method': 'GET'},
+              redirectResponse={'status': 307, 'headers': {'Location': 'https://site/'}}),
+        event('Network.requestWillBeSent', requestId='1', timestamp=1.1,
+              request={'url': 'https://site/search', 'method': 'GET'},
+              redirectResponse={'status': 302, 'headers': {'Location': 'https://site/search'}}),
+        event('Network.responseReceived', requestId='1', timestamp=1.2,
+              response={'status': 200, 'headers': {'Content-Type': 'text/html'}}),
+        event('Network.loadingFinished', requestId='1', timestamp=1.5),
+        event('Network.requestWillBeSent', requestId='2', timestamp=2.0,
+              request={'url': 'https://site/api', 'method': 'POST', 'postData': '{"q": 1}'}),
+        event('Network.responseReceived', requestId='2', timestamp=2.0,
+              response={'status': 200, 'headers': {'content-type': 'image/png'}}),
+        event('Network.loadingFinished', requestId='2', timestamp=2.01),
+        event('Network.requestWillBeSent', requestId='3', timestamp=3.0,
+              request={'url': 'https://site/broken', 'method': 'GET'}),
+        event('Network.loadingFailed', requestId='3', timestamp=3.1),
+        event('Network.requestWillBeSent', requestId='4', timestamp=4.0,
+              request={'url': 'data:image/png;base64,AA==', 'method': 'GET'}),
+        event('Network.requestWillBeSent', requestId='5', timestamp=5.0,
+              request={'url': 'https://site/api', 'method': 'OPTIONS'}),
+        event('Network.responseReceived', requestId='5', timestamp=5.02,
+              response={'status': 204, 'headers': {'Access-Control-Allow-Origin': '*',
+                                                   'Content-Encoding': 'gzip'}}),
+    ]
+    bodies = {'1': {'body': '<html>результаты</html>', 'base64Encoded': False},
+              '2': {'body': base64.b64encode(b'\x89PNG').decode(), 'base64Encoded': True}}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'run.zip'
+        with ArchiveWriter(path, 'https://site/search') as writer:
+            NetworkRecorder(FakeDriver(events, bodies), writer).drain()
+        archive = ReplayArchive(path)
+        assert [(entry['url'], entry['status']) for entry in archive.responses] == [
+            ('http://site/', 301), ('https://site/', 302), ('https://site/search', 200),
+            ('https://site/api', 200), ('https://site/api', 204)]
+        assert archive.responses[1]['headers'] == {'location': 'https://site/search'}
+        assert round(archive.responses[2]['elapsed_ms']) == 400
+        assert archive.body(archive.match('GET', 'https://site/search')) == \
+            '<html>результаты</html>'.encode()
+        assert archive.body(archive.match('POST', 'https://site/api', b'{"q": 1}')) == b'\x89PNG'
+        assert archive.match('OPTIONS', 'https://site/api')['headers'] == \
+            {'access-control-allow-origin': '*'}
+        archive.close()
+
+
+def test_save_fixture():
+    """
+    Tests weather the first recorded page with an open modal is saved as the fixture
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_path = Path(tmp) / 'run.zip'
+        with ArchiveWriter(archive_path) as writer:
+            writer.add_snapshot('results', '<p>results</p>', 'https://site/results')
+            writer.add_snapshot('modal', '<p>modal</p>', 'https://site/results')
+        assert save_fixture(archive_path, Path(tmp) / 'fixture.html')
+        assert (Path(tmp) / 'fixture.html').read_text(encoding='utf-8') == '<p>modal</p>'
+
+        with ArchiveWriter(archive_path) as writer:
+            writer.add_snapshot('results', '<p>results</p>', 'https://site/results')
+        assert not save_fixture(archive_path, Path(tmp) / 'other.html')
@@ -0,0 +1,45 @@
+"""
+Tests for records helpers
+"""
+import tempfile
+
+from records import add_record, classify_aspect, load_word_data, save_word_data, scraped_words
+
+
+def test_classify_aspect():
+    """
+    Tests weather grammar descriptions are classified by aspect
+    Returns:
+
+    """
+    assert classify_aspect('глагол, несовершенный, настоящее') == 'imperfective'
+    assert classify_aspect('глагол, совершенный, прошедшее') == 'perfective'
+    assert classify_aspect('существительное, мужской') is None
+    assert classify_aspect(None) is None
+
+
+def test_add_record():
+    """
+    Tests weather records are added to the list of their aspect
+    and records of other parts of speech are dropped
+    Returns:
+
+    """
+    records = ([], [])
+    add_record(records, {'грамматика': 'глагол, несовершенный, настоящее'})
+    add_record(records, {'грамматика': 'существительное, мужской'})
+    assert records == ([], [{'грамматика': 'глагол, несовершенный, настоящее'}])
+
+
+def test_save_and_load_word_data():
+    """
+    Tests weather saved word data is loaded back
+    and listed among scraped words
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'абонировать', [{'лемма': 'абонировать'}], [])
+        assert load_word_data(tmp, 'абонировать') == ([{'лемма': 'абонировать'}], [])
+        assert load_word_data(tmp, 'атаковать') == ([], [])
+        assert scraped_words(tmp) == {'абонировать'}
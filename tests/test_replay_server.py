@@ -0,0 +1,223 @@
+"""
+Tests for the replay archive and server
+"""
+import ssl
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from urllib.parse import quote
+
+import pytest
+
+from benchmarks.mock_site import SEARCH_PAGE, MockSite
+from config.compiled_config import load_compiled_config
+from driver_init import init_driver
+from replay_archive import ArchiveWriter, ReplayArchive, request_url
+from replay_server import ReplayServer
+from scrapper import Scrapper
+
+SEED_URL = 'https://ruscorpora.ru/search?search=abc'
+API_URL = 'https://ruscorpora.ru/api/search'
+CORS_HEADERS = {'Access-Control-Allow-Origin': '*', 'Access-Control-Allow-Headers': 'content-type'}
+
+
+def write_archive(path):
+    """
+    Writes a small archive with a page, an API call, a CDN file and a snapshot
+    Returns:
+
+    """
+    def request(method, url, post_data=None):
+        return {'method': method, 'url': url, 'post_data': post_data}
+
+    def response(content_type, **headers):
+        return {'status': 200, 'headers': {'Content-Type': content_type, **headers}}
+
+    with ArchiveWriter(path, SEED_URL) as writer:
+        writer.add_response(request('GET', SEED_URL),
+                            response('text/html', **{'Set-Cookie': 'a=b'}),
+                            b'<html>search</html>', elapsed_ms=150)
+        writer.add_response(request('OPTIONS', API_URL),
+                            {'status': 204, 'headers': CORS_HEADERS}, b'')
+        writer.add_response(request('POST', API_URL, b'{"page": 1}'),
+                            response('application/json', **CORS_HEADERS),
+                            b'{"page": 1}', elapsed_ms=10)
+        writer.add_response(request('POST', API_URL, b'{"page": 2}'),
+                            response('application/json'), b'{"page": 2}', elapsed_ms=10)
+        writer.add_response(request('GET', 'https://cdn.example/app.js'),
+                            response('text/javascript'), b'<html>search</html>')
+        writer.add_response(request('GET', 'https://cdn.example/search?search=abc'),
+                            response('text/plain'), b'cdn search')
+        writer.add_snapshot('modal', '<html>modal</html>', SEED_URL, word='абонировать')
+
+
+def fetch(url, data=None, host=None):
+    """
+    Requests a URL, from another host if given, without verifying certificates
+    Returns:
+        status, content type and body
+    """
+    request = urllib.request.Request(url, data=data, headers={'Host': host} if host else {})
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    with urllib.request.urlopen(request, context=context) as response:
+        return response.status, response.headers['Content-Type'], response.read()
+
+
+def test_archive_deduplicates_bodies():
+    """
+    Tests weather identical bodies are stored once and only replayable headers are kept
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'run.zip'
+        write_archive(path)
+        archive = ReplayArchive(path)
+        bodies = [name for name in archive.archive.namelist() if name.startswith('bodies/')]
+        assert len(bodies) == 4
+        assert archive.responses[0]['headers'] == {'content-type': 'text/html'}
+        assert archive.responses[2]['headers'] == {
+            'content-type': 'application/json', 'access-control-allow-origin': '*',
+            'access-control-allow-headers': 'content-type'}
+        assert archive.snapshot(0) == '<html>modal</html>'
+        archive.close()
+
+
+def test_request_url():
+    """
+    Tests weather URLs are matched without fragments and default ports
+    Returns:
+
+    """
+    assert request_url('HTTPS://RusCorpora.ru:443/search?q=1#top') == \
+        'https://ruscorpora.ru/search?q=1'
+    assert request_url('http://localhost:8080') == 'http://localhost:8080/'
+
+
+def test_replay_matches_host_target_and_body():
+    """
+    Tests weather requests, preflights included, are answered by scheme, host, path,
+    query and request body, and requests to the server's own address as requests
+    to the recorded search page's host
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'run.zip'
+        write_archive(path)
+        with ReplayServer(path) as server:
+            assert server.url == f'{server.base_url}/search?search=abc'
+            assert fetch(server.url) == (200, 'text/html', b'<html>search</html>')
+            api = f'{server.base_url}/api/search'
+            assert fetch(api, b'{"page": 2}')[2] == b'{"page": 2}'
+            assert fetch(api, b'{"page": 1}')[2] == b'{"page": 1}'
+            with urllib.request.urlopen(urllib.request.Request(api, method='OPTIONS')) as response:
+                assert response.status == 204
+                assert response.headers['Access-Control-Allow-Origin'] == '*'
+            assert fetch(server.snapshot_url(0))[2] == b'<html>modal</html>'
+            with pytest.raises(urllib.error.HTTPError):
+                fetch(f'{server.base_url}/app.js')
+            assert server.misses == ['GET https://ruscorpora.ru/app.js']
+
+            tls_url = f"https://127.0.0.1:{server.port('https')}/search?search=abc"
+            assert fetch(tls_url, host='ruscorpora.ru')[2] == b'<html>search</html>'
+            assert fetch(tls_url, host='cdn.example')[2] == b'cdn search'
+            with pytest.raises(urllib.error.HTTPError):
+                fetch(server.url, host='cdn.example')
+
+
+def test_browser_args():
+    """
+    Tests weather the browser is sent to the HTTP and HTTPS ports of the server
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'run.zip'
+        write_archive(path)
+        with ReplayServer(path) as server:
+            assert server.browser_args == [
+                f"--host-resolver-rules=MAP *:80 127.0.0.1:{server.port()}, "
+                f"MAP *:443 127.0.0.1:{server.port('https')}, EXCLUDE localhost",
+                "--ignore-certificate-errors"]
+        with ReplayServer(path, tls_port=None) as server:
+            assert server.port('https') is None
+            assert server.browser_args == [
+                f"--host-resolver-rules=MAP *:80 127.0.0.1:{server.port()}, EXCLUDE localhost"]
+
+
+def test_unknown_body_replays_in_recorded_order():
+    """
+    Tests weather a request body that was not recorded falls back to
+    the responses for the same target in recorded order
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'run.zip'
+        write_archive(path)
+        archive = ReplayArchive(path)
+        bodies = [archive.body(archive.match('POST', API_URL, b'{"t": 1}'))
+                  for _ in range(3)]
+        assert bodies == [b'{"page": 1}', b'{"page": 2}', b'{"page": 2}']
+        archive.rewind()
+        assert archive.body(archive.match('POST', API_URL, b'{}')) == b'{"page": 1}'
+        archive.close()
+
+
+def test_scaled_timings():
+    """
+    Tests weather responses are delayed by their recorded duration divided by speed
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'run.zip'
+        write_archive(path)
+        with ReplayServer(path, speed=0.5) as server:
+            start = time.perf_counter()
+            fetch(server.url)
+            assert time.perf_counter() - start >= 0.3
+        with ReplayServer(path, speed=0) as server:
+            start = time.perf_counter()
+            fetch(server.url)
+            assert time.perf_counter() - start < 0.3
+
+
+def test_scrapper_replays_recorded_site():
+    """
+    Tests weather the Scrapper collects a word from an archive recorded from
+    an HTTPS site, with the recorded seed_url and the server's browser_args
+    Returns:
+
+    """
+    word = 'абонировать'
+    seed_url = 'https://ruscorpora.ru/search'
+    with MockSite(hits_per_word=6, per_page=4) as site, \
+            tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'run.zip'
+        with ArchiveWriter(path, seed_url) as writer:
+            html = {'status': 200, 'headers': {'Content-Type': 'text/html; charset=utf-8'}}
+            writer.add_response({'method': 'GET', 'url': seed_url}, html,
+                                SEARCH_PAGE.encode('utf-8'))
+            writer.add_response(
+                {'method': 'GET', 'url': f"https://ruscorpora.ru/results?req={quote(word)}"},
+                html, site.results_page(word).encode('utf-8'))
+        with ReplayServer(path) as server:
+            config_path = site.write_config(Path(tmp), seed_url=seed_url,
+                                            browser_args=server.browser_args)
+            compiled = load_compiled_config(config_path)
+            driver = init_driver(browser_args=compiled.browser_args)
+            try:
+                scrapper = Scrapper(driver, compiled)
+                scrapper.navigate_to_search()
+                scrapper.input_word(word)
+                perfective, imperfective = scrapper.collect_data(word)
+            finally:
+                driver.quit()
+            assert (len(perfective), len(imperfective)) == (3, 3)
+            assert not [miss for miss in server.misses if 'favicon' not in miss]
@@ -2,11 +2,17 @@
 Tests for scrapper abstraction
 """
 
+import tempfile
 import time
 from pathlib import Path
 
+import pytest
+from selenium.common import WebDriverException
+
+from benchmarks.mock_site import MockSite
 from scrapper import Scrapper
 from driver_init import init_driver
+from config.compiled_config import load_compiled_config
 from config.config_loader import load_config
 
 
@@ -74,6 +80,49 @@ def test_go_to_next_page():
             or time_diff < 2 and res is False)
 
 
+def test_walk_reports_aborted_walks(monkeypatch):
+    """
+    Tests weather walk reports a walk that reached the last results page as complete
+    and one that could not restore its page after a driver swap as incomplete
+    Returns:
+
+    """
+    with MockSite(hits_per_word=2, per_page=1) as site, tempfile.TemporaryDirectory() as tmp:
+        scrapper = Scrapper(DRIVER, load_compiled_config(site.write_config(Path(tmp))))
+        scrapper.navigate_to_search()
+        scrapper.input_word('абонировать')
+        perfective, imperfective, complete = scrapper.walk('абонировать')
+        assert (len(perfective), len(imperfective), complete) == (1, 1, True)
+
+        monkeypatch.setattr(scrapper, 'checkpoint', lambda page_number: True)
+        monkeypatch.setattr(scrapper, 'restore_page', lambda word, page_number: False)
+        scrapper.navigate_to_search()
+        scrapper.input_word('абонировать')
+        perfective, imperfective, complete = scrapper.walk('абонировать')
+        assert (len(perfective), len(imperfective), complete) == (1, 0, False)
+
+
+def test_walk_counts_only_shown_empty_results_as_complete():
+    """
+    Tests weather a search without hits is complete only if its empty results
+    message is configured and shown, and a failed search raises instead
+    Returns:
+
+    """
+    with MockSite(hits_per_word=0) as site, tempfile.TemporaryDirectory() as tmp:
+        x_paths = {**CONFIG['x_paths'], 'empty_results': '.results-empty'}
+        for overrides, expected in (({}, False), ({'x_paths': x_paths}, True)):
+            config_path = site.write_config(Path(tmp), **overrides)
+            scrapper = Scrapper(DRIVER, load_compiled_config(config_path))
+            scrapper.navigate_to_search()
+            scrapper.input_word('абонировать')
+            assert scrapper.walk('абонировать') == ([], [], expected)
+
+        scrapper.driver.get(site.url.replace('/search', '/results'))
+        with pytest.raises(WebDriverException):
+            scrapper.input_word('абонировать')
+
+
 def test_close_driver():
     """
     Tests weather close_driver return anything
@@ -0,0 +1,44 @@
+"""
+Tests for the batched scraping loop
+"""
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from context_store import STORE_NAME, ContextStore
+from records import scraped_words
+from start import scrape_in_batches
+
+
+def fake_facade(failing):
+    """
+    Makes a facade returning prepared batch results, None for batches with a failing word
+    Returns:
+        the facade and the list of batches it was asked for
+    """
+    batches = []
+
+    def process_batch(words):
+        batches.append(words)
+        if failing in words:
+            return None
+        return {word: ([{'словоформа': word, 'контекст': f'{word}.', 'лемма': word}], [])
+                for word in words}
+
+    return SimpleNamespace(process_batch=process_batch), batches
+
+
+def test_failed_batches_are_not_saved():
+    """
+    Tests weather the words of a failed or aborted batch are left unsaved,
+    so that a resumed run retries them
+    Returns:
+
+    """
+    words = ['абонировать', 'атаковать', 'аннулировать', 'ассоциировать']
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ContextStore(Path(tmp) / STORE_NAME)
+        facade, batches = fake_facade(failing='аннулировать')
+        scrape_in_batches(facade, words, tmp, store, max_hits=50)
+        assert batches == [words[:2], words[2:]]
+        assert scraped_words(tmp) == set(words[:2])
@@ -0,0 +1,99 @@
+"""
+Tests for the full-text index
+"""
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from context_store import STORE_NAME, ContextStore
+from records import save_word_data
+from text_index import INDEX_NAME, TextIndex, parse_query, tokenize
+
+
+def record(wordform, context, lemma='абонировать'):
+    """
+    Builds a minimal record
+    Returns:
+        the record
+    """
+    return {'словоформа': wordform, 'контекст': context, 'лемма': lemma,
+            'грамматика': 'глагол', 'синтаксические признаки': None}
+
+
+def test_tokenize_and_parse_query():
+    """
+    Tests weather text is lower-cased, ё is folded and phrases are grouped
+    Returns:
+
+    """
+    assert tokenize('Ещё абонируйте ЯЧЕЙКУ, кое-где.') == ['еще', 'абонируйте', 'ячейку', 'кое-где']
+    assert parse_query('словоформа:Абонировал "в ячейку"') == [(1, ['абонировал']),
+                                                              (0, ['в', 'ячейку'])]
+
+
+def test_search_terms_phrases_and_filters():
+    """
+    Tests weather term, phrase, wordform and filter queries find the right records
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        save_word_data(tmp, 'абонировать',
+                       [record('абонировал', 'Он абонировал ячейку в банке.')],
+                       [record('абонирует', 'В банке она абонирует ячейку.')])
+        text_index = TextIndex(Path(tmp))
+        assert text_index.update() == 2
+
+        assert len(text_index.search('ячейку')) == 2
+        assert [r['вид'] for r in text_index.search('"ячейку в банке"')] == ['perfective']
+        assert [r['вид'] for r in text_index.search('ячейку', aspect='imperfective')] == \
+            ['imperfective']
+        assert len(text_index.search('словоформа:абонирует')) == 1
+        assert not text_index.search('ячейку', lemma='атаковать')
+        assert not text_index.search('"банке ячейку"')
+        text_index.close()
+
+
+def test_lemma_filter_ignores_case_and_yo():
+    """
+    Tests weather the lemma filter matches regardless of case and ё,
+    also in an index written with an older schema
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        connection = sqlite3.connect(Path(tmp) / INDEX_NAME)
+        connection.execute("CREATE TABLE docs (id INTEGER PRIMARY KEY, lemma TEXT)")
+        connection.close()
+        save_word_data(tmp, 'зачёркивать',
+                       [record('зачеркнул', 'Он зачеркнул строку.', 'Зачеркнуть')],
+                       [record('зачёркивает', 'Она зачёркивает строку.', 'зачёркивать')])
+        text_index = TextIndex(Path(tmp))
+        assert text_index.update() == 2
+        assert [r['лемма'] for r in text_index.search('строку', lemma='зачеркнуть')] == \
+            ['Зачеркнуть']
+        assert [r['лемма'] for r in text_index.search('строку', lemma='Зачеркивать ')] == \
+            ['зачёркивать']
+        text_index.close()
+
+
+def test_incremental_update_and_deduplicated_contexts():
+    """
+    Tests weather only changed files are re-indexed
+    and contexts stored by hash are resolved
+    Returns:
+
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ContextStore(Path(tmp) / STORE_NAME)
+        save_word_data(tmp, 'абонировать', [], [])
+        text_index = TextIndex(Path(tmp))
+        assert text_index.update() == 2
+        assert text_index.update() == 0
+
+        save_word_data(tmp, 'атаковать',
+                       [store.deduplicate(record('атаковал', 'Полк атаковал высоту.'))], [])
+        store.save()
+        assert text_index.update() == 2
+        assert [r['контекст'] for r in text_index.search('высоту')] == ['Полк атаковал высоту.']
+        text_index.close()
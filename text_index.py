@@ -0,0 +1,285 @@
+"""
+Module for a local full-text inverted index over the scraped records.
+
+The 'контекст' and 'словоформа' fields are tokenized, lower-cased and 'ё' is
+folded to 'е'; every token is stored with its position in an SQLite postings
+table next to the data. Files are re-indexed only when their modification
+time or size changes, so updating after new words are scraped is cheap.
+Lemmas are normalized the same way for the lemma filter. An index written with
+another SCHEMA_VERSION is dropped and rebuilt.
+"""
+
+import json
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from context_store import STORE_NAME, ContextStore
+from records import ASPECTS
+
+INDEX_NAME = '.text_index.sqlite'
+CONTEXT, WORDFORM = 0, 1
+CHUNK_SIZE = 500
+TOKEN_RE = re.compile(r'\w+(?:-\w+)*')
+QUERY_RE = re.compile(r'(словоформа:)?(?:"([^"]*)"|(\S+))')
+SCHEMA_VERSION = 2
+TABLES = ('files', 'docs', 'postings')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    verb TEXT NOT NULL,
+    aspect TEXT NOT NULL,
+    lemma TEXT,
+    lemma_key TEXT,
+    wordform TEXT,
+    context TEXT
+);
+CREATE INDEX IF NOT EXISTS docs_file ON docs (file);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    field INTEGER NOT NULL,
+    doc_id INTEGER NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS postings_term ON postings (term, field, doc_id);
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+"""
+
+
+def normalize(text: str) -> str:
+    """
+    Normalizes text for indexing and querying.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: Lower-cased text with 'ё' replaced by 'е'.
+    """
+    return text.lower().replace('ё', 'е')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Splits text into normalized tokens; hyphenated words are kept whole.
+
+    Args:
+        text (Optional[str]): The text.
+
+    Returns:
+        List[str]: The tokens in text order.
+    """
+    return TOKEN_RE.findall(normalize(text)) if text else []
+
+
+def parse_query(query: str) -> List[Tuple[int, List[str]]]:
+    """
+    Parses a query into phrases that all have to match.
+
+    Bare words are single-token phrases, double quotes group a phrase, and the
+    'словоформа:' prefix matches the wordform instead of the context, e.g.
+    'словоформа:атаковал "в ячейку"'.
+
+    Args:
+        query (str): The query.
+
+    Returns:
+        List[Tuple[int, List[str]]]: The field and the tokens of every phrase.
+    """
+    phrases = []
+    for prefix, quoted, bare in QUERY_RE.findall(query):
+        tokens = tokenize(quoted or bare)
+        if tokens:
+            phrases.append((WORDFORM if prefix else CONTEXT, tokens))
+    return phrases
+
+
+class TextIndex:
+    """
+    An on-disk inverted index over the output directory of start.main().
+    """
+
+    def __init__(self, output_dir: Path, index_path: Optional[Path] = None):
+        """
+        Opens or creates the index.
+
+        Args:
+            output_dir (Path): The directory with the scraped JSON files.
+            index_path (Optional[Path]): The SQLite file, '<output_dir>/.text_index.sqlite'
+                by default.
+        """
+        self.output_dir = Path(output_dir)
+        self.connection = sqlite3.connect(index_path or self.output_dir / INDEX_NAME)
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with self.connection:
+                for table in TABLES:
+                    self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.executescript(SCHEMA)
+
+    def _data_files(self) -> Dict[str, Tuple[int, int]]:
+        files = {}
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                aspect, _, rest = entry.name.partition('_')
+                if aspect in ASPECTS and rest.endswith('.json') and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def _remove_file(self, name: str):
+        self.connection.execute(
+            "DELETE FROM postings WHERE doc_id IN (SELECT id FROM docs WHERE file = ?)", (name,))
+        self.connection.execute("DELETE FROM docs WHERE file = ?", (name,))
+        self.connection.execute("DELETE FROM files WHERE name = ?", (name,))
+
+    def _add_file(self, name: str, state: Tuple[int, int], store: ContextStore):
+        aspect, _, rest = name.partition('_')
+        verb = rest[:-len('.json')]
+        with open(self.output_dir / name, 'r', encoding='utf-8') as file:
+            records = json.load(file) or []
+        postings: List[Tuple[str, int, Optional[int], int]] = []
+        for record in records:
+            record = store.resolve(record)
+            lemma = record.get('лемма')
+            cursor = self.connection.execute(
+                "INSERT INTO docs (file, verb, aspect, lemma, lemma_key, wordform, context) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name, verb, aspect, lemma, normalize(lemma).strip() if lemma else None,
+                 record.get('словоформа'), record.get('контекст')))
+            for field, text in ((CONTEXT, record.get('контекст')),
+                                (WORDFORM, record.get('словоформа'))):
+                postings.extend((term, field, cursor.lastrowid, position)
+                                for position, term in enumerate(tokenize(text)))
+        self.connection.executemany(
+            "INSERT INTO postings (term, field, doc_id, position) VALUES (?, ?, ?, ?)", postings)
+        self.connection.execute(
+            "INSERT INTO files (name, mtime_ns, size) VALUES (?, ?, ?)", (name, *state))
+
+    def update(self) -> int:
+        """
+        Re-indexes new, changed and removed data files.
+
+        Returns:
+            int: The number of files that were (re-)indexed or removed.
+        """
+        current = self._data_files()
+        indexed = {name: (mtime, size) for name, mtime, size in
+                   self.connection.execute("SELECT name, mtime_ns, size FROM files")}
+        changed = [name for name, state in current.items() if indexed.get(name) != state]
+        removed = [name for name in indexed if name not in current]
+        if not changed and not removed:
+            return 0
+        store = ContextStore(self.output_dir / STORE_NAME)
+        with self.connection:
+            for name in removed + changed:
+                self._remove_file(name)
+            for name in changed:
+                self._add_file(name, current[name], store)
+        return len(changed) + len(removed)
+
+    def _postings(self, term: str, field: int,
+                  candidates: Optional[Set[int]]) -> Dict[int, Set[int]]:
+        sql = "SELECT doc_id, position FROM postings WHERE term = ? AND field = ?"
+        if candidates is None or len(candidates) > CHUNK_SIZE:
+            rows = self.connection.execute(sql, (term, field))
+        else:
+            rows = self.connection.execute(
+                f"{sql} AND doc_id IN ({', '.join('?' * len(candidates))})",
+                (term, field, *candidates))
+        by_doc: Dict[int, Set[int]] = {}
+        for doc_id, position in rows:
+            if candidates is None or doc_id in candidates:
+                by_doc.setdefault(doc_id, set()).add(position)
+        return by_doc
+
+    def _phrase_docs(self, field: int, tokens: List[str],
+                     candidates: Optional[Set[int]]) -> Set[int]:
+        # Rare terms first, so that frequent ones are only read for few documents.
+        unique = sorted(dict.fromkeys(tokens), key=lambda term: self.connection.execute(
+            "SELECT COUNT(*) FROM postings WHERE term = ? AND field = ?",
+            (term, field)).fetchone()[0])
+        positions: Dict[str, Dict[int, Set[int]]] = {}
+        for term in unique:
+            positions[term] = self._postings(term, field, candidates)
+            candidates = set(positions[term])
+            if not candidates:
+                return set()
+        assert candidates is not None
+        if len(tokens) == 1:
+            return candidates
+        return {doc_id for doc_id in candidates
+                if any(all(start + offset in positions[term][doc_id]
+                           for offset, term in enumerate(tokens))
+                       for start in positions[tokens[0]][doc_id])}
+
+    def search(self, query: str, aspect: Optional[str] = None, lemma: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Finds records matching every term and phrase of the query.
+
+        Args:
+            query (str): The query, see parse_query.
+            aspect (Optional[str]): Only return 'perfective' or 'imperfective' records.
+            lemma (Optional[str]): Only return records with this lemma, ignoring
+                case and 'ё'.
+            limit (Optional[int]): Maximal number of results.
+
+        Returns:
+            List[Dict[str, Any]]: Matching records with their verb ('глагол')
+            and aspect ('вид'), in index order.
+        """
+        candidates: Optional[Set[int]] = None
+        for field, tokens in parse_query(query):
+            candidates = self._phrase_docs(field, tokens, candidates)
+            if not candidates:
+                return []
+        filters, filter_parameters = "", []
+        if aspect is not None:
+            filters += " AND aspect = ?"
+            filter_parameters.append(aspect)
+        if lemma is not None:
+            filters += " AND lemma_key = ?"
+            filter_parameters.append(normalize(lemma).strip())
+        sql = f"SELECT verb, aspect, lemma, wordform, context FROM docs WHERE 1{filters}"
+        return self._fetch_docs(sql, filter_parameters, candidates, limit)
+
+    def _fetch_docs(self, sql: str, parameters: List[Any], candidates: Optional[Set[int]],
+                    limit: Optional[int]) -> List[Dict[str, Any]]:
+        # Candidate ids are passed in chunks to stay below SQLite's variable limit.
+        if candidates is None:
+            chunks: List[List[Any]] = [[]]
+        else:
+            ids = sorted(candidates)
+            chunks = [ids[i:i + CHUNK_SIZE] for i in range(0, len(ids), CHUNK_SIZE)]
+        results: List[Dict[str, Any]] = []
+        for chunk in chunks:
+            chunk_sql = sql
+            if candidates is not None:
+                chunk_sql += f" AND id IN ({', '.join('?' * len(chunk))})"
+            chunk_sql += " ORDER BY id"
+            if limit is not None:
+                chunk_sql += f" LIMIT {int(limit) - len(results)}"
+            results.extend(
+                {'глагол': verb, 'вид': aspect, 'лемма': lemma,
+                 'словоформа': wordform, 'контекст': context}
+                for verb, aspect, lemma, wordform, context
+                in self.connection.execute(chunk_sql, parameters + chunk))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def close(self):
+        """
+        Closes the index database.
+        """
+        self.connection.close()